@@ -0,0 +1,139 @@
+import json
+import multiprocessing as mp
+import os
+import traceback
+import warnings
+from typing import Optional
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+FITNESS_PLOT = 'avg_fitness.svg'
+SPECIES_PLOT = 'speciation.svg'
+NET_DIAGRAM = 'best_genome'  # graphviz adds the .svg
+REPLAY_GIF = 'replay.gif'
+MANIFEST = 'artifacts.json'
+
+
+def render_replay_gif(states, path: str, game_spec, frame_ms: int = 100) -> Optional[str]:
+    """
+    Draw recorded game states (as saved by NEATTrainer.play) off-screen into an animated GIF.
+    Needs Pillow; returns None without it.
+    """
+    if Image is None:
+        warnings.warn("Replay GIFs are not available due to a missing optional dependency (Pillow)")
+        return None
+    if not states:
+        return None
+    # No window: pygame draws into an in-memory surface
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    import pygame
+    from GameObjects.Snake import SnakeGame
+
+    game = SnakeGame(*game_spec[:4])
+    game._ensure_pygame()
+    frames = []
+    for state in states:
+        game.snake.body = [tuple(seg) for seg in state['snake']]
+        game.apples = [tuple(a) for a in state['apples']]
+        game.score = state['score']
+        game._draw()
+        frames.append(Image.frombytes('RGB', game.screen.get_size(),
+                                      pygame.image.tostring(game.screen, 'RGB')))
+    pygame.quit()
+    frames[0].save(path, save_all=True, append_images=frames[1:], duration=frame_ms, loop=0)
+    return path
+
+
+def generate_artifacts(exp_dir: str,
+                       config,
+                       genome,
+                       statistics,
+                       states=None,
+                       game_spec=None,
+                       replay_gif: bool = True,
+                       frame_ms: int = 100,
+                       prune_unused: bool = False) -> dict:
+    """
+    Write the fitness and speciation plots, the best network's diagram and a replay GIF
+    into `exp_dir`. One failing artifact (e.g. no graphviz `dot` binary) does not stop the
+    others; the outcome of each is written to artifacts.json and returned.
+    """
+    import matplotlib.pyplot as plt
+    import visualize
+
+    # Files only; never open a window from here
+    plt.switch_backend('Agg')
+
+    def fitness():
+        path = os.path.join(exp_dir, FITNESS_PLOT)
+        visualize.plot_stats(statistics, filename=path)
+        return path
+
+    def speciation():
+        path = os.path.join(exp_dir, SPECIES_PLOT)
+        visualize.plot_species(statistics, filename=path)
+        return path
+
+    def network():
+        path = os.path.join(exp_dir, NET_DIAGRAM)
+        visualize.draw_net(config, genome, filename=path, prune_unused=prune_unused)
+        return path + '.svg'
+
+    jobs = [('fitness', fitness), ('speciation', speciation), ('network', network)]
+    if replay_gif and states and game_spec is not None:
+        jobs.append(('replay', lambda: render_replay_gif(states, os.path.join(exp_dir, REPLAY_GIF),
+                                                          game_spec, frame_ms)))
+
+    manifest = {}
+    for name, job in jobs:
+        try:
+            manifest[name] = {'path': job()}
+        except Exception as e:
+            manifest[name] = {'error': f'{type(e).__name__}: {e}'}
+            traceback.print_exc()
+        plt.close('all')
+    with open(os.path.join(exp_dir, MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def _run_job(niceness: int, kwargs: dict) -> None:
+    if niceness:
+        try:
+            os.nice(niceness)
+        except (AttributeError, OSError):
+            pass
+    generate_artifacts(**kwargs)
+
+
+class ArtifactJob:
+    """
+    generate_artifacts in a separate, low-priority process.
+
+    The caller continues right away (e.g. with the next experiment); the process is not a
+    daemon, so the interpreter still waits for it before exiting.
+    """
+
+    def __init__(self, exp_dir: str, niceness: int = 10, **kwargs):
+        self.exp_dir = exp_dir
+        # wait() reads the manifest; don't let it find the previous run's
+        if os.path.isfile(os.path.join(exp_dir, MANIFEST)):
+            os.remove(os.path.join(exp_dir, MANIFEST))
+        self.process = mp.Process(target=_run_job, name='neat-artifacts',
+                                  args=(niceness, dict(exp_dir=exp_dir, **kwargs)))
+        self.process.start()
+
+    def done(self) -> bool:
+        return not self.process.is_alive()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[dict]:
+        """Block until the artifacts are written; returns the manifest (None if still running)."""
+        self.process.join(timeout)
+        path = os.path.join(self.exp_dir, MANIFEST)
+        if self.process.is_alive() or not os.path.isfile(path):
+            return None
+        with open(path, 'r') as f:
+            return json.load(f)
@@ -1,7 +1,13 @@
 import graphlib
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Sequence
 from NEATObjects.EvalFunc import FitnessEvaluator
 from NEATObjects.NEAT import NEATTrainer
+from NEATObjects.Islands import IslandModel
+from NEATObjects.SteadyState import SteadyStateEvolution
+from NEATObjects.WarmStart import parse_input_map
+from ExperimentObjects.Artifacts import ArtifactJob, FITNESS_PLOT, NET_DIAGRAM, SPECIES_PLOT
+from ExperimentObjects.Monitor import MonitorReporter, connect
+from ExperimentObjects.ResultStore import ResultStore, canonical_settings, settings_key
 from GameObjects.Snake import SnakeGame
 from neat.checkpoint import Checkpointer
 import graphviz
@@ -19,6 +25,8 @@ import neat
 import json
 import configparser
 import os
+import random
+import warnings
 
 
 from InitialArchitectureObjects.InitalArchitecture import InitialArchitecture
@@ -28,7 +36,9 @@ class Experiment:
         self,
         config_path: str,
         output_dir: str = '.',
-        generations: int = 225
+        generations: int = 225,
+        seed: Optional[int] = None,
+        store_dir: Optional[str] = None
     ):
         self.config_path = config_path
         self.generations = generations
@@ -40,7 +50,10 @@ class Experiment:
 
         # Paths
         self.genome_path = os.path.join(self.exp_dir, 'best_genome.pkl')
+        self.policy_path = os.path.join(self.exp_dir, 'best_policy.npz')
         self.states_path = os.path.join(self.exp_dir, 'game_states.json')
+        self.result_path = os.path.join(self.exp_dir, 'result.json')
+        self.statistics_path = os.path.join(self.exp_dir, 'statistics.json')
 
         # Load config
         parser = configparser.ConfigParser()
@@ -48,6 +61,21 @@ class Experiment:
         if not files:
             raise FileNotFoundError(f"Config file not found: {config_path}")
 
+        # Seed (argument wins over [TRAINING] seed); NEAT draws from the global random module
+        if seed is None and parser.has_option('TRAINING', 'seed'):
+            seed = parser.getint('TRAINING', 'seed')
+        self.seed = seed
+        if seed is not None:
+            random.seed(seed)
+
+        # RESULTS section (optional): content-addressed store of finished runs
+        if store_dir is None:
+            store_dir = parser.get('RESULTS', 'store_dir', fallback='').strip() or None
+        self.store = ResultStore(store_dir) if store_dir else None
+        self.settings = canonical_settings(parser, seed)
+        self.settings_key = settings_key(self.settings)
+        self.resumed_from = 0
+
         # GAME section
         if 'GAME' not in parser:
             raise KeyError("Missing [GAME] section in config file.")
@@ -56,20 +84,28 @@ class Experiment:
         gh = game_cfg.getint('grid_height', fallback=30)
         cs = game_cfg.getint('cell_size', fallback=20)
         gm = game_cfg.getint('game_mode', fallback=1)
+        # 'rays' (8 ray sensors) or 'board' (body/head/apple occupancy of every cell)
+        sm = game_cfg.get('sensor_mode', fallback='rays').strip().lower()
 
         # Instantiate games
-        self.game_train = SnakeGame(gw, gh, cs, gm)
-        self.game_play  = SnakeGame(gw, gh, cs, gm)
+        self.game_train = SnakeGame(gw, gh, cs, gm, sm)
+        self.game_play  = SnakeGame(gw, gh, cs, gm, sm)
 
         # ARCHITECTURE section
         arch_path = parser.get('ARCHITECTURE', 'initial_architecture', fallback='').strip()
         if arch_path:
             self.initial_arch = InitialArchitecture.from_file(arch_path)
         else:
-            # default: one input per cell, 4 outputs, no hidden
-            input_size = gw * gh
+            # default: the game's inputs (3 per cell in board mode), 4 outputs, no hidden
+            input_size = self.game_train.num_inputs
             self.initial_arch = InitialArchitecture(input_size=input_size, output_size=4)
 
+        # Optional warm start from a previously saved genome
+        warm_start_genome = parser.get('ARCHITECTURE', 'warm_start_genome', fallback='').strip()
+        warm_start_jitter = parser.getfloat('ARCHITECTURE', 'warm_start_jitter', fallback=0.1)
+        # 'src:dst, ...' input positions, for warm starts trained on another sensor layout
+        input_map = parser.get('ARCHITECTURE', 'warm_start_input_map', fallback='').strip()
+
         # EVALUATOR section
         if 'EVALUATOR' not in parser:
             raise KeyError("Missing [EVALUATOR] section in config file.")
@@ -78,14 +114,143 @@ class Experiment:
             raise KeyError(f"Unknown evaluator: {eval_name}")
         self.evaluator = EVALUATORS[eval_name]()
 
+        # TRAINING section (optional): evaluation speed-ups
+        cache_size = parser.getint('TRAINING', 'activation_cache_size', fallback=0)
+        cache_decimals = parser.get('TRAINING', 'activation_cache_decimals', fallback='6').strip()
+        racing = parser.getboolean('TRAINING', 'racing', fallback=False)
+        racing_round_steps = parser.getint('TRAINING', 'racing_round_steps', fallback=50)
+        num_workers = parser.getint('TRAINING', 'num_workers', fallback=1)
+        self.steady_state = parser.getboolean('TRAINING', 'steady_state', fallback=False)
+        optimize_networks = parser.getboolean('TRAINING', 'optimize_networks', fallback=False)
+        vectorized_reproduction = parser.getboolean('TRAINING', 'vectorized_reproduction', fallback=False)
+        # Fault tolerance of the worker pool (0 disables each limit)
+        task_timeout = parser.getfloat('TRAINING', 'task_timeout', fallback=0.0)
+        timeout_fitness = parser.getfloat('TRAINING', 'timeout_fitness', fallback=-10.0)
+        max_tasks_per_worker = parser.getint('TRAINING', 'max_tasks_per_worker', fallback=0)
+        max_worker_rss_mb = parser.getfloat('TRAINING', 'max_worker_rss_mb', fallback=0.0)
+
         # Setup NEAT trainer
+        self.trainer_kwargs = dict(
+            initial_arch=self.initial_arch,
+            warm_start_genome=warm_start_genome or None,
+            warm_start_jitter=warm_start_jitter,
+            warm_start_input_map=parse_input_map(input_map) if input_map else None,
+            activation_cache_size=cache_size,
+            activation_cache_decimals=int(cache_decimals) if cache_decimals else None,
+            racing=racing,
+            racing_round_steps=racing_round_steps,
+            num_workers=num_workers,
+            optimize_networks=optimize_networks,
+            task_timeout=task_timeout,
+            timeout_fitness=timeout_fitness,
+            max_tasks_per_worker=max_tasks_per_worker,
+            max_worker_rss_mb=max_worker_rss_mb,
+            vectorized_reproduction=vectorized_reproduction
+        )
+
+        # TRACES section (optional): sample training episodes into a memory-mapped store.
+        # Only the main population is traced; islands run their own trainers.
+        trace_dir = None
+        trace_sample_rate = 0.0
+        if 'TRACES' in parser:
+            trace_dir = os.path.join(self.exp_dir, 'traces')
+            trace_sample_rate = parser.getfloat('TRACES', 'sample_rate', fallback=0.05)
+
         self.trainer = NEATTrainer(
             config_path=self.config_path,
             game_train=self.game_train,
             game_play=self.game_play,
             evaluator=self.evaluator,
-            initial_arch=self.initial_arch
+            trace_dir=trace_dir,
+            trace_sample_rate=trace_sample_rate,
+            # Islands evolve their own populations; the main trainer only plays and reports
+            build_population='ISLANDS' not in parser,
+            **self.trainer_kwargs
+        )
+
+        # CURRICULUM section (optional): grow the training grid as thresholds are hit
+        # With islands, every island runs the curriculum on its own trainer
+        self.curriculum = None
+        self.curriculum_settings = None
+        self.curriculum_path = os.path.join(self.exp_dir, 'curriculum.json')
+        if 'CURRICULUM' in parser:
+            if sm == 'board':
+                raise ValueError("[CURRICULUM] changes the grid size, which board inputs depend on; "
+                                 "use sensor_mode = rays.")
+            cur_cfg = parser['CURRICULUM']
+            sizes = [tuple(int(v) for v in size.strip().lower().split('x'))
+                     for size in cur_cfg.get('grid_sizes').split(',')]
+            steps = [int(v) for v in cur_cfg.get('max_steps', fallback='1000').split(',')]
+            if len(steps) == 1:
+                steps = steps * len(sizes)
+            if len(steps) != len(sizes):
+                raise ValueError("[CURRICULUM] max_steps must have one value or one per grid size.")
+            fit_thr = cur_cfg.get('fitness_threshold', fallback='').strip()
+            score_thr = cur_cfg.get('score_threshold', fallback='').strip()
+            self.curriculum_settings = dict(
+                stages=[(w, h, n) for (w, h), n in zip(sizes, steps)],
+                fitness_threshold=float(fit_thr) if fit_thr else None,
+                score_threshold=int(score_thr) if score_thr else None
+            )
+
+        # ISLANDS section (optional): evolve sub-populations in separate processes
+        self.islands = None
+        if 'ISLANDS' in parser:
+            isl_cfg = parser['ISLANDS']
+            num_islands = isl_cfg.getint('num_islands', fallback=os.cpu_count() or 1)
+            self.islands = IslandModel(
+                config_path=self.config_path,
+                game_spec=(gw, gh, cs, gm, sm),
+                evaluator=self.evaluator,
+                num_islands=num_islands,
+                island_pop_size=isl_cfg.getint('island_pop_size',
+                                               fallback=max(2, self.trainer.config.pop_size // num_islands)),
+                migration_interval=isl_cfg.getint('migration_interval', fallback=10),
+                num_migrants=isl_cfg.getint('num_migrants', fallback=2),
+                trainer_kwargs=self.trainer_kwargs,
+                seed=self.seed,
+                curriculum=self.curriculum_settings
+            )
+
+        if self.curriculum_settings is not None and self.islands is None:
+            self.curriculum = self.trainer.enable_curriculum(**self.curriculum_settings)
+
+        # PROFILING section (optional): profile chosen generations and time the hot spots
+        self.profiler = None
+        if 'PROFILING' in parser:
+            prof_cfg = parser['PROFILING']
+            mode = prof_cfg.get('mode', fallback='off').strip().lower()
+            gens = prof_cfg.get('generations', fallback='all').strip().lower()
+            self.profiler = self.trainer.enable_profiling(
+                os.path.join(self.exp_dir, 'profile'),
+                mode=None if mode == 'off' else mode,
+                generations=None if gens == 'all' else [int(g) for g in gens.split(',')],
+                timers=prof_cfg.getboolean('timers', fallback=True),
+                interval=prof_cfg.getfloat('sample_interval', fallback=0.005)
+            )
+
+        # MONITOR section (optional): live status over a local HTTP endpoint
+        self.monitor = None
+        if 'MONITOR' in parser:
+            mon_cfg = parser['MONITOR']
+            host = mon_cfg.get('host', fallback='127.0.0.1')
+            port = mon_cfg.getint('port', fallback=8765)
+            publish = connect(host, port)
+            if self.islands is not None:
+                # The main population never evolves; every island reports on its own
+                self.islands.monitor = dict(name=cfg_name, url=f'http://{host}:{port}')
+            else:
+                self.monitor = MonitorReporter(cfg_name, publish, self.trainer, total_generations=generations)
+                self.trainer.pop.add_reporter(self.monitor)
+
+        # ARTIFACTS section (optional): plots, net diagram and replay GIF, made in the background
+        self.artifacts_enabled = parser.getboolean('ARTIFACTS', 'enabled', fallback=True)
+        self.artifact_options = dict(
+            replay_gif=parser.getboolean('ARTIFACTS', 'replay_gif', fallback=True),
+            frame_ms=parser.getint('ARTIFACTS', 'gif_frame_ms', fallback=100),
+            prune_unused=parser.getboolean('ARTIFACTS', 'prune_unused', fallback=False)
         )
+        self.artifacts: Optional[ArtifactJob] = None
 
         # Redirect NEAT checkpoints
         reporters = self.trainer.pop.reporters.reporters
@@ -103,8 +268,41 @@ class Experiment:
         self.states: Optional[list] = None
 
     def run(self) -> float:
-        self.best_genome = self.trainer.learn(self.generations)
+        if self.store is not None:
+            stored = self.store.lookup(self.settings_key, self.generations)
+            if stored is not None:
+                return self._use_stored_result(stored)
+            self._resume_from_store()
+
+        if self.islands is not None:
+            self.best_genome, stats = self.islands.run(self.generations)
+            # Merged island statistics stand in for the (unused) main population's
+            self._replace_statistics(stats)
+        elif self.steady_state:
+            # Same evaluation budget as the generational run
+            evolution = SteadyStateEvolution(self.trainer)
+            self.best_genome = evolution.run(self.generations * self.trainer.config.pop_size)
+        else:
+            self.best_genome = self.trainer.learn(self.generations - self.resumed_from)
+        # Stored checkpoints continue from here, not from after the evaluation game below
+        random_state = random.getstate()
+        self.trainer.close()
+        if self.trainer.worker_events:
+            with open(os.path.join(self.exp_dir, 'worker_events.json'), 'w') as f:
+                json.dump(self.trainer.worker_events, f, indent=2)
+        if self.monitor is not None:
+            self.monitor.finish()
+        if self.profiler is not None:
+            self.profiler.finish()
         self.trainer.save_genome(self.best_genome, self.genome_path)
+        self._save_policy()
+        if self.curriculum is not None:
+            with open(self.curriculum_path, 'w') as f:
+                json.dump(self.curriculum.finish(), f, indent=2)
+        elif self.islands is not None and self.curriculum_settings is not None:
+            with open(self.curriculum_path, 'w') as f:
+                json.dump([{'island': r['index'], 'stages': r['curriculum']}
+                           for r in self.islands.island_results], f, indent=2)
         self.score = self.trainer.play(
             self.best_genome,
             render=False,
@@ -113,9 +311,95 @@ class Experiment:
         with open(self.states_path, 'r') as f:
             self.states = json.load(f)
 
-        self.visualize_training(view=True)
+        self._write_results(cached=False)
+        if self.store is not None:
+            generational = self.islands is None and not self.steady_state
+            self.store.save(self.settings_key, self.settings, self.generations, self.best_genome,
+                            self.score, self._statistics(), states_path=self.states_path,
+                            population=self.trainer.pop if generational else None,
+                            random_state=random_state,
+                            extra={'seed': self.seed, 'resumed_from': self.resumed_from})
+
+        self.start_artifacts()
         return self.score
 
+    def _use_stored_result(self, stored: dict) -> float:
+        print(f"Result store: reusing {stored['path']}")
+        self.trainer.close()
+        if self.monitor is not None:
+            self.monitor.finish()
+        self.best_genome = stored['best_genome']
+        self.score = stored['score']
+        self._replace_statistics(stored['statistics'])
+        self.trainer.save_genome(self.best_genome, self.genome_path)
+        self._save_policy()
+        stored_states = os.path.join(stored['path'], 'game_states.json')
+        if os.path.isfile(stored_states):
+            with open(stored_states, 'r') as f:
+                self.states = json.load(f)
+            with open(self.states_path, 'w') as f:
+                json.dump(self.states, f)
+        self._write_results(cached=True)
+        self.start_artifacts()
+        return self.score
+
+    def _save_policy(self) -> None:
+        # The genome is saved already; a network the policy format can't hold
+        # (e.g. a custom activation) must not cost the whole run
+        try:
+            self.trainer.save_policy(self.best_genome, self.policy_path)
+        except ValueError as e:
+            warnings.warn(f"Policy export skipped: {e}")
+
+    def _resume_from_store(self) -> None:
+        # Curriculum stage and island/steady-state state are not part of a NEAT checkpoint
+        if self.curriculum is not None or self.islands is not None or self.steady_state:
+            return
+        prefix = self.store.find_prefix(self.settings_key, self.generations)
+        if prefix is None:
+            return
+        done, path = prefix
+        stored = self.store.lookup(self.settings_key, done)
+        print(f'Result store: resuming from generation {done} in {path}')
+        self.trainer.resume(ResultStore.restore(path), best_genome=stored['best_genome'])
+        stats = self._statistics()
+        stats.most_fit_genomes = list(stored['statistics'].most_fit_genomes)
+        stats.generation_statistics = list(stored['statistics'].generation_statistics)
+        if self.monitor is not None:
+            self.monitor.total_generations = self.generations - done
+        self.resumed_from = done
+
+    def _statistics(self) -> neat.StatisticsReporter:
+        return next(r for r in self.trainer.pop.reporters.reporters
+                    if isinstance(r, neat.StatisticsReporter))
+
+    def _replace_statistics(self, stats: neat.StatisticsReporter) -> None:
+        reporters = self.trainer.pop.reporters.reporters
+        for r in [r for r in reporters if isinstance(r, neat.StatisticsReporter)]:
+            reporters.remove(r)
+        self.trainer.pop.add_reporter(stats)
+
+    def _write_results(self, cached: bool) -> None:
+        stats = self._statistics()
+        with open(self.result_path, 'w') as f:
+            json.dump({
+                'config': self.config_path,
+                'key': self.settings_key,
+                'seed': self.seed,
+                'generations': self.generations,
+                'score': self.score,
+                'best_fitness': self.best_genome.fitness,
+                'cached': cached,
+                'resumed_from': self.resumed_from
+            }, f, indent=2)
+        with open(self.statistics_path, 'w') as f:
+            json.dump({
+                'best_fitness': [g.fitness for g in stats.most_fit_genomes],
+                'mean_fitness': stats.get_fitness_mean(),
+                'stdev_fitness': stats.get_fitness_stdev(),
+                'species_sizes': stats.get_species_sizes()
+            }, f)
+
     def load_results(self) -> float:
         self.best_genome = self.trainer.load_genome(self.genome_path)
         with open(self.states_path, 'r') as f:
@@ -143,16 +427,28 @@ class Experiment:
 
         return score
     
-    def get_genome_stats(self, max_steps: int = 100, render: bool = False) -> List[Tuple[neat.DefaultGenome, int, float]]:
+    def get_genome_stats(self,
+                         max_steps: int = 100,
+                         render: bool = False,
+                         seeds: Sequence[int] = (0,),
+                         num_workers: Optional[int] = None) -> List[Tuple[neat.DefaultGenome, int, float]]:
+        genomes = list(self.trainer.pop.population.values())
+
+        if render:
+            scores = [
+                sum(self.trainer.play(genome, max_steps=max_steps, render=True,
+                                      states_path=None, seed=seed)
+                    for seed in seeds) / len(seeds)
+                for genome in genomes
+            ]
+        else:
+            # Every genome plays the same seeded games, so scores are comparable
+            scores = self.trainer.score_genomes(genomes, max_steps=max_steps,
+                                                seeds=seeds, num_workers=num_workers)
+
         stats: List[Tuple[neat.DefaultGenome, int, float]] = []
-        for genome in self.trainer.pop.population.values():
+        for genome, score in zip(genomes, scores):
             fit = genome.fitness if genome.fitness is not None else float('-inf')
-            score = self.trainer.play(
-                genome,
-                max_steps=max_steps,
-                render=render,
-                states_path=None
-            )
             stats.append((genome, score, fit))
 
         stats.sort(key=lambda t: t[2], reverse=True)
@@ -195,20 +491,38 @@ class Experiment:
         dot.render(outpath, view=view)
         return outpath + '.png'
     
+    def start_artifacts(self) -> Optional[ArtifactJob]:
+        """Write plots, net diagram and replay GIF into exp_dir from a low-priority background process."""
+        if not self.artifacts_enabled:
+            return None
+        self.artifacts = ArtifactJob(
+            self.exp_dir,
+            config=self.trainer.config,
+            genome=self.best_genome,
+            statistics=self._statistics(),
+            states=self.states,
+            # The replay was recorded on the play game; training may have been on a resized grid
+            game_spec=self.trainer.game_spec(self.game_play),
+            **self.artifact_options
+        )
+        return self.artifacts
+
     def visualize_training(self,
                            view: bool = True,
                            ylog: bool = False,
                            prune_unused: bool = False):
+        # In-process and optionally on screen; run() uses start_artifacts instead
+        stats = self._statistics()
 
-        stats = next(r for r in self.trainer.pop.reporters.reporters
-                     if isinstance(r, neat.StatisticsReporter))
-
-        visualize.plot_stats(stats, ylog=ylog, view=view)
-        visualize.plot_species(stats, view=view)
+        visualize.plot_stats(stats, ylog=ylog, view=view,
+                             filename=os.path.join(self.exp_dir, FITNESS_PLOT))
+        visualize.plot_species(stats, view=view,
+                               filename=os.path.join(self.exp_dir, SPECIES_PLOT))
 
         visualize.draw_net(self.trainer.config,
                            self.best_genome,
                            view=view,
+                           filename=os.path.join(self.exp_dir, NET_DIAGRAM),
                            prune_unused=prune_unused)
 
 
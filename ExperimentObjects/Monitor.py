@@ -0,0 +1,323 @@
+import asyncio
+import json
+import queue
+import threading
+import time
+import urllib.parse
+import urllib.request
+from typing import Callable, Dict, List, Optional
+
+from neat.reporting import BaseReporter
+
+STATUS_PATH = '/status'
+PUBLISH_PATH = '/publish/'
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>NEAT experiments</title>
+<style>
+body { font-family: sans-serif; margin: 2em; }
+table { border-collapse: collapse; }
+th, td { border: 1px solid #ccc; padding: 4px 10px; text-align: right; }
+th:first-child, td:first-child { text-align: left; }
+</style>
+</head>
+<body>
+<h2>NEAT experiments</h2>
+<table>
+<thead><tr>
+<th>experiment</th><th>state</th><th>generation</th><th>best fitness</th><th>mean fitness</th>
+<th>species</th><th>steps/sec</th><th>ETA</th><th>updated</th>
+</tr></thead>
+<tbody id="rows"></tbody>
+</table>
+<script>
+// Names and states come from any local process that POSTs to /publish: text only, never markup
+function fmt(v, digits) { return typeof v === 'number' ? v.toFixed(digits) : ''; }
+function eta(sec) {
+  if (typeof sec !== 'number') return '';
+  const h = Math.floor(sec / 3600), m = Math.floor(sec % 3600 / 60), s = Math.floor(sec % 60);
+  return (h ? h + 'h ' : '') + (h || m ? m + 'm ' : '') + s + 's';
+}
+function row(cells) {
+  const tr = document.createElement('tr');
+  for (const text of cells) {
+    const td = document.createElement('td');
+    td.textContent = String(text);
+    tr.appendChild(td);
+  }
+  return tr;
+}
+async function refresh() {
+  try {
+    const status = await (await fetch('/status')).json();
+    const now = Date.now() / 1000;
+    document.getElementById('rows').replaceChildren(...Object.keys(status).sort().map(name => {
+      const s = status[name];
+      return row([
+        name, s.state ?? '',
+        (s.generation ?? '') + (s.total_generations ? ' / ' + s.total_generations : ''),
+        fmt(s.best_fitness, 3), fmt(s.mean_fitness, 3), s.species ?? '',
+        fmt(s.steps_per_sec, 0), eta(s.eta_sec),
+        typeof s.updated === 'number' ? Math.round(now - s.updated) + 's ago' : ''
+      ]);
+    }));
+  } catch (e) {}
+}
+refresh();
+setInterval(refresh, 2000);
+</script>
+</body>
+</html>
+"""
+
+
+class MonitorServer:
+    """
+    Local asyncio HTTP server holding the latest status of every experiment that reports to it.
+
+    GET / serves an auto-refreshing page, GET /status the JSON behind it, and
+    POST /publish/<experiment> lets experiments in other processes push their status (a JSON
+    object). The event loop runs in a daemon thread; `publish` only schedules the update on it.
+    Port 0 picks a free port, available as `port` once started.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8765):
+        self.host = host
+        self.port = port
+        self.status: Dict[str, dict] = {}
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> 'MonitorServer':
+        """Bind and start serving; raises OSError when the port is already taken."""
+        ready = threading.Event()
+        errors: List[BaseException] = []
+
+        def serve() -> None:
+            self.loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self.loop)
+            try:
+                self._server = self.loop.run_until_complete(
+                    asyncio.start_server(self._handle, self.host, self.port))
+            except OSError as e:
+                errors.append(e)
+                ready.set()
+                self.loop.close()
+                return
+            self.port = self._server.sockets[0].getsockname()[1]
+            ready.set()
+            self.loop.run_forever()
+            self._server.close()
+            self.loop.run_until_complete(self._server.wait_closed())
+            self.loop.close()
+
+        self._thread = threading.Thread(target=serve, name='neat-monitor', daemon=True)
+        self._thread.start()
+        ready.wait()
+        if errors:
+            raise errors[0]
+        print(f'Monitor: serving on http://{self.host}:{self.port}/')
+        return self
+
+    def publish(self, name: str, status: dict) -> None:
+        self.loop.call_soon_threadsafe(self.status.__setitem__, name, status)
+
+    def stop(self) -> None:
+        if self.loop is not None and self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = (await reader.readline()).decode('latin-1').split()
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode('latin-1').strip()
+                if not line:
+                    break
+                key, _, value = line.partition(':')
+                headers[key.strip().lower()] = value.strip()
+            if len(request) < 2:
+                return
+            method, path = request[0], request[1].split('?')[0]
+
+            if method == 'GET' and path == '/':
+                self._respond(writer, 200, 'text/html; charset=utf-8', PAGE.encode())
+            elif method == 'GET' and path == STATUS_PATH:
+                self._respond(writer, 200, 'application/json', json.dumps(self.status).encode())
+            elif method == 'POST' and path.startswith(PUBLISH_PATH):
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+                status = json.loads(body)
+                if isinstance(status, dict):
+                    self.status[urllib.parse.unquote(path[len(PUBLISH_PATH):])] = status
+                    self._respond(writer, 204, 'text/plain', b'')
+                else:
+                    self._respond(writer, 400, 'text/plain', b'status must be a JSON object')
+            else:
+                self._respond(writer, 404, 'text/plain', b'not found')
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _respond(writer: asyncio.StreamWriter, code: int, content_type: str, body: bytes) -> None:
+        reason = {200: 'OK', 204: 'No Content', 400: 'Bad Request', 404: 'Not Found'}[code]
+        writer.write(f'HTTP/1.1 {code} {reason}\r\n'
+                     f'Content-Type: {content_type}\r\n'
+                     f'Content-Length: {len(body)}\r\n'
+                     f'Cache-Control: no-store\r\n'
+                     f'Connection: close\r\n\r\n'.encode('latin-1') + body)
+
+
+class HttpPublisher:
+    """
+    Pushes status updates to a MonitorServer in another process from a background thread.
+
+    Updates are queued and sent in order; when the queue is full (server gone or slow)
+    new updates are dropped rather than holding up training.
+    """
+
+    def __init__(self, url: str, max_pending: int = 64, timeout: float = 2.0):
+        self.url = url.rstrip('/')
+        self.timeout = timeout
+        self.queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        threading.Thread(target=self._send_loop, name='neat-monitor-publisher', daemon=True).start()
+
+    def __call__(self, name: str, status: dict) -> None:
+        try:
+            self.queue.put_nowait((name, status))
+        except queue.Full:
+            pass
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Wait (at most `timeout` seconds) until the queued updates are sent; before exiting a process."""
+        deadline = time.monotonic() + timeout
+        while self.queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def _send_loop(self) -> None:
+        while True:
+            name, status = self.queue.get()
+            request = urllib.request.Request(self.url + PUBLISH_PATH + urllib.parse.quote(name),
+                                             data=json.dumps(status).encode(),
+                                             headers={'Content-Type': 'application/json'},
+                                             method='POST')
+            try:
+                urllib.request.urlopen(request, timeout=self.timeout).close()
+            except OSError:
+                pass
+            finally:
+                self.queue.task_done()
+
+
+_servers: Dict[tuple, MonitorServer] = {}
+
+
+def connect(host: str = '127.0.0.1', port: int = 8765) -> Callable[[str, dict], None]:
+    """
+    Publish function for the monitor at host:port.
+
+    The first experiment to ask starts the server in its process; experiments in the same
+    process share it, and those in other processes (the port is taken) push to it over HTTP.
+    """
+    key = (host, port)
+    if key not in _servers:
+        try:
+            _servers[key] = MonitorServer(host, port).start()
+        except OSError:
+            return HttpPublisher(f'http://{host}:{port}')
+    return _servers[key].publish
+
+
+class MonitorReporter(BaseReporter):
+    """
+    Publishes generation, best/mean fitness, species count, evaluation throughput and ETA.
+
+    Attach to the population that actually evolves (`NEATTrainer.pop`, or each island's);
+    `publish(name, status)` must not block (MonitorServer.publish and HttpPublisher both
+    return immediately).
+    """
+
+    def __init__(self,
+                 name: str,
+                 publish: Callable[[str, dict], None],
+                 trainer,
+                 total_generations: Optional[int] = None):
+        self.name = name
+        self.publish = publish
+        self.trainer = trainer
+        self.total_generations = total_generations
+        self.generation_times: List[float] = []
+        self.status = {
+            'state': 'starting',
+            'generation': 0,
+            'total_generations': total_generations,
+            'best_fitness': None,
+            'mean_fitness': None,
+            'species': 0,
+            'steps_per_sec': None,
+            'eta_sec': None,
+            'updated': time.time()
+        }
+        self.first_generation: Optional[int] = None
+        self.generation_start = time.perf_counter()
+        self.generation_steps = 0
+        self._push()
+
+    def __getstate__(self):
+        # Checkpoints pickle the reporter set; the server link and trainer stay behind
+        state = dict(self.__dict__)
+        state.update(trainer=None, publish=None)
+        return state
+
+    def start_generation(self, generation):
+        if self.first_generation is None:
+            self.first_generation = generation
+        self.status.update(state='running', generation=generation)
+        self.generation_start = time.perf_counter()
+        self.generation_steps = self.trainer.steps_evaluated
+
+    def post_evaluate(self, config, population, species, best_genome):
+        fitnesses = [g.fitness for g in population.values() if g.fitness is not None]
+        elapsed = time.perf_counter() - self.generation_start
+        steps = self.trainer.steps_evaluated - self.generation_steps
+        self.status.update(
+            best_fitness=best_genome.fitness,
+            mean_fitness=sum(fitnesses) / len(fitnesses) if fitnesses else None,
+            steps_per_sec=steps / elapsed if elapsed > 0 else None
+        )
+        self._push()
+
+    def end_generation(self, config, population, species_set):
+        self.generation_times.append(time.perf_counter() - self.generation_start)
+        eta = None
+        if self.total_generations is not None:
+            done = self.status['generation'] - self.first_generation + 1
+            mean_time = sum(self.generation_times) / len(self.generation_times)
+            eta = max(0, self.total_generations - done) * mean_time
+        self.status.update(species=len(species_set.species), eta_sec=eta)
+        self._push()
+
+    def found_solution(self, config, generation, best):
+        self.status.update(state='solved')
+        self._push()
+
+    def complete_extinction(self):
+        self.status.update(state='extinct')
+        self._push()
+
+    def finish(self) -> None:
+        """Mark the experiment as done; call once training has returned."""
+        self.status.update(state='finished', eta_sec=0)
+        self._push()
+
+    def _push(self) -> None:
+        self.status['updated'] = time.time()
+        # Hand over a copy: the server's loop thread reads it later
+        self.publish(self.name, dict(self.status))
@@ -0,0 +1,160 @@
+import configparser
+import hashlib
+import json
+import os
+import pickle
+import random
+import shutil
+from typing import Optional, Tuple
+
+from neat.checkpoint import Checkpointer
+
+# Sections that only observe or speed up a run without changing its outcome
+IGNORED_SECTIONS = {'MONITOR', 'PROFILING', 'TRACES', 'RESULTS', 'ARTIFACTS'}
+
+# [ARCHITECTURE] keys naming files whose contents, not paths, define the run
+FILE_KEYS = {('ARCHITECTURE', 'initial_architecture'), ('ARCHITECTURE', 'warm_start_genome')}
+
+GENOME_FILENAME = 'best_genome.pkl'
+RESULT_FILENAME = 'result.json'
+STATS_FILENAME = 'statistics.pkl'
+STATES_FILENAME = 'game_states.json'
+CHECKPOINT_FILENAME = 'checkpoint'
+
+
+def _canonical_value(value: str):
+    value = ' '.join(value.split())
+    # generate_configs.py writes str(float), hand-written configs often don't
+    try:
+        return repr(float(value))
+    except ValueError:
+        return value.lower() if value.lower() in ('true', 'false', 'yes', 'no', 'on', 'off') else value
+
+
+def _file_digest(path: str) -> Optional[str]:
+    if not path:
+        return None
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def canonical_settings(parser: configparser.ConfigParser, seed: Optional[int]) -> dict:
+    """
+    Effective settings of an experiment, independent of file name, key order, whitespace
+    and number formatting; referenced files are replaced by the hash of their contents.
+    """
+    settings = {}
+    for section in sorted(parser.sections()):
+        if section in IGNORED_SECTIONS:
+            continue
+        values = {}
+        for key, value in sorted(parser[section].items()):
+            if (section, key) in FILE_KEYS:
+                values[key] = _file_digest(value.strip())
+            else:
+                values[key] = _canonical_value(value)
+        settings[section] = values
+    settings['seed'] = seed
+    return settings
+
+
+def settings_key(settings: dict) -> str:
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()
+
+
+class ResultStore:
+    """
+    Content-addressed store of finished runs.
+
+    Runs are filed under the hash of their effective settings and then by generation count:
+    <root>/<key>/settings.json and <root>/<key>/<generations>/{best_genome.pkl, result.json,
+    statistics.pkl, game_states.json, checkpoint}. The checkpoint holds the population after
+    the last generation, so a longer run with the same settings can pick up from it.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def entry_dir(self, key: str, generations: int) -> str:
+        return os.path.join(self.root, key, str(generations))
+
+    def lookup(self, key: str, generations: int) -> Optional[dict]:
+        """Stored result of exactly this run, or None."""
+        path = self.entry_dir(key, generations)
+        if not os.path.isfile(os.path.join(path, RESULT_FILENAME)):
+            return None
+        with open(os.path.join(path, RESULT_FILENAME), 'r') as f:
+            result = json.load(f)
+        with open(os.path.join(path, GENOME_FILENAME), 'rb') as f:
+            result['best_genome'] = pickle.load(f)
+        with open(os.path.join(path, STATS_FILENAME), 'rb') as f:
+            result['statistics'] = pickle.load(f)
+        result['path'] = path
+        return result
+
+    def find_prefix(self, key: str, generations: int) -> Optional[Tuple[int, str]]:
+        """Longest stored run with the same settings and fewer generations that can be resumed."""
+        folder = os.path.join(self.root, key)
+        if not os.path.isdir(folder):
+            return None
+        done = [int(name) for name in os.listdir(folder)
+                if name.isdigit() and int(name) < generations
+                and os.path.isfile(os.path.join(folder, name, CHECKPOINT_FILENAME))]
+        if not done:
+            return None
+        best = max(done)
+        return best, self.entry_dir(key, best)
+
+    def save(self,
+             key: str,
+             settings: dict,
+             generations: int,
+             best_genome,
+             score: float,
+             statistics,
+             states_path: Optional[str] = None,
+             population=None,
+             random_state=None,
+             extra: Optional[dict] = None) -> str:
+        """
+        File a finished run. `population` (a neat.Population that ran all `generations`)
+        is checkpointed so longer runs can resume from it; pass the global `random_state`
+        taken right after training when anything has drawn random numbers since.
+        """
+        folder = os.path.join(self.root, key)
+        os.makedirs(folder, exist_ok=True)
+        with open(os.path.join(folder, 'settings.json'), 'w') as f:
+            json.dump(settings, f, indent=2, sort_keys=True)
+
+        # Write into a scratch folder and move it in place, so readers never see half an entry
+        path = self.entry_dir(key, generations)
+        tmp = path + '.tmp'
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        with open(os.path.join(tmp, GENOME_FILENAME), 'wb') as f:
+            pickle.dump(best_genome, f)
+        with open(os.path.join(tmp, STATS_FILENAME), 'wb') as f:
+            pickle.dump(statistics, f)
+        if states_path is not None and os.path.isfile(states_path):
+            shutil.copyfile(states_path, os.path.join(tmp, STATES_FILENAME))
+        if population is not None and population.generation == generations:
+            # save_checkpoint appends the generation number to its prefix
+            prefix = os.path.join(tmp, CHECKPOINT_FILENAME + '-')
+            current_state = random.getstate()
+            if random_state is not None:
+                random.setstate(random_state)
+            Checkpointer(filename_prefix=prefix).save_checkpoint(
+                population.config, population.population, population.species, population.generation)
+            random.setstate(current_state)
+            os.replace(f'{prefix}{population.generation}', os.path.join(tmp, CHECKPOINT_FILENAME))
+        with open(os.path.join(tmp, RESULT_FILENAME), 'w') as f:
+            json.dump(dict(key=key, generations=generations, score=score,
+                           best_fitness=best_genome.fitness, **(extra or {})), f, indent=2)
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp, path)
+        return path
+
+    @staticmethod
+    def restore(path: str):
+        """Population saved with an entry (random state included), ready to continue."""
+        return Checkpointer.restore_checkpoint(os.path.join(path, CHECKPOINT_FILENAME))
@@ -0,0 +1,167 @@
+import configparser
+import hashlib
+import json
+import os
+import pickle
+from multiprocessing import Pool
+from typing import List, Optional, Sequence
+
+import neat
+import numpy as np
+from neat.nn import FeedForwardNetwork
+
+from ExperimentObjects.Experiment import EVALUATORS
+from GameObjects.Snake import SnakeGame
+from NEATObjects.NEAT import match_inputs, run_episode
+
+GENOME_FILENAME = 'best_genome.pkl'
+RESULT_FILENAME = 'result.json'
+CACHE_FILENAME = 'tournament_cache.json'
+LEADERBOARD_FILENAME = 'leaderboard.json'
+
+
+class Tournament:
+    """
+    Re-evaluates every best_genome.pkl under `results_dir` on one fixed bank of seeded games.
+
+    Each genome is played with the config its run recorded in result.json; older runs without
+    one fall back to `<configs_dir>/<folder>.ini`, like replay_runner.py. Games are played
+    exactly as NEATTrainer.play does (reference FeedForwardNetwork, same episode loop), so
+    tournament scores are comparable with the scores runs recorded. Per-game results are
+    cached by a hash of the genome, config and seed bank, so a re-run only plays genomes that
+    are new or changed.
+    """
+
+    def __init__(self,
+                 results_dir: str,
+                 configs_dir: str = 'Configs',
+                 seeds: Sequence[int] = tuple(range(100)),
+                 max_steps: int = 1000,
+                 num_workers: Optional[int] = None):
+        self.results_dir = results_dir
+        self.configs_dir = configs_dir
+        self.seeds = tuple(seeds)
+        self.max_steps = max_steps
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.cache_path = os.path.join(results_dir, CACHE_FILENAME)
+
+    def find_entries(self) -> List[dict]:
+        entries = []
+        for root, _, files in os.walk(self.results_dir):
+            if GENOME_FILENAME not in files:
+                continue
+            name = os.path.basename(root)
+            config_path = self._config_for(root)
+            if config_path is None:
+                print(f'Skipping {name}: no config in {RESULT_FILENAME} or {self.configs_dir}')
+                continue
+            entries.append({
+                'name': name,
+                'genome_path': os.path.join(root, GENOME_FILENAME),
+                'config_path': config_path
+            })
+        return sorted(entries, key=lambda e: e['name'])
+
+    def _config_for(self, folder: str) -> Optional[str]:
+        result_path = os.path.join(folder, RESULT_FILENAME)
+        if os.path.isfile(result_path):
+            with open(result_path, 'r') as f:
+                recorded = json.load(f).get('config')
+            if recorded:
+                # Stored as given to Experiment: absolute, or relative to where the sweep ran
+                for candidate in (recorded, os.path.join(folder, recorded)):
+                    if os.path.isfile(candidate):
+                        return candidate
+        named = os.path.join(self.configs_dir, os.path.basename(folder) + '.ini')
+        return named if os.path.isfile(named) else None
+
+    def run(self) -> List[dict]:
+        cache = self._load_cache()
+        entries = self.find_entries()
+        for entry in entries:
+            entry['hash'] = self._entry_hash(entry)
+
+        todo = [e for e in entries if e['hash'] not in cache]
+        print(f'Tournament: {len(entries)} genomes, {len(todo)} to evaluate '
+              f'on {len(self.seeds)} seeds')
+        tasks = [(e['genome_path'], e['config_path'], self.seeds, self.max_steps) for e in todo]
+        if self.num_workers > 1 and len(tasks) > 1:
+            with Pool(self.num_workers) as pool:
+                results = pool.map(_play_seed_bank, tasks, chunksize=1)
+        else:
+            results = [_play_seed_bank(t) for t in tasks]
+        for entry, games in zip(todo, results):
+            cache[entry['hash']] = games
+        self._save_cache(cache)
+
+        leaderboard = [dict(name=e['name'], genome_path=e['genome_path'], **_summarize(cache[e['hash']]))
+                       for e in entries]
+        leaderboard.sort(key=lambda row: row['score_mean'], reverse=True)
+        with open(os.path.join(self.results_dir, LEADERBOARD_FILENAME), 'w') as f:
+            json.dump(leaderboard, f, indent=2)
+        return leaderboard
+
+    def _entry_hash(self, entry: dict) -> str:
+        h = hashlib.sha256()
+        for path in (entry['genome_path'], entry['config_path']):
+            with open(path, 'rb') as f:
+                h.update(f.read())
+        h.update(json.dumps([self.seeds, self.max_steps]).encode())
+        return h.hexdigest()
+
+    def _load_cache(self) -> dict:
+        if os.path.isfile(self.cache_path):
+            with open(self.cache_path, 'r') as f:
+                return json.load(f)
+        return {}
+
+    def _save_cache(self, cache: dict) -> None:
+        tmp = self.cache_path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp, self.cache_path)
+
+
+def _play_seed_bank(task) -> List[List[float]]:
+    """Play one genome on every seed; returns [score, apples, steps] per game."""
+    genome_path, config_path, seeds, max_steps = task
+    config = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                         neat.DefaultSpeciesSet, neat.DefaultStagnation, config_path)
+    parser = configparser.ConfigParser()
+    parser.read(config_path)
+    game = SnakeGame(parser.getint('GAME', 'grid_width', fallback=30),
+                     parser.getint('GAME', 'grid_height', fallback=30),
+                     parser.getint('GAME', 'cell_size', fallback=20),
+                     parser.getint('GAME', 'game_mode', fallback=1),
+                     parser.get('GAME', 'sensor_mode', fallback='rays').strip())
+    match_inputs(config, game)
+    evaluator = EVALUATORS[parser.get('EVALUATOR', 'name', fallback='balanced')]()
+
+    with open(genome_path, 'rb') as f:
+        genome = pickle.load(f)
+    # The reference network, as NEATTrainer.play builds it by default
+    net = FeedForwardNetwork.create(genome, config)
+
+    games = []
+    for seed in seeds:
+        game.seed(seed)
+        game.reset()
+        steps, _ = run_episode(net, game, max_steps)
+        games.append([evaluator.evaluate(game.score, steps), game.score, steps])
+    return games
+
+
+def _summarize(games: List[List[float]]) -> dict:
+    arr = np.asarray(games, dtype=float)
+    summary = {'games': len(games)}
+    for col, label in ((0, 'score'), (1, 'apples'), (2, 'steps')):
+        values = arr[:, col]
+        q10, q50, q90 = np.quantile(values, [0.1, 0.5, 0.9])
+        summary.update({
+            f'{label}_mean': float(values.mean()),
+            f'{label}_var': float(values.var()),
+            f'{label}_p10': float(q10),
+            f'{label}_p50': float(q50),
+            f'{label}_p90': float(q90)
+        })
+    return summary
@@ -0,0 +1,322 @@
+import configparser
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import warnings
+from typing import Dict, List, Optional, Sequence
+
+from ExperimentObjects.Experiment import EVALUATORS
+from ExperimentObjects.ResultStore import _canonical_value
+
+RESULT_FILENAME = 'result.json'
+STATISTICS_FILENAME = 'statistics.json'
+ARTIFACTS_FILENAME = 'artifacts.json'
+STATES_FILENAME = 'game_states.json'
+
+# Files kept in the experiment folder that are indexed as artifacts when present
+ARTIFACT_FILES = ('best_genome.pkl', 'best_policy.npz', STATES_FILENAME, 'worker_events.json',
+                  'curriculum.json', 'traces', 'profile')
+
+# Columns of `experiments` that compare() can aggregate
+METRICS = ('score', 'best_fitness', 'final_mean_fitness', 'final_species', 'generations')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS experiments (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    name TEXT NOT NULL,
+    config_path TEXT,
+    settings_key TEXT,
+    seed INTEGER,
+    generations INTEGER,
+    score REAL,
+    best_fitness REAL,
+    final_mean_fitness REAL,
+    final_species INTEGER,
+    cached INTEGER,
+    resumed_from INTEGER,
+    indexed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS params (
+    experiment_id INTEGER NOT NULL REFERENCES experiments(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value TEXT,
+    num REAL,
+    PRIMARY KEY (experiment_id, name)
+);
+CREATE INDEX IF NOT EXISTS params_by_name ON params(name, value, experiment_id);
+CREATE TABLE IF NOT EXISTS generations (
+    experiment_id INTEGER NOT NULL REFERENCES experiments(id) ON DELETE CASCADE,
+    generation INTEGER NOT NULL,
+    best_fitness REAL,
+    mean_fitness REAL,
+    stdev_fitness REAL,
+    species INTEGER,
+    PRIMARY KEY (experiment_id, generation)
+);
+CREATE TABLE IF NOT EXISTS artifacts (
+    experiment_id INTEGER NOT NULL REFERENCES experiments(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    path TEXT NOT NULL,
+    PRIMARY KEY (experiment_id, name)
+);
+CREATE TABLE IF NOT EXISTS files (
+    experiment_id INTEGER NOT NULL REFERENCES experiments(id) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    PRIMARY KEY (experiment_id, path)
+);
+"""
+
+
+def _sha256(path: str) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _legacy_score(states: list, config_path: Optional[str]) -> Optional[float]:
+    """Score of a recorded best game as Experiment.load_results computes it; None without a config."""
+    if config_path is None:
+        return None
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.read(config_path)
+    if 'EVALUATOR' not in parser:
+        return None
+    name = parser.get('EVALUATOR', 'name', fallback='balanced')
+    if name not in EVALUATORS:
+        raise ValueError(f"Unknown evaluator '{name}' in {config_path}")
+    apples = states[-1].get('score', 0) if states else 0
+    return EVALUATORS[name]().evaluate(apples, len(states))
+
+
+def _number(value: str) -> Optional[float]:
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class Warehouse:
+    """
+    SQLite index of finished experiments for fast cross-run comparisons.
+
+    One row per experiment folder (anything holding a result.json, or a game_states.json from
+    before result.json existed) with its final numbers, every config parameter as
+    'SECTION.key', the per-generation statistics and the paths of its artifacts. Re-indexing
+    only re-reads experiments whose files changed: mtime and size first, then content hash.
+    """
+
+    def __init__(self, db_path: str, config_dirs: Sequence[str] = ()):
+        self.db_path = db_path
+        # Where to look for <experiment>.ini when result.json names no readable config
+        self.config_dirs = list(config_dirs)
+        self.db = sqlite3.connect(db_path)
+        self.db.execute('PRAGMA foreign_keys = ON')
+        self.db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.db.close()
+
+    # ---- indexing ---------------------------------------------------------------------
+
+    @staticmethod
+    def find_experiments(root: str) -> List[str]:
+        found = []
+        for folder, dirs, files in os.walk(root):
+            if RESULT_FILENAME in files or STATES_FILENAME in files:
+                found.append(os.path.abspath(folder))
+                # Traces and profiles below an experiment are not experiments
+                dirs[:] = []
+        return sorted(found)
+
+    def index(self, roots: Sequence[str], prune: bool = False) -> Dict[str, int]:
+        """Bring the database up to date with every experiment under `roots`; returns counts."""
+        counts = {'added': 0, 'updated': 0, 'unchanged': 0, 'removed': 0, 'failed': 0}
+        seen = set()
+        # One transaction for the whole pass; the savepoints below would otherwise each commit
+        if not self.db.in_transaction:
+            self.db.execute('BEGIN')
+        for root in roots:
+            for folder in self.find_experiments(root):
+                seen.add(folder)
+                # A half-written or corrupt run must not cost the rows already indexed for it
+                self.db.execute('SAVEPOINT experiment')
+                try:
+                    counts[self._index_experiment(folder)] += 1
+                except (OSError, ValueError, KeyError, TypeError, IndexError, configparser.Error) as e:
+                    self.db.execute('ROLLBACK TO experiment')
+                    warnings.warn(f"Skipping {folder}: {type(e).__name__}: {e}")
+                    counts['failed'] += 1
+                self.db.execute('RELEASE experiment')
+        if prune:
+            for exp_id, path in self.db.execute('SELECT id, path FROM experiments').fetchall():
+                if path not in seen and not os.path.isdir(path):
+                    self.db.execute('DELETE FROM experiments WHERE id = ?', (exp_id,))
+                    counts['removed'] += 1
+        self.db.commit()
+        return counts
+
+    def _source_files(self, folder: str) -> Dict[str, str]:
+        """Files an experiment's row is built from, by role."""
+        files = {}
+        for name in (RESULT_FILENAME, STATISTICS_FILENAME, ARTIFACTS_FILENAME):
+            path = os.path.join(folder, name)
+            if os.path.isfile(path):
+                files[name] = path
+        if RESULT_FILENAME not in files and os.path.isfile(os.path.join(folder, STATES_FILENAME)):
+            # Old runs: the score has to come from the recorded game
+            files[STATES_FILENAME] = os.path.join(folder, STATES_FILENAME)
+        config = self._config_path(folder, files.get(RESULT_FILENAME))
+        if config is not None:
+            files['config'] = config
+        return files
+
+    def _config_path(self, folder: str, result_path: Optional[str]) -> Optional[str]:
+        if result_path is not None:
+            with open(result_path, 'r') as f:
+                config = json.load(f).get('config')
+            if config:
+                for candidate in (config, os.path.join(folder, config)):
+                    if os.path.isfile(candidate):
+                        return os.path.abspath(candidate)
+        name = os.path.basename(folder) + '.ini'
+        for config_dir in self.config_dirs:
+            if os.path.isfile(os.path.join(config_dir, name)):
+                return os.path.abspath(os.path.join(config_dir, name))
+        return None
+
+    def _index_experiment(self, folder: str) -> str:
+        row = self.db.execute('SELECT id FROM experiments WHERE path = ?', (folder,)).fetchone()
+        files = self._source_files(folder)
+        stamps = {path: (os.path.getmtime(path), os.path.getsize(path)) for path in files.values()}
+
+        if row is not None:
+            exp_id = row[0]
+            known = {path: (mtime, size, digest) for path, mtime, size, digest in self.db.execute(
+                'SELECT path, mtime, size, sha256 FROM files WHERE experiment_id = ?', (exp_id,))}
+            if set(known) == set(stamps):
+                if all(known[p][:2] == stamps[p] for p in stamps):
+                    return 'unchanged'
+                # Touched but possibly not changed (copied, re-saved): compare contents
+                digests = {p: _sha256(p) for p in stamps}
+                if all(known[p][2] == digests[p] for p in stamps):
+                    self.db.executemany(
+                        'UPDATE files SET mtime = ?, size = ? WHERE experiment_id = ? AND path = ?',
+                        [(stamps[p][0], stamps[p][1], exp_id, p) for p in stamps])
+                    return 'unchanged'
+            self.db.execute('DELETE FROM experiments WHERE id = ?', (exp_id,))
+
+        self._ingest(folder, files, stamps)
+        return 'added' if row is None else 'updated'
+
+    def _ingest(self, folder: str, files: Dict[str, str], stamps: Dict[str, tuple]) -> None:
+        result = {}
+        if RESULT_FILENAME in files:
+            with open(files[RESULT_FILENAME], 'r') as f:
+                result = json.load(f)
+        elif STATES_FILENAME in files:
+            with open(files[STATES_FILENAME], 'r') as f:
+                states = json.load(f)
+            result = {'score': _legacy_score(states, files.get('config'))}
+
+        statistics = {}
+        if STATISTICS_FILENAME in files:
+            with open(files[STATISTICS_FILENAME], 'r') as f:
+                statistics = json.load(f)
+        best = statistics.get('best_fitness', [])
+        mean = statistics.get('mean_fitness', [])
+        stdev = statistics.get('stdev_fitness', [])
+        species = [sum(1 for size in sizes if size) for sizes in statistics.get('species_sizes', [])]
+
+        cursor = self.db.execute(
+            'INSERT INTO experiments (path, name, config_path, settings_key, seed, generations, score, '
+            'best_fitness, final_mean_fitness, final_species, cached, resumed_from, indexed_at) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (folder, os.path.basename(folder), files.get('config'), result.get('key'), result.get('seed'),
+             result.get('generations', len(best) or None), result.get('score'),
+             result.get('best_fitness', max(best) if best else None),
+             mean[-1] if mean else None, species[-1] if species else None,
+             int(result['cached']) if 'cached' in result else None, result.get('resumed_from'),
+             time.time()))
+        exp_id = cursor.lastrowid
+
+        if 'config' in files:
+            parser = configparser.ConfigParser(interpolation=None)
+            parser.read(files['config'])
+            params = []
+            for section in parser.sections():
+                for key, value in parser.items(section, raw=True):
+                    value = _canonical_value(value)
+                    params.append((exp_id, f'{section}.{key}', value, _number(value)))
+            self.db.executemany('INSERT INTO params VALUES (?, ?, ?, ?)', params)
+
+        self.db.executemany('INSERT INTO generations VALUES (?, ?, ?, ?, ?, ?)', [
+            (exp_id, g, best[g] if g < len(best) else None, mean[g] if g < len(mean) else None,
+             stdev[g] if g < len(stdev) else None, species[g] if g < len(species) else None)
+            for g in range(max(len(best), len(mean)))])
+
+        artifacts = {name: os.path.join(folder, name) for name in ARTIFACT_FILES
+                     if os.path.exists(os.path.join(folder, name))}
+        if ARTIFACTS_FILENAME in files:
+            with open(files[ARTIFACTS_FILENAME], 'r') as f:
+                for name, entry in json.load(f).items():
+                    if entry.get('path'):
+                        artifacts[name] = entry['path']
+        self.db.executemany('INSERT INTO artifacts VALUES (?, ?, ?)',
+                            [(exp_id, name, path) for name, path in artifacts.items()])
+
+        self.db.executemany('INSERT INTO files VALUES (?, ?, ?, ?, ?)',
+                            [(exp_id, path, *stamps[path], _sha256(path)) for path in files.values()])
+
+    # ---- queries ----------------------------------------------------------------------
+
+    def compare(self,
+                by: Sequence[str],
+                metric: str = 'score',
+                where: Optional[Dict[str, str]] = None) -> List[dict]:
+        """
+        Aggregate `metric` over experiments grouped by the parameters in `by` ('SECTION.key',
+        e.g. 'EVALUATOR.name'), optionally restricted to runs whose parameters equal `where`.
+        Runs without one of the parameters are left out. Rows hold the group's parameter
+        values, runs, mean, min and max, best mean first.
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric {metric!r}; choose from {', '.join(METRICS)}")
+        where = where or {}
+        joins, args = [], []
+        for i, name in enumerate(list(by) + list(where)):
+            joins.append(f'JOIN params p{i} ON p{i}.experiment_id = e.id AND p{i}.name = ?')
+            args.append(name)
+        conditions = []
+        for i, value in enumerate(where.values(), start=len(by)):
+            conditions.append(f'p{i}.value = ?')
+            args.append(_canonical_value(str(value)))
+        columns = [f'p{i}.value' for i in range(len(by))]
+        aggregates = f'COUNT(*), AVG(e.{metric}), MIN(e.{metric}), MAX(e.{metric})'
+        sql = (f'SELECT {", ".join(columns + [aggregates])} FROM experiments e {" ".join(joins)} '
+               f'WHERE {" AND ".join([f"e.{metric} IS NOT NULL"] + conditions)} '
+               f'{"GROUP BY " + ", ".join(columns) if columns else ""} ORDER BY AVG(e.{metric}) DESC')
+        rows = []
+        for row in self.db.execute(sql, args):
+            values, (runs, mean, low, high) = row[:len(by)], row[len(by):]
+            rows.append(dict(zip(by, values), runs=runs, mean=mean, min=low, max=high))
+        return rows
+
+    def best_per(self,
+                 per: str,
+                 among: str,
+                 metric: str = 'score',
+                 where: Optional[Dict[str, str]] = None) -> List[dict]:
+        """For every value of parameter `per`, the value of `among` with the best mean `metric`."""
+        best = {}
+        for row in self.compare([per, among], metric, where):
+            # compare() sorts by mean, so the first row of each group wins
+            best.setdefault(row[per], row)
+        return sorted(best.values(), key=lambda r: (_number(r[per]) is None, _number(r[per]) or 0, r[per]))
+
+    def query(self, sql: str, args: Sequence = ()) -> List[tuple]:
+        return self.db.execute(sql, args).fetchall()
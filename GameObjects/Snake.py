@@ -1,6 +1,7 @@
 import pygame
 import random
 import json
+import numpy as np
 from typing import List, Tuple, Optional
 
 # Colors (RGB)
@@ -15,6 +16,14 @@ DOWN  = (0, 1)
 LEFT  = (-1, 0)
 RIGHT = (1, 0)
 
+# Sensor modes: 8 ray sensors (see get_state) or the full occupancy grid (see board_inputs)
+SENSOR_MODES = ('rays', 'board')
+# Board channels, each a grid_height x grid_width plane
+BODY, HEAD, APPLE = 0, 1, 2
+BOARD_CHANNELS = 3
+# get_state plus the normalized delta-to-apple the networks also get
+RAY_INPUTS = 8 * 3 + 4 + 2 + 2
+
 class Snake:
     def __init__(self,
                  start_pos: Tuple[int, int],
@@ -69,12 +78,59 @@ class SnakeGame:
         grid_width: int = 10,
         grid_height: int = 10,
         cell_size: int = 20,
-        game_mode: int = 1
+        game_mode: int = 1,
+        sensor_mode: str = 'rays',
+        board: Optional[np.ndarray] = None
     ):
+        if sensor_mode not in SENSOR_MODES:
+            raise ValueError(f"Unknown sensor mode: {sensor_mode}")
         self.grid_width  = grid_width
         self.grid_height = grid_height
         self.cell_size   = cell_size
         self.game_mode   = game_mode
+        self.sensor_mode = sensor_mode
+        self.rng = random
+        # Board mode: (channel, y, x) occupancy, updated in place as the snake moves.
+        # `board` lets a BoardBatch hand in a row of its shared array.
+        self.board = None
+        self._shared_board = board is not None
+        if sensor_mode == 'board':
+            self._set_board(board)
+        self.reset()
+
+    @property
+    def num_inputs(self) -> int:
+        """Length of the network input vector in this sensor mode."""
+        if self.sensor_mode == 'board':
+            return BOARD_CHANNELS * self.grid_width * self.grid_height
+        return RAY_INPUTS
+
+    def _set_board(self, board: Optional[np.ndarray]) -> None:
+        shape = (BOARD_CHANNELS, self.grid_height, self.grid_width)
+        if board is None:
+            board = np.zeros(shape)
+        elif board.shape != shape or board.dtype != np.float64 or not board.flags.c_contiguous:
+            raise ValueError(f"Board buffer must be a C-contiguous float64 array of shape {shape}.")
+        self.board = board
+        # Flat float64 views of the same memory; iterating the memoryview yields Python floats,
+        # so networks read the board without any per-step copy
+        self.board_flat = board.reshape(-1)
+        self.board_inputs = memoryview(self.board_flat)
+
+    def seed(self, seed: Optional[int]) -> None:
+        # Private RNG so seeded games don't disturb the global random state NEAT uses
+        self.rng = random if seed is None else random.Random(seed)
+
+    def resize(self, grid_width: int, grid_height: int) -> None:
+        if self._shared_board and (grid_width, grid_height) != (self.grid_width, self.grid_height):
+            raise ValueError("A game in a BoardBatch cannot be resized.")
+        self.grid_width  = grid_width
+        self.grid_height = grid_height
+        # A window opened for the old size is recreated on the next render
+        if hasattr(self, 'screen'):
+            del self.screen
+        if self.sensor_mode == 'board' and self.board.shape[1:] != (grid_height, grid_width):
+            self._set_board(None)
         self.reset()
 
     def reset(self) -> None:
@@ -84,12 +140,29 @@ class SnakeGame:
         self.apples = self._generate_apples()
         self.score = 0
         self.done = False
+        self.death_cause: Optional[str] = None
+        if self.board is not None:
+            self.repaint_board()
+
+    def repaint_board(self) -> None:
+        """Redraw the whole board from the snake and apples (step only touches changed cells)."""
+        self.board.fill(0.0)
+        self._paint(BODY, self.snake.body, 1.0)
+        self._paint(HEAD, [self.snake.head], 1.0)
+        self._paint(APPLE, self.apples, 1.0)
+
+    def _paint(self, channel: int, cells, value: float) -> None:
+        plane = self.board[channel]
+        for x, y in cells:
+            # The head leaves the grid on a wall death
+            if 0 <= x < self.grid_width and 0 <= y < self.grid_height:
+                plane[y, x] = value
 
     def _generate_apple(self) -> Tuple[int, int]:
         # Place apple not on snake
         while True:
-            pos = (random.randint(0, self.grid_width-1),
-                   random.randint(0, self.grid_height-1))
+            pos = (self.rng.randint(0, self.grid_width-1),
+                   self.rng.randint(0, self.grid_height-1))
             if pos not in self.snake.body:
                 return pos
 
@@ -98,7 +171,7 @@ class SnakeGame:
         if self.game_mode == 1:
             apples.append(self._generate_apple())
         else:
-            count = random.randint(2, 5)
+            count = self.rng.randint(2, 5)
             while len(apples) < count:
                 pos = self._generate_apple()
                 if pos not in apples:
@@ -109,6 +182,10 @@ class SnakeGame:
         # Determine new direction and move
         dirs = [UP, DOWN, LEFT, RIGHT]
         self.snake.change_direction(dirs[action])
+        if self.board is not None:
+            old_head = self.snake.head
+            old_tail = None if self.snake.grow_flag else self.snake.body[-1]
+            old_apples = list(self.apples)
         self.snake.move()
 
         # Wrap-around logic for wall-teleport mode (mode 2)
@@ -126,15 +203,28 @@ class SnakeGame:
             if self.game_mode == 1 or (self.game_mode != 1 and not self.apples):
                 self.apples = self._generate_apples()
 
+        if self.board is not None:
+            # Only the cells that changed: vacated tail, old and new head, moved apples
+            if old_tail is not None:
+                self._paint(BODY, [old_tail], 0.0)
+            self._paint(HEAD, [old_head], 0.0)
+            self._paint(BODY, [head], 1.0)
+            self._paint(HEAD, [head], 1.0)
+            if self.apples != old_apples:
+                self._paint(APPLE, old_apples, 0.0)
+                self._paint(APPLE, self.apples, 1.0)
+
         # Self-collision always ends game
         if head in self.snake.body[1:]:
             self.done = True
+            self.death_cause = 'self'
             return
 
         # Wall collision only in mode 1
         if self.game_mode == 1:
             if head_x < 0 or head_x >= self.grid_width or head_y < 0 or head_y >= self.grid_height:
                 self.done = True
+                self.death_cause = 'wall'
                 return
 
         # Rendering if needed
@@ -168,6 +258,18 @@ class SnakeGame:
 
         return sensors
 
+    def get_inputs(self):
+        """
+        Network input vector: the ray sensors plus the normalized delta-to-apple, or in
+        board mode the flattened occupancy grid (a live view, copy it to keep a snapshot).
+        """
+        if self.board is not None:
+            return self.board_inputs
+        state = self.get_state()
+        hx, hy = self.snake.head
+        ax, ay = self.apples[0]
+        return state + [(ax - hx) / (self.grid_width - 1), (ay - hy) / (self.grid_height - 1)]
+
     def _ensure_pygame(self) -> None:
         if not hasattr(self, 'screen'):
             pygame.init()
@@ -226,4 +328,32 @@ class SnakeGame:
         # Cleanup
         pygame.quit()
         if hasattr(self, 'screen'):
-            del self.screen
\ No newline at end of file
+            del self.screen
+
+
+class BoardBatch:
+    """
+    N board-mode games whose grids are rows of one (N, 3 * grid_height * grid_width) array.
+
+    Each game updates its own row in place, so `inputs` is always current for the whole
+    batch without gathering or copying anything.
+    """
+
+    def __init__(self,
+                 n: int,
+                 grid_width: int = 10,
+                 grid_height: int = 10,
+                 cell_size: int = 20,
+                 game_mode: int = 1):
+        self.boards = np.zeros((n, BOARD_CHANNELS, grid_height, grid_width))
+        self.games = [SnakeGame(grid_width, grid_height, cell_size, game_mode,
+                                sensor_mode='board', board=self.boards[i])
+                      for i in range(n)]
+
+    def __len__(self) -> int:
+        return len(self.games)
+
+    @property
+    def inputs(self) -> np.ndarray:
+        """(N, 3 * grid_height * grid_width) view of every game's flattened board."""
+        return self.boards.reshape(len(self.games), -1)
@@ -1,11 +1,25 @@
 import json
-from typing import Optional
+from typing import Optional, List, Tuple
 
 class InitialArchitecture:
-    def __init__(self, input_size: int, output_size: int, hidden_layers: Optional[list] = None):
+    def __init__(self,
+                 input_size: int,
+                 output_size: int,
+                 hidden_layers: Optional[list] = None,
+                 connections: Optional[List[Tuple[int, int, float]]] = None,
+                 output_ids: Optional[List[int]] = None):
         self.input_size = input_size
         self.hidden_layers = hidden_layers or []
         self.output_size = output_size
+        # (src, dst, weight) triples using the file's own node ids
+        self.connections = [(int(a), int(b), float(w)) for a, b, w in (connections or [])]
+
+        # File ids are laid out inputs first, then outputs, unless output_ids says otherwise
+        if output_ids is None:
+            output_ids = list(range(input_size, input_size + output_size))
+        self.output_ids = [int(i) for i in output_ids]
+        outputs = set(self.output_ids)
+        self.input_ids = [i for i in range(input_size + len(outputs)) if i not in outputs][:input_size]
 
     @classmethod
     def from_file(cls, path: str) -> 'InitialArchitecture':
@@ -14,9 +28,19 @@ class InitialArchitecture:
         return cls(
             input_size=data['num_inputs'],
             output_size=data['num_outputs'],
-            hidden_layers=data.get('hidden_layers', [])
+            hidden_layers=data.get('hidden_layers', []),
+            connections=data.get('connections', []),
+            output_ids=data.get('output_ids')
         )
 
+    def node_role(self, node_id: int) -> Tuple[str, int]:
+        """Classify a file node id as ('input'|'output'|'hidden', position)."""
+        if node_id in self.output_ids:
+            return 'output', self.output_ids.index(node_id)
+        if node_id in self.input_ids:
+            return 'input', self.input_ids.index(node_id)
+        return 'hidden', node_id
+
     def apply_to_config(self, config):
         genome_cfg = config.genome_config
         # Set sizes
@@ -0,0 +1,71 @@
+from collections import OrderedDict
+from typing import List, Optional
+
+
+class ActivationCache:
+    """
+    Per-genome memo of `net.activate`, keyed by the (optionally rounded) input vector.
+
+    Entries are evicted least-recently-used once `max_size` is reached. Only valid for
+    deterministic feed-forward networks, whose output depends on the current inputs alone.
+    """
+
+    def __init__(self, net, max_size: int = 4096, decimals: Optional[int] = 6):
+        self.net = net
+        self.max_size = max_size
+        self.decimals = decimals
+        self.entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def activate(self, inputs) -> List[float]:
+        if self.decimals is None:
+            key = tuple(inputs)
+        else:
+            key = tuple(round(v, self.decimals) for v in inputs)
+
+        outputs = self.entries.get(key)
+        if outputs is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            # Callers mask outputs in place, so never hand out the cached tuple itself
+            return list(outputs)
+
+        self.misses += 1
+        outputs = self.net.activate(inputs)
+        self.entries[key] = tuple(outputs)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return list(outputs)
+
+
+class CacheStats:
+    """Running hit/miss/eviction totals over many ActivationCache instances."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def add(self, cache: ActivationCache) -> None:
+        self.add_counts(cache.hits, cache.misses, cache.evictions)
+
+    def add_counts(self, hits: int, misses: int, evictions: int) -> None:
+        self.hits += hits
+        self.misses += misses
+        self.evictions += evictions
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hit_rate
+        }
@@ -0,0 +1,79 @@
+import time
+from typing import List, Optional, Tuple
+
+from neat.reporting import BaseReporter
+
+
+class CurriculumReporter(BaseReporter):
+    """
+    Grows the training grid between generations.
+
+    `stages` is a list of (grid_width, grid_height, max_steps). The trainer moves to the next
+    stage once the best fitness reaches `fitness_threshold` or the best apple count reaches
+    `score_threshold`. Wall time and generations spent in each stage are kept in `stage_log`.
+    """
+
+    def __init__(self,
+                 trainer,
+                 stages: List[Tuple[int, int, int]],
+                 fitness_threshold: Optional[float] = None,
+                 score_threshold: Optional[int] = None):
+        if not stages:
+            raise ValueError("Curriculum needs at least one stage.")
+        self.trainer = trainer
+        self.stages = list(stages)
+        self.fitness_threshold = fitness_threshold
+        self.score_threshold = score_threshold
+        self.stage_log: List[dict] = []
+
+        self.stage = 0
+        self.stage_generations = 0
+        self.stage_start = time.time()
+        self.trainer.set_grid(*self.stages[0])
+
+    def __getstate__(self):
+        # Checkpoints pickle the reporter set; the trainer (worker pool, games) stays behind
+        state = dict(self.__dict__)
+        state['trainer'] = None
+        return state
+
+    def post_evaluate(self, config, population, species, best_genome):
+        self.stage_generations += 1
+        if self.stage >= len(self.stages) - 1:
+            return
+
+        best_score = max(self.trainer.last_scores.values(), default=0)
+        fitness_hit = self.fitness_threshold is not None and best_genome.fitness >= self.fitness_threshold
+        score_hit = self.score_threshold is not None and best_score >= self.score_threshold
+        if fitness_hit or score_hit:
+            self._close_stage(best_genome.fitness, best_score)
+            self.stage += 1
+            self.trainer.set_grid(*self.stages[self.stage])
+            gw, gh, max_steps = self.stages[self.stage]
+            print(f'Curriculum: advancing to stage {self.stage} ({gw}x{gh}, max_steps={max_steps})')
+
+    def finish(self) -> List[dict]:
+        """Close the running stage; call once training has returned."""
+        if self.stage_generations:
+            best = self.trainer.pop.best_genome
+            self._close_stage(best.fitness if best is not None else None,
+                              max(self.trainer.last_scores.values(), default=0))
+        return self.stage_log
+
+    def _close_stage(self, best_fitness, best_score) -> None:
+        gw, gh, max_steps = self.stages[self.stage]
+        elapsed = time.time() - self.stage_start
+        self.stage_log.append({
+            'stage': self.stage,
+            'grid_width': gw,
+            'grid_height': gh,
+            'max_steps': max_steps,
+            'generations': self.stage_generations,
+            'wall_time': elapsed,
+            'best_fitness': best_fitness,
+            'best_score': best_score
+        })
+        print(f'Curriculum: stage {self.stage} ({gw}x{gh}) took '
+              f'{self.stage_generations} generations, {elapsed:.1f} sec')
+        self.stage_generations = 0
+        self.stage_start = time.time()
@@ -0,0 +1,142 @@
+import math
+
+from GameObjects.Snake import SnakeGame, UP, DOWN, LEFT, RIGHT
+
+DIRS = [UP, DOWN, LEFT, RIGHT]
+
+# Shaping terms of the training fitness
+PROXIMITY_WEIGHT = 0.1
+APPLE_BONUS = 5.0
+DEATH_PENALTY = 1.0
+TIME_PENALTY = 0.001
+
+
+def dist_to_apple(game: SnakeGame) -> float:
+    hx, hy = game.snake.head
+    ax, ay = game.apples[0]
+    return math.hypot(hx - ax, hy - ay)
+
+
+class TrainingEpisode:
+    """
+    Resumable training rollout of one network, scored with the trainer's shaped fitness.
+
+    advance() can be called repeatedly with any step budget; the final fitness is the
+    same as running the whole episode in one go.
+    """
+
+    def __init__(self, net, game: SnakeGame, max_steps: int):
+        self.net = net
+        self.game = game
+        self.max_steps = max_steps
+        self.fitness = 0.0
+        self.step = 0
+        self.finished = False
+        # Set to a list to collect (inputs, outputs, action, apples) per step
+        self.trace = None
+        # Loop detection (see watch_for_loops): game state -> index into the fitness history
+        self._seen = None
+        self._history = []
+        self._history_score = 0
+        # Steps accounted for without simulating them
+        self.fast_forwarded = 0
+
+        game.reset()
+        self.prev_dist = dist_to_apple(game)
+
+    def advance(self, n: int) -> int:
+        """Simulate up to `n` more steps; returns how many were simulated."""
+        simulated = 0
+        while not self.finished and simulated < n:
+            if self.game.done:
+                self.fitness -= DEATH_PENALTY
+                self._finish(self.step)
+                break
+            self._play_step()
+            simulated += 1
+            self.step += 1
+            if self.step >= self.max_steps:
+                self._finish(self.max_steps - 1)
+            elif self._seen is not None and not self.game.done:
+                self._check_loop()
+        return simulated
+
+    def watch_for_loops(self) -> None:
+        """
+        Let advance() finish the episode as soon as the game state repeats. Networks are
+        stateless and apples, the only random events, can't be eaten inside a loop, so from
+        a repeated state the episode cycles until it times out and its fitness follows
+        without simulating the rest. Not for traced episodes, whose steps are all recorded.
+        """
+        self._seen = {}
+
+    def _check_loop(self) -> None:
+        game = self.game
+        if game.score != self._history_score:
+            # The snake grew: earlier states can't come back
+            self._seen.clear()
+            self._history.clear()
+            self._history_score = game.score
+        snake = game.snake
+        state = (tuple(snake.body), snake.direction, snake.grow_flag, tuple(game.apples))
+        start = self._seen.get(state)
+        if start is None:
+            self._seen[state] = len(self._history)
+            self._history.append(self.fitness)
+            return
+
+        # history[start:] is one period; the current step is back at history[start]
+        period = len(self._history) - start
+        cycles, rest = divmod(self.max_steps - self.step, period)
+        gain = self.fitness - self._history[start]
+        self.fitness += cycles * gain + (self._history[start + rest] - self._history[start])
+        self.fast_forwarded = self.max_steps - self.step
+        self.step = self.max_steps
+        self._seen = None
+        self._history = []
+        self._finish(self.max_steps - 1)
+
+    def _play_step(self) -> None:
+        game = self.game
+
+        # Ray sensors + normalized delta-to-apple, or the live board view in board mode
+        inputs = game.get_inputs()
+
+        outputs = self.net.activate(inputs)
+        if self.trace is not None:
+            # The board view changes with the next step, so keep a copy
+            recorded = (list(inputs), list(outputs))
+
+        # Prevent immediate reverse
+        curr_i = DIRS.index(game.snake.direction)
+        outputs[curr_i ^ 1] = -float('inf')
+
+        action = int(outputs.index(max(outputs)))
+        game.step(action)
+        if self.trace is not None:
+            self.trace.append(recorded + (action, game.score))
+
+        # Shaped reward: proximity bonus
+        curr_dist = dist_to_apple(game)
+        self.fitness += (self.prev_dist - curr_dist) * PROXIMITY_WEIGHT
+        self.prev_dist = curr_dist
+
+        # Bonus on apple
+        if game.score > 0:
+            self.fitness += APPLE_BONUS
+
+    @property
+    def death_cause(self) -> str:
+        if self.game.done:
+            return self.game.death_cause
+        return 'timeout' if self.finished else ''
+
+    def stop(self) -> None:
+        """End the episode early, charging the time penalty up to the current step."""
+        if not self.finished:
+            self._finish(self.step)
+
+    def _finish(self, last_step: int) -> None:
+        # Time penalty
+        self.fitness -= TIME_PENALTY * last_step
+        self.finished = True
@@ -0,0 +1,246 @@
+import random
+from itertools import zip_longest
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+from neat.nn import FeedForwardNetwork
+
+from GameObjects.Snake import SnakeGame
+from NEATObjects.ActivationCache import ActivationCache
+from NEATObjects.Episode import TrainingEpisode
+from NEATObjects.NetOptimizer import optimize_network
+from NEATObjects.Policy import Policy, policy_arrays
+
+# Compared exactly, in this order; 'outputs' is compared with a tolerance
+STATE_FIELDS = ('inputs', 'outputs', 'action', 'snake', 'direction', 'apples', 'score', 'done')
+# The record closing every trace: the episode's outcome; 'fitness' is compared with a tolerance
+END = 'end'
+OUTCOME_FIELDS = ('steps', 'score', 'death_cause', 'fitness')
+TOLERANT_FIELDS = ('outputs', 'fitness')
+
+
+class Engine:
+    """
+    One way of simulating a genome: a game class and a network builder.
+
+    `game_type(grid_width, grid_height, cell_size, game_mode, sensor_mode)` must behave like
+    SnakeGame (seed, reset, get_inputs, step, snake, apples, score, done); `make_net(genome, config)`
+    must return an object with `activate(inputs)`. With `watch_for_loops` the episode is
+    fast-forwarded once the game state repeats (TrainingEpisode.watch_for_loops).
+    """
+
+    def __init__(self,
+                 name: str,
+                 make_net: Callable = FeedForwardNetwork.create,
+                 game_type: Callable = SnakeGame,
+                 watch_for_loops: bool = False):
+        self.name = name
+        self.make_net = make_net
+        self.game_type = game_type
+        # Finish looping episodes without simulating them, as racing does
+        self.watch_for_loops = watch_for_loops
+
+
+class RepaintedBoardGame(SnakeGame):
+    """Board mode without the incremental updates: the board is redrawn before every read."""
+
+    def get_inputs(self):
+        if self.board is not None:
+            self.repaint_board()
+        return super().get_inputs()
+
+
+REFERENCE = Engine('reference')
+
+ENGINES: Dict[str, Engine] = {
+    'reference': REFERENCE,
+    'optimized': Engine('optimized', make_net=lambda genome, config: optimize_network(genome, config)[0]),
+    'cached': Engine('cached', make_net=lambda genome, config: ActivationCache(
+        FeedForwardNetwork.create(genome, config))),
+    'optimized+cached': Engine('optimized+cached', make_net=lambda genome, config: ActivationCache(
+        optimize_network(genome, config)[0])),
+    'policy': Engine('policy', make_net=lambda genome, config: Policy(policy_arrays(genome, config))),
+    # Only differs from the reference with sensor_mode='board'
+    'repainted-board': Engine('repainted-board', game_type=RepaintedBoardGame),
+    'loop-fast-forward': Engine('loop-fast-forward', watch_for_loops=True)
+}
+
+
+def rollout(engine: Engine, genome, config, grid, game_mode: int, seed: int, max_steps: int,
+            sensor_mode: str = 'rays') -> Iterator[dict]:
+    """
+    Play one seeded training episode (TrainingEpisode, one step at a time) with `engine`.
+
+    Yields the state after reset (step -1), then one record per simulated step with the
+    sensors, raw network outputs and action that produced it, and finally the END record
+    with the episode's steps, score, death cause and shaped fitness. A fast-forwarded
+    episode stops yielding steps at the one where its loop was detected.
+    """
+    game = engine.game_type(grid[0], grid[1], 20, game_mode, sensor_mode)
+    game.seed(seed)
+    episode = TrainingEpisode(engine.make_net(genome, config), game, max_steps)
+    # The trace keeps copies of the inputs: in board mode get_inputs is a live view
+    episode.trace = []
+    if engine.watch_for_loops:
+        episode.watch_for_loops()
+
+    yield _snapshot(game, -1, None, None, None)
+    step = 0
+    while not episode.finished:
+        if not episode.advance(1):
+            break
+        inputs, outputs, action, _ = episode.trace[-1]
+        yield _snapshot(game, step, inputs, outputs, action)
+        step += 1
+        if episode.fast_forwarded:
+            break
+    yield {
+        'step': END,
+        'steps': episode.step,
+        'score': game.score,
+        'death_cause': episode.death_cause,
+        'fitness': episode.fitness,
+        'fast_forwarded': episode.fast_forwarded
+    }
+
+
+def _snapshot(game, step: int, inputs, outputs, action) -> dict:
+    return {
+        'step': step,
+        'inputs': list(inputs) if inputs is not None else None,
+        'outputs': outputs,
+        'action': action,
+        'snake': list(game.snake.body),
+        'direction': game.snake.direction,
+        'apples': list(game.apples),
+        'score': game.score,
+        'done': game.done
+    }
+
+
+class Divergence:
+    """First point where a candidate engine's trace differs from the reference, with context."""
+
+    def __init__(self, engine: str, genome, game_mode: int, seed: int, step: int, field: str,
+                 expected, actual, reference_context: List[dict], candidate_context: List[dict]):
+        self.engine = engine
+        self.genome = genome
+        self.game_mode = game_mode
+        self.seed = seed
+        self.step = step
+        self.field = field
+        self.expected = expected
+        self.actual = actual
+        self.reference_context = reference_context
+        self.candidate_context = candidate_context
+
+    def __str__(self) -> str:
+        enabled = sum(1 for cg in self.genome.connections.values() if cg.enabled)
+        lines = [
+            f"Engine '{self.engine}' diverges from reference at step {self.step} on '{self.field}'",
+            f"  genome {self.genome.key} ({len(self.genome.nodes)} nodes, {enabled} enabled connections), "
+            f"game_mode={self.game_mode}, seed={self.seed}",
+            f"  expected: {self.expected!r}",
+            f"  actual:   {self.actual!r}",
+            "  preceding steps (reference | candidate):"
+        ]
+        for ref, cand in zip_longest(self.reference_context, self.candidate_context):
+            lines.append(f"    {_describe(ref)}  |  {_describe(cand)}")
+        return '\n'.join(lines)
+
+
+def _describe(record: Optional[dict]) -> str:
+    if record is None:
+        return '-'
+    return (f"step {record['step']}: action={record['action']} head={record['snake'][0]} "
+            f"apples={record['apples']} score={record['score']} done={record['done']}")
+
+
+def compare_traces(reference: Iterator[dict],
+                   candidate: Iterator[dict],
+                   output_tol: float = 1e-9,
+                   context: int = 5) -> Optional[tuple]:
+    """
+    Walk two traces in lockstep; returns (step, field, expected, actual, ref_ctx, cand_ctx)
+    for the first difference, or None when they agree. Outputs and fitness may differ by
+    `output_tol` relative to their magnitude; every other field must match exactly. When the
+    candidate fast-forwarded a loop, the reference's remaining steps are skipped and only
+    the outcomes are compared.
+    """
+    reference, candidate = iter(reference), iter(candidate)
+    ref_ctx: List[dict] = []
+    cand_ctx: List[dict] = []
+    while True:
+        ref, cand = next(reference, None), next(candidate, None)
+        if ref is None and cand is None:
+            return None
+        if cand is not None and cand['step'] == END and cand['fast_forwarded']:
+            while ref is not None and ref['step'] != END:
+                ref = next(reference, None)
+        if ref is None or cand is None or (ref['step'] == END) != (cand['step'] == END):
+            step = (ref or cand)['step']
+            return (step, 'length', 'ended' if ref is None or ref['step'] == END else 'continues',
+                    'ended' if cand is None or cand['step'] == END else 'continues', ref_ctx, cand_ctx)
+        for field in OUTCOME_FIELDS if ref['step'] == END else STATE_FIELDS:
+            a, b = ref[field], cand[field]
+            if field in TOLERANT_FIELDS and a is not None and b is not None:
+                a_values, b_values = (a, b) if field == 'outputs' else ([a], [b])
+                same = len(a_values) == len(b_values) and all(abs(x - y) <= output_tol * max(1.0, abs(x))
+                                                              for x, y in zip(a_values, b_values))
+            else:
+                same = a == b
+            if not same:
+                return ref['step'], field, a, b, ref_ctx, cand_ctx
+        ref_ctx = (ref_ctx + [ref])[-context:]
+        cand_ctx = (cand_ctx + [cand])[-context:]
+
+
+def check_genome(genome, config, engine: Engine, game_modes: Sequence[int] = (1, 2),
+                 seeds: Sequence[int] = (0,), grid=(10, 10), max_steps: int = 200,
+                 output_tol: float = 1e-9, sensor_mode: str = 'rays') -> Optional[Divergence]:
+    """Compare `engine` against the reference on every game mode and seed; first divergence or None."""
+    for mode in game_modes:
+        for seed in seeds:
+            found = compare_traces(rollout(REFERENCE, genome, config, grid, mode, seed, max_steps, sensor_mode),
+                                   rollout(engine, genome, config, grid, mode, seed, max_steps, sensor_mode),
+                                   output_tol)
+            if found is not None:
+                return Divergence(engine.name, genome, mode, seed, *found)
+    return None
+
+
+def random_genome(config, key: int, rng: random.Random, max_mutations: int = 30):
+    """
+    A fresh genome from the config's initial connectivity plus a random number of mutations,
+    so the fuzzer covers hidden nodes, disabled links and odd topologies.
+    """
+    genome = config.genome_type(key)
+    genome.configure_new(config.genome_config)
+    for _ in range(rng.randint(0, max_mutations)):
+        genome.mutate(config.genome_config)
+    return genome
+
+
+def fuzz(config, engines: Sequence[Engine], num_genomes: int = 1000, game_modes: Sequence[int] = (1, 2),
+         seeds: Sequence[int] = (0,), grid=(10, 10), max_steps: int = 200, max_mutations: int = 30,
+         output_tol: float = 1e-9, fuzz_seed: int = 0, stop_on_first: bool = False,
+         sensor_mode: str = 'rays') -> List[Divergence]:
+    """
+    Check every engine on `num_genomes` random genomes; returns all divergences found.
+    With sensor_mode='board' the config must already have the board's input count (match_inputs).
+
+    NEAT mutates through the global random module, so it is seeded with `fuzz_seed` and
+    the same arguments always generate the same genomes.
+    """
+    rng = random.Random(fuzz_seed)
+    random.seed(fuzz_seed)
+    divergences = []
+    for i in range(num_genomes):
+        genome = random_genome(config, i, rng, max_mutations)
+        for engine in engines:
+            found = check_genome(genome, config, engine, game_modes, seeds, grid, max_steps, output_tol,
+                                 sensor_mode)
+            if found is not None:
+                divergences.append(found)
+                if stop_on_first:
+                    return divergences
+    return divergences
@@ -0,0 +1,225 @@
+import multiprocessing as mp
+import queue
+import random
+import time
+import traceback
+from typing import List, Optional, Tuple
+
+from neat.checkpoint import Checkpointer
+from neat.reporting import StdOutReporter
+from neat.statistics import StatisticsReporter
+
+from ExperimentObjects.Monitor import HttpPublisher, MonitorReporter
+from GameObjects.Snake import SnakeGame
+from NEATObjects.NEAT import NEATTrainer
+from NEATObjects.WarmStart import remap_genome
+
+
+class IslandError(RuntimeError):
+    """An island process raised or died; carries the island's traceback when there is one."""
+
+
+class IslandModel:
+    """
+    Evolves several independent NEAT populations in separate processes.
+
+    Islands form a ring: every `migration_interval` generations each island sends copies of its
+    `num_migrants` best genomes to the next one, which swaps them in for random offspring.
+    An island takes in exactly the migrants its neighbour sent for the same round (an island
+    that stops early says so instead), and with a `seed` each island's random stream comes from
+    (seed, island index), so seeded runs are reproducible. `curriculum` holds the keyword
+    arguments of NEATTrainer.enable_curriculum; every island then follows its own curriculum.
+    With `monitor` ({'name', 'url'}) every island reports to the monitor at `url` as
+    '<name>/island-<index>'.
+    """
+
+    def __init__(self,
+                 config_path: str,
+                 game_spec: Tuple[int, int, int, int, str],
+                 evaluator,
+                 num_islands: int = 4,
+                 island_pop_size: Optional[int] = None,
+                 migration_interval: int = 10,
+                 num_migrants: int = 2,
+                 trainer_kwargs: Optional[dict] = None,
+                 seed: Optional[int] = None,
+                 poll_interval: float = 1.0,
+                 curriculum: Optional[dict] = None,
+                 monitor: Optional[dict] = None):
+        self.config_path = config_path
+        self.game_spec = game_spec
+        self.evaluator = evaluator
+        self.num_islands = num_islands
+        self.island_pop_size = island_pop_size
+        self.migration_interval = migration_interval
+        self.num_migrants = num_migrants
+        self.trainer_kwargs = trainer_kwargs or {}
+        self.seed = seed
+        # How often run() checks that every island process is still alive
+        self.poll_interval = poll_interval
+        self.curriculum = curriculum
+        self.monitor = monitor
+
+        self.island_results: List[dict] = []
+
+    def run(self, generations: int):
+        """Evolve all islands; returns (best genome, merged StatisticsReporter)."""
+        inboxes = [mp.Queue() for _ in range(self.num_islands)]
+        results = mp.Queue()
+        workers = []
+        for i in range(self.num_islands):
+            p = mp.Process(
+                target=_run_island,
+                args=(i, self, generations, inboxes[i], inboxes[(i + 1) % self.num_islands], results),
+                daemon=True
+            )
+            p.start()
+            workers.append(p)
+
+        received = {}
+        try:
+            while len(received) < len(workers):
+                try:
+                    result = results.get(timeout=self.poll_interval)
+                except queue.Empty:
+                    # A killed island never reports; don't wait for it forever
+                    for i, p in enumerate(workers):
+                        if i not in received and p.exitcode not in (None, 0):
+                            raise IslandError(f"Island {i} exited with code {p.exitcode}")
+                    continue
+                if 'error' in result:
+                    raise IslandError(f"Island {result['index']} failed:\n{result['error']}")
+                received[result['index']] = result
+        finally:
+            if len(received) < len(workers):
+                for p in workers:
+                    if p.is_alive():
+                        p.terminate()
+            for p in workers:
+                p.join()
+        self.island_results = list(received.values())
+        self.island_results.sort(key=lambda r: r['index'])
+
+        best = max((r['best'] for r in self.island_results), key=lambda g: g.fitness)
+        return best, merge_statistics([r['stats'] for r in self.island_results])
+
+
+def _run_island(index: int, model: IslandModel, generations: int, inbox, outbox, results) -> None:
+    try:
+        _evolve_island(index, model, generations, inbox, outbox, results)
+    except BaseException:
+        results.put({'index': index, 'error': traceback.format_exc()})
+    finally:
+        # Tell the next island not to wait for migrants from this one any more
+        outbox.put(None)
+        # Migrants left in the pipe at the end are not needed; don't block exit on them
+        outbox.cancel_join_thread()
+
+
+def _evolve_island(index: int, model: IslandModel, generations: int, inbox, outbox, results) -> None:
+    # Islands must not share the parent's random stream after fork
+    random.seed(None if model.seed is None else f'island-{model.seed}-{index}')
+    trainer = NEATTrainer(
+        config_path=model.config_path,
+        game_train=SnakeGame(*model.game_spec),
+        game_play=SnakeGame(*model.game_spec),
+        evaluator=model.evaluator,
+        pop_size=model.island_pop_size,
+        **model.trainer_kwargs
+    )
+    pop = trainer.pop
+    curriculum = trainer.enable_curriculum(**model.curriculum) if model.curriculum else None
+
+    # Per-generation console output and checkpoints stay with the main experiment
+    for r in list(pop.reporters.reporters):
+        if isinstance(r, (StdOutReporter, Checkpointer)):
+            pop.reporters.remove(r)
+    stats = next(r for r in pop.reporters.reporters if isinstance(r, StatisticsReporter))
+    monitor = None
+    if model.monitor is not None:
+        # Over HTTP even when the server runs in the parent: its loop thread is not forked along
+        monitor = MonitorReporter(f"{model.monitor['name']}/island-{index}", HttpPublisher(model.monitor['url']),
+                                  trainer, total_generations=generations)
+        pop.add_reporter(monitor)
+
+    start = time.time()
+    done = 0
+    migration = 0
+    neighbour_stopped = False
+    while done < generations:
+        n = min(model.migration_interval, generations - done)
+        before = pop.generation
+        pop.run(trainer.eval_genomes, n)
+        done += n
+        best = pop.best_genome
+        print(f'Island {index}: generation {pop.generation}, best fitness {best.fitness:.2f}')
+
+        # Fitness threshold reached: pop.run stopped without producing a new generation
+        if pop.generation - before < n:
+            break
+
+        if done < generations:
+            outbox.put((migration, stats.best_unique_genomes(model.num_migrants)))
+            if not neighbour_stopped:
+                neighbour_stopped = _receive_migrants(pop, inbox, migration)
+            migration += 1
+
+    trainer.close()
+    if monitor is not None:
+        monitor.finish()
+        monitor.publish.flush()
+    results.put({
+        'index': index,
+        'best': pop.best_genome,
+        'stats': stats,
+        'generations': pop.generation,
+        'wall_time': time.time() - start,
+        'curriculum': curriculum.finish() if curriculum is not None else None
+    })
+
+
+def _receive_migrants(pop, inbox, migration: int) -> bool:
+    """Swap in the neighbour's migrants for round `migration`; True once the neighbour has stopped."""
+    while True:
+        message = inbox.get()
+        if message is None:
+            return True
+        sent_in, migrants = message
+        if sent_in == migration:
+            break
+
+    # Replace random offspring; elites carried over from the last generation keep their place
+    offspring = [k for k, g in pop.population.items() if g.fitness is None]
+    random.shuffle(offspring)
+    for old_key, migrant in zip(offspring, migrants):
+        del pop.population[old_key]
+        new_key = next(pop.reproduction.genome_indexer)
+        # Hidden node ids come from another island's indexer, so re-key them locally
+        pop.population[new_key] = remap_genome(migrant, pop.config, key=new_key)
+        pop.reproduction.ancestors[new_key] = tuple()
+    pop.species.speciate(pop.config, pop.population, pop.generation)
+    return False
+
+
+def merge_statistics(island_stats: List[StatisticsReporter]) -> StatisticsReporter:
+    """Combine per-island statistics generation by generation, keeping species ids distinct."""
+    merged = StatisticsReporter()
+    offsets = []
+    offset = 0
+    for stats in island_stats:
+        offsets.append(offset)
+        sids = [sid for gen in stats.generation_statistics for sid in gen]
+        offset += max(sids, default=0)
+
+    num_generations = max(len(s.most_fit_genomes) for s in island_stats)
+    for g in range(num_generations):
+        bests = [s.most_fit_genomes[g] for s in island_stats if g < len(s.most_fit_genomes)]
+        merged.most_fit_genomes.append(max(bests, key=lambda genome: genome.fitness))
+
+        gen_stats = {}
+        for stats, off in zip(island_stats, offsets):
+            if g < len(stats.generation_statistics):
+                for sid, members in stats.generation_statistics[g].items():
+                    gen_stats[sid + off] = members
+        merged.generation_statistics.append(gen_stats)
+    return merged
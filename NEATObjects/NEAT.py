@@ -1,18 +1,36 @@
+import os
 import pickle
+import queue
 import neat
 import json
 import math
-from typing import Optional, List
+import random
+import time
+import warnings
+from itertools import count
+from multiprocessing import Pool
+from typing import Dict, Optional, List, Sequence
 
 from neat.reporting import StdOutReporter
 from neat.statistics import StatisticsReporter
 from neat.checkpoint import Checkpointer
 from neat.nn import FeedForwardNetwork
-from GameObjects.Snake import SnakeGame
+from GameObjects.Snake import SnakeGame, BoardBatch
 
 from GameObjects.Snake import UP, DOWN, LEFT, RIGHT
 
 from InitialArchitectureObjects.InitalArchitecture import InitialArchitecture
+from NEATObjects.ActivationCache import ActivationCache, CacheStats
+from NEATObjects.Episode import TrainingEpisode, dist_to_apple
+from NEATObjects.Racing import race_episodes
+from NEATObjects.NetOptimizer import optimize_network
+from NEATObjects.Policy import export_policy
+from NEATObjects.VectorReproduction import VectorGenome, VectorizedReproduction
+from NEATObjects.TraceStore import TraceRecorder
+from NEATObjects.Profiling import ProfilingReporter, Timers, begin_task_profile, end_task_profile
+from NEATObjects.WorkerPool import EvaluationPool
+from NEATObjects.Curriculum import CurriculumReporter
+from NEATObjects.WarmStart import architecture_genome, remap_genome, seed_population
 
 class BalancedEvaluator:
     def __init__(self, apple_weight: float = 100.0, time_weight: float = 1.0):
@@ -52,6 +70,126 @@ EVALUATORS = {
     'apple_priority': ApplePriorityEvaluator
 }
 
+def run_episode(net, game: SnakeGame, max_steps: int, render: bool = False, record: bool = False):
+    """Drive `game` with `net` until done or `max_steps`; returns (steps, recorded states)."""
+    dirs = [UP, DOWN, LEFT, RIGHT]
+    steps = 0
+    states = []
+
+    while steps < max_steps and not game.done:
+        # Sensors (+ normalized vector-to-apple), length == config.num_inputs
+        inputs = game.get_inputs()
+
+        # Activate and mask reverse
+        outputs = net.activate(inputs)
+        curr_i = dirs.index(game.snake.direction)
+        outputs[curr_i ^ 1] = -float('inf')
+
+        # Select action and step
+        action = int(outputs.index(max(outputs)))
+        game.step(action, render=render)
+
+        # Record state for replay
+        if record:
+            states.append({
+                'snake':  list(game.snake.body),
+                'apples': list(game.apples),
+                'score':  game.score
+            })
+        steps += 1
+
+    return steps, states
+
+def match_inputs(config, game: SnakeGame) -> None:
+    """Size the config's inputs for `game`; board inputs are fixed by the grid, rays by the config."""
+    if game.sensor_mode == 'board':
+        genome_config = config.genome_config
+        genome_config.num_inputs = game.num_inputs
+        genome_config.input_keys = [-i - 1 for i in range(genome_config.num_inputs)]
+
+# Per-process scoring context, set once by the pool initializer
+_scoring_ctx = {}
+
+def _init_scoring_worker(config, game_spec, evaluator, max_steps, seeds) -> None:
+    # Building the game places its first apple from the global stream; serial scoring
+    # runs this in the training process, where that stream is NEAT's
+    state = random.getstate()
+    game = SnakeGame(*game_spec)
+    random.setstate(state)
+    _scoring_ctx.update(
+        config=config,
+        game=game,
+        evaluator=evaluator,
+        max_steps=max_steps,
+        seeds=seeds
+    )
+
+def _score_in_worker(genome) -> float:
+    net = FeedForwardNetwork.create(genome, _scoring_ctx['config'])
+    game = _scoring_ctx['game']
+    total = 0.0
+    for seed in _scoring_ctx['seeds']:
+        game.seed(seed)
+        game.reset()
+        steps, _ = run_episode(net, game, _scoring_ctx['max_steps'])
+        total += _scoring_ctx['evaluator'].evaluate(game.score, steps)
+    return total / len(_scoring_ctx['seeds'])
+
+# Per-process training context for parallel evaluation
+_training_ctx = {}
+
+def _init_training_worker(config, cache_size: int, cache_decimals: Optional[int],
+                          optimize: bool = False, timers: bool = False,
+                          profile_interval: float = 0.005) -> None:
+    _training_ctx.update(config=config, cache_size=cache_size, cache_decimals=cache_decimals,
+                         optimize=optimize, games={}, timers=Timers() if timers else None,
+                         profile_interval=profile_interval)
+
+def _evaluate_in_worker(task) -> dict:
+    """Run one training episode and report fitness, apples, busy seconds and optional extras."""
+    genome, game_spec, max_steps, record, profile_mode = task
+    start = time.perf_counter()
+    profile = begin_task_profile(profile_mode, _training_ctx['profile_interval'], root='_evaluate_in_worker')
+    timers = _training_ctx['timers']
+    games = _training_ctx['games']
+    if game_spec not in games:
+        games[game_spec] = SnakeGame(*game_spec)
+        if timers is not None:
+            timers.instrument(games[game_spec], 'get_state')
+            timers.instrument(games[game_spec], 'step')
+    game = games[game_spec]
+
+    if _training_ctx['optimize']:
+        net, _ = optimize_network(genome, _training_ctx['config'])
+    else:
+        net = FeedForwardNetwork.create(genome, _training_ctx['config'])
+    if _training_ctx['cache_size']:
+        net = ActivationCache(net, _training_ctx['cache_size'], _training_ctx['cache_decimals'])
+    if timers is not None:
+        timers.instrument(net, 'activate')
+    episode = TrainingEpisode(net, game, max_steps)
+    if record:
+        episode.trace = []
+    episode.advance(max_steps)
+
+    result = {
+        'fitness': episode.fitness,
+        'score': game.score,
+        'busy': time.perf_counter() - start,
+        'steps': episode.step,
+        'cache': None,
+        'trace': episode.trace,
+        'death_cause': episode.death_cause,
+        'timers': None,
+        'profile': end_task_profile(profile)
+    }
+    if isinstance(net, ActivationCache):
+        result['cache'] = (net.hits, net.misses, net.evictions)
+    if timers is not None:
+        result['timers'] = timers.snapshot()
+        timers.reset()
+    return result
+
 class NEATTrainer:
     def __init__(
         self,
@@ -59,7 +197,25 @@ class NEATTrainer:
         game_train: SnakeGame,
         game_play: SnakeGame,
         evaluator,
-        initial_arch: Optional[InitialArchitecture] = None
+        initial_arch: Optional[InitialArchitecture] = None,
+        warm_start_genome: Optional[str] = None,
+        warm_start_jitter: float = 0.1,
+        warm_start_input_map: Optional[Dict[int, int]] = None,
+        activation_cache_size: int = 0,
+        activation_cache_decimals: Optional[int] = 6,
+        racing: bool = False,
+        racing_round_steps: int = 50,
+        pop_size: Optional[int] = None,
+        num_workers: int = 1,
+        optimize_networks: bool = False,
+        trace_dir: Optional[str] = None,
+        trace_sample_rate: float = 0.05,
+        task_timeout: float = 0.0,
+        timeout_fitness: float = -10.0,
+        max_tasks_per_worker: int = 0,
+        max_worker_rss_mb: float = 0.0,
+        vectorized_reproduction: bool = False,
+        build_population: bool = True
     ):
         # Load NEAT config
         self.config = neat.Config(
@@ -69,9 +225,22 @@ class NEATTrainer:
             neat.DefaultStagnation,
             config_path
         )
-
-        # Create population with reporters
-        self.pop = neat.Population(self.config)
+        if pop_size:
+            self.config.pop_size = pop_size
+        if vectorized_reproduction:
+            # Same config sections and parameters; attribute mutation is batched per generation
+            self.config.genome_type = VectorGenome
+            self.config.reproduction_type = VectorizedReproduction
+        match_inputs(self.config, game_train)
+
+        # Create population with reporters. Without build_population (the genomes evolve
+        # elsewhere, e.g. on islands) it stays empty and only carries the reporters.
+        if build_population:
+            self.pop = neat.Population(self.config)
+        else:
+            species = self.config.species_set_type(self.config.species_set_config, None)
+            self.pop = neat.Population(self.config, initial_state=({}, species, 0))
+            species.reporters = self.pop.reporters
         self.pop.add_reporter(StdOutReporter(True))
         self.pop.add_reporter(StatisticsReporter())
         self.pop.add_reporter(Checkpointer(
@@ -82,98 +251,326 @@ class NEATTrainer:
         self.game_train = game_train
         self.game_play  = game_play
 
-        #num_inputs = len(game_train.get_state())
-        #self.config.genome_config.num_inputs  = num_inputs
-
         # Instantiate evaluator
         self.evaluator = evaluator
 
-    def eval_genomes(self, genomes, config) -> None:
-        dirs = [UP, DOWN, LEFT, RIGHT]
+        # Episode budget per genome and apples eaten in the last evaluated generation
+        self.max_steps = 1000
+        self.last_scores = {}
+        # Game steps simulated across all evaluations (for throughput monitoring)
+        self.steps_evaluated = 0
+
+        # Optional sampled episode traces (memory-mapped, see TraceStore)
+        self.trace_recorder = None
+        if trace_dir:
+            self.trace_recorder = TraceRecorder(trace_dir,
+                                                len(self.config.genome_config.input_keys),
+                                                len(self.config.genome_config.output_keys),
+                                                sample_rate=trace_sample_rate)
+
+        # Optional profiling (see enable_profiling); profile_mode is set for profiled generations
+        self.timers = None
+        self.profiler = None
+        self.profile_mode = None
+
+        # Parallel evaluation pool, created on first use. Genomes whose evaluation times out
+        # (or keeps crashing its worker) get `timeout_fitness`; workers are replaced after
+        # `max_tasks_per_worker` tasks or above `max_worker_rss_mb` (0 disables each).
+        self.num_workers = num_workers
+        self._pool = None
+        self.task_timeout = task_timeout
+        self.timeout_fitness = timeout_fitness
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.max_worker_rss_mb = max_worker_rss_mb
+        self.worker_events: List[dict] = []
+        # Filled by the pool's manager thread, reported from the training thread
+        self._pending_worker_events: queue.SimpleQueue = queue.SimpleQueue()
+        self.utilization_log: List[float] = []
+
+        # Racing evaluation: drop genomes that provably can't reach the survival cutoff
+        self.racing = racing
+        self.racing_round_steps = racing_round_steps
+        self.racing_log: List[dict] = []
+
+        # Simplified networks, cached per genome for the current generation
+        self.optimize_networks = optimize_networks
+        self._net_cache = {}
+        self.net_report = {}
+
+        # Activation memoization only holds for stateless (feed-forward) networks
+        self.activation_cache_size = activation_cache_size
+        self.activation_cache_decimals = activation_cache_decimals
+        if activation_cache_size and not self.config.genome_config.feed_forward:
+            warnings.warn("Activation cache disabled: networks are recurrent.")
+            self.activation_cache_size = 0
+        self.cache_stats = CacheStats()
+        self.generation_cache_stats = CacheStats()
+        self.cache_log: List[dict] = []
+
+        # Warm start: a saved genome wins over the architecture's explicit connections
+        self.initial_arch = initial_arch
+        template = None
+        if warm_start_genome:
+            template = remap_genome(self.load_genome(warm_start_genome), self.config,
+                                    input_map=warm_start_input_map)
+        elif initial_arch is not None and initial_arch.connections:
+            template = architecture_genome(initial_arch, self.config, input_map=warm_start_input_map)
+        if template is not None and build_population:
+            seed_population(self.pop, template, jitter=warm_start_jitter)
 
+    def eval_genomes(self, genomes, config) -> None:
+        self.last_scores = {}
+        self.generation_cache_stats = CacheStats()
+        self._net_cache = {}
+        self.net_report = {}
+        if self.racing:
+            self._eval_genomes_racing(genomes, config)
+        elif self.num_workers > 1:
+            self._eval_genomes_parallel(genomes, config)
+        else:
+            self._eval_genomes_serial(genomes, config)
+        if self.trace_recorder is not None:
+            self.trace_recorder.flush()
+        self.report_cache_stats()
+
+    def _eval_genomes_serial(self, genomes, config) -> None:
         for _, genome in genomes:
-            net = FeedForwardNetwork.create(genome, config)
-            genome.fitness = 0.0
-            self.game_train.reset()
-
-            prev_dist = self._dist_to_apple(self.game_train)
-            max_steps = 1000
-
-            for step in range(max_steps):
-                if self.game_train.done:
-                    genome.fitness -= 1.0  # death penalty
-                    break
-
-                # Base sensor state
-                state = self.game_train.get_state()  # sensor vector
-
-                # Append normalized delta-to-apple
-                hx, hy = self.game_train.snake.head
-                ax, ay = self.game_train.apples[0]
-                dx = (ax - hx) / (self.game_train.grid_width  - 1)
-                dy = (ay - hy) / (self.game_train.grid_height - 1)
-                inputs = state + [dx, dy]
-
-                outputs = net.activate(inputs)
-
-                # Prevent immediate reverse
-                curr_i = dirs.index(self.game_train.snake.direction)
-                outputs[curr_i ^ 1] = -float('inf')
-
-                action = int(outputs.index(max(outputs)))
-                self.game_train.step(action)
-
-                # Shaped reward: proximity bonus
-                curr_dist = self._dist_to_apple(self.game_train)
-                genome.fitness += (prev_dist - curr_dist) * 0.1
-                prev_dist = curr_dist
-
-                # Bonus on apple
-                if self.game_train.score > 0:
-                    genome.fitness += 5.0
-
-            # Time penalty
-            genome.fitness -= 0.001 * step
+            net = self._make_net(genome, config)
+            episode = TrainingEpisode(net, self.game_train, self.max_steps)
+            if self._should_trace():
+                episode.trace = []
+            episode.advance(self.max_steps)
+            genome.fitness = episode.fitness
+            self.last_scores[genome.key] = self.game_train.score
+            self.steps_evaluated += episode.step
+            self._record_trace(genome, episode)
+            self._collect_cache_stats(net, self.generation_cache_stats)
+        self._print_net_report()
+
+    def _eval_genomes_parallel(self, genomes, config) -> None:
+        start = time.perf_counter()
+        spec = self.game_spec()
+        tasks = [(genome, spec, self.max_steps, self._should_trace(), self.profile_mode)
+                 for _, genome in genomes]
+        results = self.get_pool().map(_evaluate_in_worker, tasks, chunksize=1)
+
+        busy = 0.0
+        for (_, genome), result in zip(genomes, results):
+            self.apply_worker_result(genome, result)
+            busy += result['busy']
+
+        # Every worker idles while the generation's slowest genomes finish
+        wall = time.perf_counter() - start
+        utilization = busy / (wall * self.num_workers) if wall > 0 else 0.0
+        self.utilization_log.append(utilization)
+        print(f'Worker utilization: {utilization:.1%} ({self.num_workers} workers, {wall:.2f} sec)')
+
+    def apply_worker_result(self, genome, result: dict) -> None:
+        self.report_worker_events()
+        genome.fitness = result['fitness']
+        self.last_scores[genome.key] = result['score']
+        self.steps_evaluated += result['steps']
+        if result['cache'] is not None:
+            for stats in (self.cache_stats, self.generation_cache_stats):
+                stats.add_counts(*result['cache'])
+        if result['timers'] is not None:
+            self.timers.add(result['timers'])
+        if result['profile'] is not None:
+            self.profiler.add_profile(result['profile'])
+        if result['trace'] is not None:
+            self.trace_recorder.record_episode(self.pop.generation, genome.key, result['trace'],
+                                               result['death_cause'], result['score'], result['fitness'])
+
+    def _should_trace(self) -> bool:
+        return self.trace_recorder is not None and self.trace_recorder.should_record()
+
+    def _record_trace(self, genome, episode: TrainingEpisode) -> None:
+        if episode.trace is not None:
+            self.trace_recorder.record_episode(self.pop.generation, genome.key, episode.trace,
+                                               episode.death_cause, episode.game.score, episode.fitness)
+
+    def game_spec(self, game: Optional[SnakeGame] = None):
+        """Constructor arguments of `game` (default: the training game, which curricula resize)."""
+        game = game or self.game_train
+        return (game.grid_width, game.grid_height, game.cell_size, game.game_mode, game.sensor_mode)
+
+    def get_pool(self) -> EvaluationPool:
+        if self._pool is None:
+            self._pool = EvaluationPool(
+                self.num_workers,
+                initializer=_init_training_worker,
+                initargs=(self.config, self.activation_cache_size,
+                          self.activation_cache_decimals, self.optimize_networks,
+                          self.timers is not None,
+                          self.profiler.interval if self.profiler is not None else 0.005),
+                task_timeout=self.task_timeout,
+                fallback=self._fallback_result,
+                max_tasks_per_worker=self.max_tasks_per_worker,
+                max_rss_mb=self.max_worker_rss_mb,
+                on_event=self._worker_event
+            )
+        return self._pool
+
+    def _fallback_result(self, args, reason: str) -> dict:
+        # Result for a genome whose evaluation never came back (see EvaluationPool)
+        genome = args[0][0]
+        return {
+            'fitness': self.timeout_fitness,
+            'score': 0,
+            'busy': self.task_timeout if reason == 'timeout' else 0.0,
+            'steps': 0,
+            'cache': None,
+            'trace': None,
+            'death_cause': reason,
+            'timers': None,
+            'profile': None,
+            'failed': reason,
+            'genome': genome.key
+        }
+
+    def _worker_event(self, kind: str, details: dict) -> None:
+        # Runs on the pool's manager thread: reporters are not thread-safe, so only queue it
+        self._pending_worker_events.put(dict(kind=kind, generation=self.pop.generation, time=time.time(),
+                                             **details))
+
+    def report_worker_events(self) -> None:
+        """Log and report the pool events queued since the last call."""
+        while True:
+            try:
+                event = self._pending_worker_events.get_nowait()
+            except queue.Empty:
+                return
+            self.worker_events.append(event)
+            self.pop.reporters.info(self._describe_worker_event(event))
+
+    def _describe_worker_event(self, details: dict) -> str:
+        kind = details['kind']
+        if kind == 'timeout':
+            message = (f"Evaluation pool: genome {details['task']} timed out after {details['seconds']} sec, "
+                       f"worker {details['pid']} replaced; fitness set to {self.timeout_fitness}")
+        elif kind == 'crash':
+            message = (f"Evaluation pool: worker {details['pid']} died (exit code {details['exitcode']}) "
+                       f"while evaluating genome {details['task']}; respawned")
+        else:
+            message = (f"Evaluation pool: recycling worker {details['pid']} "
+                       f"({details['reason']} limit, {details['rss_mb']} MB RSS)")
+        return message
+
+    def close(self) -> None:
+        if self.trace_recorder is not None:
+            self.trace_recorder.close()
+            self.trace_recorder = None
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        self.report_worker_events()
+
+    def _eval_genomes_racing(self, genomes, config) -> None:
+        # Every genome needs its own game so episodes can advance in interleaved rounds
+        episodes = {}
+        spec = self.game_spec()
+        if self.game_train.sensor_mode == 'board':
+            # All boards in one array instead of one allocation per genome
+            games = BoardBatch(len(genomes), *spec[:4]).games
+        else:
+            games = [SnakeGame(*spec) for _ in genomes]
+        for (_, genome), game in zip(genomes, games):
+            self._instrument_game(game)
+            episodes[genome.key] = TrainingEpisode(self._make_net(genome, config), game, self.max_steps)
+            if self._should_trace():
+                episodes[genome.key].trace = []
+
+        race = race_episodes(
+            [g for _, g in genomes], episodes,
+            genome_to_species=self.pop.species.genome_to_species,
+            survival_threshold=config.reproduction_config.survival_threshold,
+            elitism=config.reproduction_config.elitism,
+            round_steps=self.racing_round_steps
+        )
+        for _, genome in genomes:
+            episode = episodes[genome.key]
+            genome.fitness = episode.fitness
+            self.last_scores[genome.key] = episode.game.score
+            self.steps_evaluated += episode.step - episode.fast_forwarded
+            self._record_trace(genome, episode)
+            self._collect_cache_stats(episode.net, self.generation_cache_stats)
+        self._print_net_report()
+
+        self.racing_log.append(race)
+        print(f"Racing: dropped {race['dropped']}/{len(genomes)} genomes early, "
+              f"finished {race['looped']} looping, skipped {race['saved_fraction']:.1%} of the step budget")
 
     def learn(self, generations: int):
         return self.pop.run(self.eval_genomes, generations)
 
-    def play(self, genome, max_steps: int = 1000, render: bool = True, states_path: str = None):
+    def resume(self, pop: neat.Population, best_genome=None) -> None:
+        """Continue from a restored population, keeping this trainer's reporters."""
+        for reporter in self.pop.reporters.reporters:
+            pop.add_reporter(reporter)
+        # The pickled species set still points at the reporters of the run that saved it
+        pop.species.reporters = pop.reporters
+        # restore_checkpoint starts genome keys at 1 again; offspring would reuse the keys of
+        # surviving elites. The newest offspring hold the highest keys, so an unbroken run
+        # continues right after them.
+        pop.reproduction.genome_indexer = count(max(pop.population) + 1)
+        # Population.run only tracks the best genome of the generations it runs itself. An elite
+        # that survived into the restored population is the same genome, as in an unbroken run.
+        if best_genome is not None:
+            best_genome = pop.population.get(best_genome.key, best_genome)
+        pop.best_genome = best_genome
+        self.pop = pop
+        self._instrument_population()
+
+    def set_grid(self, grid_width: int, grid_height: int, max_steps: Optional[int] = None) -> None:
+        # get_state's sensor layout does not depend on the grid, so the population carries over
+        if self.game_train.sensor_mode == 'board':
+            raise ValueError("Board inputs depend on the grid size; the grid cannot change during training.")
+        self.game_train.resize(grid_width, grid_height)
+        if max_steps is not None:
+            self.max_steps = max_steps
+
+    def enable_curriculum(self, stages, fitness_threshold: Optional[float] = None,
+                          score_threshold: Optional[int] = None) -> CurriculumReporter:
+        curriculum = CurriculumReporter(self, stages, fitness_threshold, score_threshold)
+        self.pop.add_reporter(curriculum)
+        return curriculum
+
+    def enable_profiling(self, directory: str, mode: Optional[str] = None,
+                         generations: Optional[Sequence[int]] = None, timers: bool = False,
+                         interval: float = 0.005) -> ProfilingReporter:
+        # Must run before the worker pool is created so workers are started with timers
+        profiler = ProfilingReporter(self, directory, mode, generations, timers, interval)
+        self.profiler = profiler
+        self.pop.add_reporter(profiler)
+        return profiler
+
+    def enable_timers(self) -> None:
+        self.timers = Timers()
+        self._instrument_game(self.game_train)
+        self._instrument_population()
+
+    def _instrument_population(self) -> None:
+        if self.timers is not None:
+            self.timers.instrument(self.pop.species, 'speciate')
+            self.timers.instrument(self.pop.reproduction, 'reproduce')
+
+    def _instrument_game(self, game: SnakeGame) -> None:
+        if self.timers is not None:
+            self.timers.instrument(game, 'get_state')
+            self.timers.instrument(game, 'step')
+
+    def play(self, genome, max_steps: int = 1000, render: bool = True, states_path: str = None, seed: Optional[int] = None):
         # Create network
-        net = FeedForwardNetwork.create(genome, self.config)
+        net = self._make_net(genome, self.config)
+        self.game_play.seed(seed)
         self.game_play.reset()
 
-        dirs = [UP, DOWN, LEFT, RIGHT]
-        steps = 0
-        states = []
-
-        while steps < max_steps and not self.game_play.done:
-            # Base sensor inputs
-            state = self.game_play.get_state()  # length N
+        # States are only recorded when they are going to be written
+        steps, states = run_episode(net, self.game_play, max_steps,
+                                    render=render, record=bool(states_path))
 
-            # Append normalized vector-to-apple (2 values)
-            hx, hy = self.game_play.snake.head
-            ax, ay = self.game_play.apples[0]
-            dx = (ax - hx) / (self.game_play.grid_width  - 1)
-            dy = (ay - hy) / (self.game_play.grid_height - 1)
-            inputs = state + [dx, dy]            # length N+2 == config.num_inputs
-
-            # Activate and mask reverse
-            outputs = net.activate(inputs)
-            curr_i = dirs.index(self.game_play.snake.direction)
-            outputs[curr_i ^ 1] = -float('inf')
-
-            # Select action and step
-            action = int(outputs.index(max(outputs)))
-            self.game_play.step(action, render=render)
-
-            # Record state for replay
-            states.append({
-                'snake':  list(self.game_play.snake.body),
-                'apples': list(self.game_play.apples),
-                'score':  self.game_play.score
-            })
-            steps += 1
+        self._collect_cache_stats(net)
 
         # Optionally save states
         if states_path:
@@ -183,10 +580,61 @@ class NEATTrainer:
         # Return final performance
         return self.evaluator.evaluate(self.game_play.score, steps)
 
+    def score_genomes(self, genomes, max_steps: int = 1000, seeds: Sequence[int] = (0,),
+                      num_workers: Optional[int] = None) -> List[float]:
+        """Record-free scoring of many genomes, each averaged over the same seeded games."""
+        ctx = (self.config, self.game_spec(self.game_play), self.evaluator, max_steps, tuple(seeds))
+        num_workers = num_workers or os.cpu_count() or 1
+
+        if num_workers <= 1 or len(genomes) <= 1:
+            _init_scoring_worker(*ctx)
+            return [_score_in_worker(g) for g in genomes]
+
+        chunksize = max(1, len(genomes) // (num_workers * 4))
+        with Pool(num_workers, initializer=_init_scoring_worker, initargs=ctx) as pool:
+            return pool.map(_score_in_worker, genomes, chunksize=chunksize)
+
+    def _make_net(self, genome, config):
+        if self.optimize_networks:
+            cached = self._net_cache.get(genome.key)
+            if cached is not None and cached[0] is genome:
+                net = cached[1]
+            else:
+                net, report = optimize_network(genome, config)
+                self._net_cache[genome.key] = (genome, net)
+                for k, v in report.items():
+                    self.net_report[k] = self.net_report.get(k, 0) + v
+        else:
+            net = FeedForwardNetwork.create(genome, config)
+        if self.activation_cache_size:
+            net = ActivationCache(net, self.activation_cache_size, self.activation_cache_decimals)
+        if self.timers is not None:
+            self.timers.instrument(net, 'activate')
+        return net
+
+    def _print_net_report(self) -> None:
+        if self.net_report:
+            r = self.net_report
+            print(f"Network optimization: removed {r['nodes_removed']}/{r['nodes']} nodes, "
+                  f"{r['connections_removed']}/{r['connections']} connections")
+
+    def report_cache_stats(self) -> None:
+        """Log and print the generation's activation cache hit rate, then start counting afresh."""
+        if not self.activation_cache_size:
+            return
+        stats = self.generation_cache_stats
+        self.cache_log.append(stats.as_dict())
+        print(f'Activation cache: {stats.hit_rate:.1%} hit rate '
+              f'({stats.hits} hits, {stats.misses} misses, {stats.evictions} evictions)')
+        self.generation_cache_stats = CacheStats()
+
+    def _collect_cache_stats(self, net, *extra: CacheStats) -> None:
+        if isinstance(net, ActivationCache):
+            for stats in (self.cache_stats,) + extra:
+                stats.add(net)
+
     def _dist_to_apple(self, game: SnakeGame) -> float:
-        hx, hy = game.snake.head
-        ax, ay = game.apples[0]
-        return math.hypot(hx - ax, hy - ay)
+        return dist_to_apple(game)
     
     def return_genomes(self) -> List[neat.DefaultGenome]:
         genomes = list(self.pop.population)
@@ -201,4 +649,11 @@ class NEATTrainer:
     def load_genome(self, path: str):
         with open(path, 'rb') as f:
             return pickle.load(f)
+
+    def save_policy(self, genome, path: str) -> str:
+        """Export `genome` in the portable .npz policy format (see Policy.load_policy)."""
+        return export_policy(genome, self.config, path, architecture=self.initial_arch,
+                             metadata={'sensor_mode': self.game_train.sensor_mode,
+                                       'grid': [self.game_train.grid_width, self.game_train.grid_height],
+                                       'game_mode': self.game_train.game_mode})
         
\ No newline at end of file
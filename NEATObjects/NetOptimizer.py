@@ -0,0 +1,108 @@
+import random
+from typing import Tuple
+
+from neat.activations import identity_activation
+from neat.aggregations import sum_aggregation
+from neat.nn import FeedForwardNetwork
+
+
+def optimize_network(genome, config) -> Tuple[FeedForwardNetwork, dict]:
+    """
+    Build a FeedForwardNetwork for `genome` with work that cannot change its outputs removed.
+
+    Starting from FeedForwardNetwork.create (which already skips disabled connections and
+    nodes that do not feed an output), this
+      - folds single-input identity nodes into their consumers when those sum their inputs,
+      - drops zero-weight links into summing nodes and merges parallel links,
+      - removes evaluated nodes whose value never reaches an evaluated output.
+    Returns the network and a report of the nodes and connections removed.
+    """
+    genome_cfg = config.genome_config
+    outputs = set(genome_cfg.output_keys)
+    net = FeedForwardNetwork.create(genome, config)
+
+    order = [node for node, *_ in net.node_evals]
+    evals = {node: [act, agg, bias, response, list(links)]
+             for node, act, agg, bias, response, links in net.node_evals}
+
+    # Fold pass-through nodes: v = bias + response * w * v_src feeds straight into summing consumers
+    folded = 0
+    for node in order:
+        if node in outputs:
+            continue
+        act, agg, bias, response, links = evals[node]
+        if act is not identity_activation or len(links) != 1:
+            continue
+        consumers = [c for c in evals if any(i == node for i, _ in evals[c][4])]
+        if any(evals[c][1] is not sum_aggregation for c in consumers):
+            continue
+
+        (src, w), = links
+        for c in consumers:
+            entry = evals[c]
+            new_links = []
+            for i, w2 in entry[4]:
+                if i == node:
+                    entry[2] += entry[3] * w2 * bias
+                    new_links.append((src, w2 * response * w))
+                else:
+                    new_links.append((i, w2))
+            entry[4] = new_links
+        del evals[node]
+        folded += 1
+
+    # Zero-weight and parallel links into summing nodes
+    for entry in evals.values():
+        if entry[1] is not sum_aggregation:
+            continue
+        merged = {}
+        for i, w in entry[4]:
+            merged[i] = merged.get(i, 0.0) + w
+        entry[4] = [(i, w) for i, w in merged.items() if w != 0.0]
+
+    # Dead nodes: evaluated, but nothing on a path to an output reads them
+    live = set()
+    stack = [o for o in outputs if o in evals]
+    while stack:
+        node = stack.pop()
+        if node in live:
+            continue
+        live.add(node)
+        stack.extend(i for i, _ in evals[node][4] if i in evals)
+
+    node_evals = [(node, *evals[node][:4], evals[node][4]) for node in order if node in live]
+    optimized = FeedForwardNetwork(genome_cfg.input_keys, genome_cfg.output_keys, node_evals)
+
+    enabled = sum(1 for cg in genome.connections.values() if cg.enabled)
+    kept_nodes = len(node_evals)
+    kept_connections = sum(len(links) for *_, links in node_evals)
+    report = {
+        'nodes': len(genome.nodes),
+        'connections': enabled,
+        'nodes_removed': len(genome.nodes) - kept_nodes,
+        'connections_removed': enabled - kept_connections,
+        'nodes_folded': folded
+    }
+    return optimized, report
+
+
+def verify_equivalence(genome, config, samples: int = 200, tol: float = 1e-9, seed: int = 0) -> float:
+    """
+    Compare optimized and reference networks on random inputs; returns the largest deviation.
+
+    Raises AssertionError when any output differs by more than `tol` (relative to its magnitude).
+    """
+    rng = random.Random(seed)
+    reference = FeedForwardNetwork.create(genome, config)
+    optimized, _ = optimize_network(genome, config)
+    num_inputs = len(config.genome_config.input_keys)
+
+    worst = 0.0
+    for _ in range(samples):
+        inputs = [rng.uniform(-1.0, 1.0) for _ in range(num_inputs)]
+        for a, b in zip(reference.activate(inputs), optimized.activate(inputs)):
+            diff = abs(a - b)
+            worst = max(worst, diff)
+            assert diff <= tol * max(1.0, abs(a)), \
+                f"Genome {genome.key}: optimized output {b!r} differs from reference {a!r}"
+    return worst
@@ -0,0 +1,222 @@
+import json
+import math
+from functools import reduce
+from operator import mul
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# Everything needed at load time lives here: loading and running a policy never imports neat.
+
+FORMAT_NAME = 'neat-snake-policy'
+FORMAT_VERSION = 1
+
+
+# Same definitions as neat.activations / neat.aggregations, so outputs match FeedForwardNetwork exactly
+def _sigmoid(z):
+    z = max(-60.0, min(60.0, 5.0 * z))
+    return 1.0 / (1.0 + math.exp(-z))
+
+
+def _tanh(z):
+    z = max(-60.0, min(60.0, 2.5 * z))
+    return math.tanh(z)
+
+
+def _sin(z):
+    z = max(-60.0, min(60.0, 5.0 * z))
+    return math.sin(z)
+
+
+def _gauss(z):
+    z = max(-3.4, min(3.4, z))
+    return math.exp(-5.0 * z**2)
+
+
+def _softplus(z):
+    z = max(-60.0, min(60.0, 5.0 * z))
+    return 0.2 * math.log(1 + math.exp(z))
+
+
+def _inv(z):
+    try:
+        z = 1.0 / z
+    except ArithmeticError:
+        return 0.0
+    else:
+        return z
+
+
+def _mean(x):
+    return sum(map(float, x)) / len(x)
+
+
+def _median(x):
+    x = sorted(x)
+    n = len(x)
+    if n <= 2:
+        return _mean(x)
+    if n % 2 == 1:
+        return x[n // 2]
+    return (x[n // 2 - 1] + x[n // 2]) / 2.0
+
+
+ACTIVATIONS = {
+    'sigmoid': _sigmoid,
+    'tanh': _tanh,
+    'sin': _sin,
+    'gauss': _gauss,
+    'relu': lambda z: z if z > 0.0 else 0.0,
+    'softplus': _softplus,
+    'identity': lambda z: z,
+    'clamped': lambda z: max(-1.0, min(1.0, z)),
+    'inv': _inv,
+    'log': lambda z: math.log(max(1e-7, z)),
+    'exp': lambda z: math.exp(max(-60.0, min(60.0, z))),
+    'abs': abs,
+    'hat': lambda z: max(0.0, 1 - abs(z)),
+    'square': lambda z: z ** 2,
+    'cube': lambda z: z ** 3
+}
+
+AGGREGATIONS = {
+    'product': lambda x: reduce(mul, x, 1.0),
+    'sum': sum,
+    'max': max,
+    'min': min,
+    'maxabs': lambda x: max(x, key=abs),
+    'median': _median,
+    'mean': _mean
+}
+
+
+class Policy:
+    """
+    Minimal feed-forward inference object built from the exported arrays.
+
+    Nodes are evaluated in the stored (topological) order with the same arithmetic as
+    neat.nn.FeedForwardNetwork; `activate` is a drop-in replacement for it.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.meta = json.loads(str(arrays['meta']))
+        self.input_keys = arrays['input_keys'].tolist()
+        self.output_keys = arrays['output_keys'].tolist()
+        self.node_keys = arrays['node_keys'].tolist()
+        self.num_inputs = len(self.input_keys)
+
+        # Every key gets a slot in one flat value list; inputs come first
+        slots = {}
+        for key in self.input_keys + self.output_keys + self.node_keys:
+            slots.setdefault(key, len(slots))
+        self._values = [0.0] * len(slots)
+        self._output_slots = [slots[k] for k in self.output_keys]
+
+        activations = [ACTIVATIONS[name] for name in arrays['activation_names'].tolist()]
+        aggregations = [AGGREGATIONS[name] for name in arrays['aggregation_names'].tolist()]
+        offsets = arrays['link_offsets'].tolist()
+        sources = [slots[k] for k in arrays['link_sources'].tolist()]
+        weights = arrays['link_weights'].tolist()
+        self._evals = [
+            (slots[key], activations[act], aggregations[agg], bias, response,
+             list(zip(sources[offsets[i]:offsets[i + 1]], weights[offsets[i]:offsets[i + 1]])))
+            for i, (key, act, agg, bias, response) in enumerate(zip(
+                self.node_keys, arrays['node_activation'].tolist(), arrays['node_aggregation'].tolist(),
+                arrays['node_bias'].tolist(), arrays['node_response'].tolist()))
+        ]
+
+    def activate(self, inputs) -> List[float]:
+        if len(inputs) != self.num_inputs:
+            raise RuntimeError(f"Expected {self.num_inputs} inputs, got {len(inputs)}")
+        values = self._values
+        values[:self.num_inputs] = inputs
+        for slot, act, agg, bias, response, links in self._evals:
+            values[slot] = act(bias + response * agg([values[i] * w for i, w in links]))
+        return [values[i] for i in self._output_slots]
+
+
+def load_policy(path: str) -> Policy:
+    """Load an exported .npz policy; plain arrays only, nothing is unpickled."""
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {name: data[name] for name in data.files}
+    meta = json.loads(str(arrays['meta']))
+    if meta.get('format') != FORMAT_NAME or meta.get('version', 0) > FORMAT_VERSION:
+        raise ValueError(f"{path} is not a version {FORMAT_VERSION} {FORMAT_NAME} file.")
+    return Policy(arrays)
+
+
+def policy_arrays(genome, config, architecture=None, metadata: Optional[dict] = None) -> Dict[str, np.ndarray]:
+    """
+    Flatten a genome's expressed network into arrays: a topologically ordered node table
+    (key, activation/aggregation ids, bias, response), CSR-style incoming links per node
+    (source key, weight) and a JSON metadata record. `architecture` (InitialArchitecture)
+    adds the input/output ids of the architecture file.
+    """
+    from neat.graphs import feed_forward_layers
+
+    genome_cfg = config.genome_config
+    connections = [cg.key for cg in genome.connections.values() if cg.enabled]
+    layers = feed_forward_layers(genome_cfg.input_keys, genome_cfg.output_keys, connections)
+
+    activation_names: List[str] = []
+    aggregation_names: List[str] = []
+    node_keys, node_act, node_agg, node_bias, node_response = [], [], [], [], []
+    offsets, sources, weights = [0], [], []
+    for layer in layers:
+        for node in sorted(layer):
+            ng = genome.nodes[node]
+            for name, table in ((ng.activation, ACTIVATIONS), (ng.aggregation, AGGREGATIONS)):
+                if name not in table:
+                    raise ValueError(f"Node {node} uses '{name}', which the policy format does not support.")
+            if ng.activation not in activation_names:
+                activation_names.append(ng.activation)
+            if ng.aggregation not in aggregation_names:
+                aggregation_names.append(ng.aggregation)
+            node_keys.append(node)
+            node_act.append(activation_names.index(ng.activation))
+            node_agg.append(aggregation_names.index(ng.aggregation))
+            node_bias.append(ng.bias)
+            node_response.append(ng.response)
+            # Same link order as FeedForwardNetwork.create, so sums round identically
+            for inode, onode in connections:
+                if onode == node:
+                    sources.append(inode)
+                    weights.append(genome.connections[(inode, onode)].weight)
+            offsets.append(len(sources))
+
+    meta = {
+        'format': FORMAT_NAME,
+        'version': FORMAT_VERSION,
+        'genome_key': genome.key,
+        'fitness': genome.fitness,
+        'num_inputs': len(genome_cfg.input_keys),
+        'num_outputs': len(genome_cfg.output_keys),
+        'architecture': None if architecture is None else {
+            'input_ids': architecture.input_ids,
+            'output_ids': architecture.output_ids,
+            'hidden_layers': architecture.hidden_layers
+        }
+    }
+    meta.update(metadata or {})
+    return {
+        'meta': np.array(json.dumps(meta)),
+        'input_keys': np.array(genome_cfg.input_keys, dtype=np.int64),
+        'output_keys': np.array(genome_cfg.output_keys, dtype=np.int64),
+        'node_keys': np.array(node_keys, dtype=np.int64),
+        'node_activation': np.array(node_act, dtype=np.int16),
+        'node_aggregation': np.array(node_agg, dtype=np.int16),
+        'node_bias': np.array(node_bias, dtype=np.float64),
+        'node_response': np.array(node_response, dtype=np.float64),
+        'link_offsets': np.array(offsets, dtype=np.int64),
+        'link_sources': np.array(sources, dtype=np.int64),
+        'link_weights': np.array(weights, dtype=np.float64),
+        'activation_names': np.array(activation_names or ['identity']),
+        'aggregation_names': np.array(aggregation_names or ['sum'])
+    }
+
+
+def export_policy(genome, config, path: str, architecture=None, metadata: Optional[dict] = None) -> str:
+    """Write `genome` as an .npz policy (see policy_arrays); needs neat, loading it does not."""
+    np.savez_compressed(path, **policy_arrays(genome, config, architecture, metadata))
+    # savez adds .npz when it is missing
+    return path if path.endswith('.npz') else path + '.npz'
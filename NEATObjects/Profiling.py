@@ -0,0 +1,289 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+from neat.reporting import BaseReporter
+
+PROFILE_MODES = ('cprofile', 'sampling')
+
+
+class Timers:
+    """Wall-clock totals and call counts for named methods, attached by wrapping them on an instance."""
+
+    def __init__(self):
+        self.totals: Dict[str, List[float]] = {}
+
+    def instrument(self, obj, method: str, name: Optional[str] = None) -> None:
+        # Only wrappers carry the marker: unpickling restores plain bound methods as instance
+        # attributes (see _Timed.__reduce__), and those still need wrapping
+        if getattr(getattr(obj, method), 'instrumented', False):
+            return
+        setattr(obj, method, self.wrap(name or method, getattr(obj, method)))
+
+    def wrap(self, name: str, fn) -> '_Timed':
+        return _Timed(fn, self.totals.setdefault(name, [0.0, 0]))
+
+    def add(self, snapshot: Dict[str, List[float]]) -> None:
+        for name, (seconds, calls) in snapshot.items():
+            entry = self.totals.setdefault(name, [0.0, 0])
+            entry[0] += seconds
+            entry[1] += calls
+
+    def snapshot(self) -> Dict[str, List[float]]:
+        return {name: list(entry) for name, entry in self.totals.items()}
+
+    def reset(self) -> None:
+        # Keep the entry lists: wrappers hold references to them
+        for entry in self.totals.values():
+            entry[0] = 0.0
+            entry[1] = 0
+
+
+class _Timed:
+    """Callable that adds its wrapped function's run time to a Timers entry."""
+
+    instrumented = True
+
+    def __init__(self, fn, entry: List[float]):
+        self.fn = fn
+        self.entry = entry
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.fn(*args, **kwargs)
+        finally:
+            self.entry[0] += time.perf_counter() - start
+            self.entry[1] += 1
+
+    def __reduce__(self):
+        # Pickled objects (e.g. the species set in a checkpoint) come back uninstrumented
+        return _unwrapped, (self.fn,)
+
+
+def _unwrapped(fn):
+    return fn
+
+
+class StackSampler:
+    """
+    Low-overhead statistical profiler: a daemon thread records the target thread's
+    stack every `interval` seconds while active, as collapsed 'outer;...;inner' strings.
+    With `root`, stacks start at the innermost frame of that function name and get `prefix`.
+    """
+
+    def __init__(self, thread_id: Optional[int] = None, interval: float = 0.005,
+                 root: Optional[str] = None, prefix: str = ''):
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.interval = interval
+        self.root = root
+        self.prefix = prefix
+        self.counts: Counter = Counter()
+        self.active = False
+        threading.Thread(target=self._run, name='neat-sampler', daemon=True).start()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            if not self.active:
+                continue
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+                if code.co_name == self.root:
+                    break
+                frame = frame.f_back
+            if stack:
+                self.counts[self.prefix + ';'.join(reversed(stack))] += 1
+
+    def collect(self) -> Counter:
+        counts, self.counts = self.counts, Counter()
+        return counts
+
+
+class _RawStats:
+    """Lets pstats.Stats load a profile's stats dict that came back from another process."""
+
+    def __init__(self, stats: dict):
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass
+
+
+# Worker processes keep one sampler for their lifetime
+_worker_sampler: Optional[StackSampler] = None
+
+
+def begin_task_profile(mode: Optional[str], interval: float = 0.005, root: Optional[str] = None):
+    """
+    Start profiling one evaluation task in a worker; pass the handle to end_task_profile.
+
+    Sampled stacks start at `root` (the task function) under a 'worker' frame, instead of
+    below the pool start-up frames a forked worker inherits from its parent.
+    """
+    global _worker_sampler
+    if mode == 'cprofile':
+        profile = cProfile.Profile()
+        profile.enable()
+        return profile
+    if mode == 'sampling':
+        if _worker_sampler is None:
+            _worker_sampler = StackSampler(interval=interval, root=root, prefix='worker;')
+        _worker_sampler.active = True
+        return _worker_sampler
+    return None
+
+
+def end_task_profile(handle):
+    """Stop a task profile; returns picklable data for ProfilingReporter.add_profile."""
+    if handle is None:
+        return None
+    if isinstance(handle, cProfile.Profile):
+        handle.disable()
+        handle.create_stats()
+        return handle.stats
+    handle.active = False
+    return handle.collect()
+
+
+class ProfilingReporter(BaseReporter):
+    """
+    Profiles chosen generations and times the training hot spots.
+
+    `mode` is 'cprofile' (deterministic, per-function stats in profile.txt and profile.pstats)
+    or 'sampling' (StackSampler; per-function sample counts in profile.txt and collapsed
+    stacks in profile.collapsed, ready for flamegraph tools). Worker profiles are returned
+    with each evaluation and merged into the main process's. With `timers` the trainer
+    instruments get_state, activate, step, speciate and reproduce; per-generation totals go to timers.json.
+    """
+
+    def __init__(self,
+                 trainer,
+                 directory: str,
+                 mode: Optional[str] = None,
+                 generations: Optional[Iterable[int]] = None,
+                 timers: bool = False,
+                 interval: float = 0.005):
+        if mode is not None and mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profiling mode: {mode}")
+        self.trainer = trainer
+        self.directory = directory
+        self.mode = mode
+        self.generations = set(generations) if generations is not None else None
+        self.interval = interval
+
+        self.stats: Optional[pstats.Stats] = None
+        self.samples: Counter = Counter()
+        self._profile = None
+        self._sampler = None
+
+        self.timer_log: List[dict] = []
+        self._timer_totals: Dict[str, List[float]] = {}
+        if timers:
+            trainer.enable_timers()
+
+    def __getstate__(self):
+        # Checkpoints pickle the reporter set; live profilers and the trainer stay behind
+        state = dict(self.__dict__)
+        state.update(trainer=None, stats=None, _profile=None, _sampler=None)
+        return state
+
+    def start_generation(self, generation):
+        if self.mode is None or (self.generations is not None and generation not in self.generations):
+            return
+        self.trainer.profile_mode = self.mode
+        if self.mode == 'cprofile':
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            if self._sampler is None:
+                self._sampler = StackSampler(interval=self.interval)
+            self._sampler.active = True
+
+    def end_generation(self, config, population, species_set):
+        self._stop_profile()
+        timers = self.trainer.timers
+        if timers is not None:
+            totals = timers.snapshot()
+            generation = {name: {'seconds': seconds - self._timer_totals.get(name, [0.0, 0])[0],
+                                 'calls': calls - self._timer_totals.get(name, [0.0, 0])[1]}
+                          for name, (seconds, calls) in totals.items() if calls}
+            self._timer_totals = totals
+            self.timer_log.append(generation)
+            print('Timers: ' + ', '.join(f"{name} {t['seconds']:.3f}s/{t['calls']}"
+                                         for name, t in sorted(generation.items())))
+
+    def _stop_profile(self) -> None:
+        if self.trainer.profile_mode is None:
+            return
+        self.trainer.profile_mode = None
+        if self._profile is not None:
+            self._profile.disable()
+            self._profile.create_stats()
+            self.add_profile(self._profile.stats)
+            self._profile = None
+        else:
+            self._sampler.active = False
+            self.add_profile(self._sampler.collect())
+
+    def add_profile(self, data) -> None:
+        if data is None:
+            return
+        if isinstance(data, Counter):
+            self.samples.update(data)
+        elif self.stats is None:
+            self.stats = pstats.Stats(_RawStats(data))
+        else:
+            self.stats.add(_RawStats(data))
+
+    def finish(self) -> None:
+        """Write the collected profiles and timers to `directory`; call once training has returned."""
+        # A run that hits its fitness threshold stops before end_generation
+        self._stop_profile()
+        os.makedirs(self.directory, exist_ok=True)
+        if self.stats is not None:
+            self.stats.dump_stats(os.path.join(self.directory, 'profile.pstats'))
+            stream = io.StringIO()
+            pstats.Stats(os.path.join(self.directory, 'profile.pstats'), stream=stream) \
+                .sort_stats('cumulative').print_stats(60)
+            with open(os.path.join(self.directory, 'profile.txt'), 'w') as f:
+                f.write(stream.getvalue())
+        if self.samples:
+            self._write_samples()
+        if self.timer_log:
+            totals = self.trainer.timers.snapshot()
+            with open(os.path.join(self.directory, 'timers.json'), 'w') as f:
+                json.dump({
+                    'total': {name: {'seconds': s, 'calls': c} for name, (s, c) in totals.items()},
+                    'generations': self.timer_log
+                }, f, indent=2)
+
+    def _write_samples(self) -> None:
+        with open(os.path.join(self.directory, 'profile.collapsed'), 'w') as f:
+            for stack, count in self.samples.most_common():
+                f.write(f'{stack} {count}\n')
+
+        # Per function: samples where it is running (self) or anywhere on the stack (total)
+        own, total = Counter(), Counter()
+        for stack, count in self.samples.items():
+            frames = stack.split(';')
+            own[frames[-1]] += count
+            for frame in set(frames):
+                total[frame] += count
+        samples = sum(self.samples.values())
+        with open(os.path.join(self.directory, 'profile.txt'), 'w') as f:
+            f.write(f'{samples} samples every {self.interval * 1000:g} ms\n\n')
+            f.write(f"{'total':>8} {'total%':>7} {'self':>8} {'self%':>7}  function\n")
+            for frame, count in total.most_common():
+                f.write(f'{count:>8} {count / samples:>7.1%} {own[frame]:>8} '
+                        f'{own[frame] / samples:>7.1%}  {frame}\n')
@@ -0,0 +1,122 @@
+import math
+from collections import defaultdict
+from typing import Dict, Optional
+
+from NEATObjects.Episode import (TrainingEpisode, PROXIMITY_WEIGHT, APPLE_BONUS,
+                                 DEATH_PENALTY, TIME_PENALTY)
+
+
+def steps_to_apple(game) -> int:
+    """Fewest moves from the head to any apple (Manhattan, or around the edges in wrap-around mode)."""
+    hx, hy = game.snake.head
+    best = None
+    for ax, ay in game.apples:
+        dx, dy = abs(hx - ax), abs(hy - ay)
+        if game.game_mode == 2:
+            dx, dy = min(dx, game.grid_width - dx), min(dy, game.grid_height - dy)
+        best = dx + dy if best is None else min(best, dx + dy)
+    return max(1, best)
+
+
+def fitness_bounds(episode: TrainingEpisode):
+    """
+    (lower, upper) bounds on the fitness `episode` can still finish with.
+
+    The proximity terms telescope: whatever happens, they add up to PROXIMITY_WEIGHT times
+    (current apple distance - final apple distance). The apple bonus is earned on every step
+    once an apple has been eaten, so before the first apple it can only start after the
+    fewest moves that reach one. Both bounds can be attained.
+    """
+    if episode.finished:
+        return episode.fitness, episode.fitness
+
+    game = episode.game
+    if game.done:
+        # Died in the last round; only the penalties are still to come
+        final = episode.fitness - DEATH_PENALTY - TIME_PENALTY * episode.step
+        return final, final
+
+    remaining = episode.max_steps - episode.step
+    # A wall death leaves the head one cell outside the grid
+    max_dist = math.hypot(game.grid_width, game.grid_height)
+    if game.score > 0:
+        bonus_steps = remaining
+    else:
+        bonus_steps = max(0, remaining - steps_to_apple(game) + 1)
+
+    upper = (episode.fitness + PROXIMITY_WEIGHT * episode.prev_dist + APPLE_BONUS * bonus_steps
+             - TIME_PENALTY * episode.step)
+    lower = (episode.fitness - PROXIMITY_WEIGHT * (max_dist - episode.prev_dist) - DEATH_PENALTY
+             - TIME_PENALTY * (episode.max_steps - 1))
+    return lower, upper
+
+
+def race_episodes(genomes,
+                  episodes: Dict[int, TrainingEpisode],
+                  genome_to_species: Optional[dict],
+                  survival_threshold: float,
+                  elitism: int,
+                  round_steps: int = 50) -> dict:
+    """
+    Advance all episodes in rounds of `round_steps` and stop those whose genome provably
+    falls outside its species' parent pool (the top `survival_threshold` fraction, at least
+    two and at least `elitism` members), mirroring DefaultReproduction's cutoff.
+
+    Episodes that enter a loop are finished exactly, without simulating the rest (see
+    TrainingEpisode.watch_for_loops). A stopped episode keeps its partial fitness with the
+    time penalty applied. That value is
+    below every rival that proved it out, so the set of parents and elites is unchanged;
+    only species means (and statistics derived from them) differ from a full evaluation.
+    """
+    genome_to_species = genome_to_species or {}
+    groups = defaultdict(list)
+    for genome in genomes:
+        groups[genome_to_species.get(genome.key)].append(genome.key)
+
+    cutoffs = {}
+    for sid, members in groups.items():
+        cutoff = max(int(math.ceil(survival_threshold * len(members))), 2, elitism)
+        # Genomes without a species are never dropped
+        cutoffs[sid] = cutoff if sid is not None else len(members)
+
+    for genome in genomes:
+        if episodes[genome.key].trace is None:
+            episodes[genome.key].watch_for_loops()
+
+    simulated = 0
+    skipped = 0
+    dropped = 0
+    active = [g.key for g in genomes]
+    while active:
+        for key in active:
+            simulated += episodes[key].advance(round_steps)
+
+        bounds = {key: fitness_bounds(ep) for key, ep in episodes.items()}
+        still_active = []
+        for sid, members in groups.items():
+            lowers = sorted((bounds[k][0] for k in members), reverse=True)
+            for key in members:
+                episode = episodes[key]
+                if episode.finished:
+                    continue
+                upper = bounds[key][1]
+                # Count rivals certain to finish strictly above this genome
+                beaten_by = sum(1 for low in lowers if low > upper)
+                if beaten_by >= cutoffs[sid]:
+                    skipped += episode.max_steps - episode.step
+                    episode.stop()
+                    dropped += 1
+                else:
+                    still_active.append(key)
+        active = still_active
+
+    looped = [ep for ep in episodes.values() if ep.fast_forwarded]
+    skipped += sum(ep.fast_forwarded for ep in looped)
+    budget = simulated + skipped
+    return {
+        'simulated_steps': simulated,
+        'skipped_steps': skipped,
+        'dropped': dropped,
+        'looped': len(looped),
+        'saved_fraction': skipped / budget if budget else 0.0
+    }
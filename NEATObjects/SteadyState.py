@@ -0,0 +1,229 @@
+import math
+import queue
+import random
+import time
+from types import SimpleNamespace
+from typing import Dict, List
+
+from neat.population import CompleteExtinctionException
+from neat.species import Species
+
+from NEATObjects.NEAT import NEATTrainer, _evaluate_in_worker
+
+
+class SteadyStateEvolution:
+    """
+    Asynchronous steady-state NEAT on top of a NEATTrainer's population and config.
+
+    Workers evaluate genomes continuously. Each finished evaluation enters the breeding pool
+    (evicting the member with the lowest species-adjusted fitness rank once the pool is full,
+    species elites excepted), is placed into the closest compatible species, and triggers one
+    new offspring, so no worker waits for a generation's stragglers. Every `pop_size` finished
+    evaluations count as one generation for stagnation, reporters and checkpoints. When every
+    species has stagnated, the run stops with CompleteExtinctionException or, with
+    reset_on_extinction, starts over from a fresh population, as Population.run does.
+    """
+
+    def __init__(self, trainer: NEATTrainer, in_flight: int = 0):
+        if trainer.num_workers < 2:
+            raise ValueError("Steady-state evolution needs num_workers >= 2.")
+        self.trainer = trainer
+        self.pop = trainer.pop
+        self.config = trainer.config
+        self.in_flight = in_flight or 2 * trainer.num_workers
+
+        self.population: Dict[int, object] = {}
+        # Genomes to evaluate before breeding any (the initial or a restarted population)
+        self.waiting: List[object] = []
+        self.best_genome = None
+        self.utilization_log: List[float] = []
+
+    def run(self, evaluations: int):
+        """Evolve until `evaluations` genomes have been evaluated; returns the best genome."""
+        config = self.config
+        pop_size = config.pop_size
+        species_set = self.pop.species
+        reporters = self.pop.reporters
+        pool = self.trainer.get_pool()
+        results = queue.Queue()
+
+        # Species keep their representatives; members are added back as they get evaluated
+        for s in species_set.species.values():
+            s.members = {}
+        self.waiting = list(self.pop.population.values())
+        pending = {}
+
+        def submit(genome) -> None:
+            pending[genome.key] = genome
+            task = (genome, self.trainer.game_spec(), self.trainer.max_steps,
+                    self.trainer._should_trace(), self.trainer.profile_mode)
+            pool.apply_async(_evaluate_in_worker, (task,),
+                             callback=lambda r, key=genome.key: results.put((key, r)),
+                             error_callback=lambda e, key=genome.key: results.put((key, e)))
+
+        for genome in self.waiting[:self.in_flight]:
+            submit(genome)
+        self.waiting = self.waiting[self.in_flight:]
+
+        done = 0
+        generation = self.pop.generation
+        reporters.start_generation(generation)
+        gen_start = time.perf_counter()
+        gen_busy = 0.0
+
+        while done < evaluations:
+            key, result = results.get()
+            genome = pending.pop(key)
+            if isinstance(result, Exception):
+                raise result
+            self.trainer.apply_worker_result(genome, result)
+            done += 1
+            gen_busy += result['busy']
+
+            self._insert(genome, generation)
+            if self.best_genome is None or genome.fitness > self.best_genome.fitness:
+                self.best_genome = genome
+            if len(self.population) > pop_size:
+                self._evict()
+
+            if (not config.no_fitness_termination
+                    and self.best_genome.fitness >= config.fitness_threshold):
+                reporters.found_solution(config, generation, self.best_genome)
+                break
+
+            # One finished evaluation, one new task
+            if self.waiting:
+                submit(self.waiting.pop(0))
+            elif done + len(pending) < evaluations:
+                submit(self._breed())
+
+            if done % pop_size == 0:
+                wall = time.perf_counter() - gen_start
+                utilization = gen_busy / (wall * self.trainer.num_workers) if wall > 0 else 0.0
+                self.utilization_log.append(utilization)
+                self._end_generation(generation)
+                self.trainer.report_cache_stats()
+                print(f'Worker utilization: {utilization:.1%} '
+                      f'({self.trainer.num_workers} workers, steady-state)')
+                generation += 1
+                self.pop.generation = generation
+                reporters.start_generation(generation)
+                gen_start = time.perf_counter()
+                gen_busy = 0.0
+
+        self.pop.population = dict(self.population)
+        self.pop.generation = generation
+        self.pop.best_genome = self.best_genome
+        return self.best_genome
+
+    def _insert(self, genome, generation: int) -> None:
+        species_set = self.pop.species
+        genome_config = self.config.genome_config
+        threshold = species_set.species_set_config.compatibility_threshold
+
+        sid = species_set.genome_to_species.get(genome.key)
+        if sid not in species_set.species:
+            candidates = [(genome.distance(s.representative, genome_config), s_id)
+                          for s_id, s in species_set.species.items()]
+            candidates = [c for c in candidates if c[0] < threshold]
+            if candidates:
+                sid = min(candidates, key=lambda c: c[0])[1]
+            else:
+                sid = next(species_set.indexer)
+                species_set.species[sid] = Species(sid, generation)
+                species_set.species[sid].update(genome, {})
+        species_set.genome_to_species[genome.key] = sid
+        species_set.species[sid].members[genome.key] = genome
+        self.population[genome.key] = genome
+
+    def _remove(self, key: int) -> None:
+        species_set = self.pop.species
+        del self.population[key]
+        sid = species_set.genome_to_species.pop(key)
+        s = species_set.species.get(sid)
+        if s is not None:
+            s.members.pop(key, None)
+            if not s.members:
+                del species_set.species[sid]
+
+    def _evict(self) -> None:
+        species_set = self.pop.species
+        elitism = self.config.reproduction_config.elitism
+        protected = set()
+        for s in species_set.species.values():
+            ranked = sorted(s.members.values(), key=lambda g: g.fitness, reverse=True)
+            protected.update(g.key for g in ranked[:elitism])
+
+        # Fitness sharing on ranks rather than raw values: Snake fitness goes negative, and
+        # dividing a negative value by the species size would favour the largest species
+        ranks = {g.key: rank for rank, g in enumerate(sorted(self.population.values(),
+                                                             key=lambda g: g.fitness), start=1)}
+
+        def adjusted(g):
+            return ranks[g.key] / len(species_set.get_species(g.key).members)
+
+        candidates = [g for k, g in self.population.items() if k not in protected]
+        if not candidates:
+            candidates = list(self.population.values())
+        self._remove(min(candidates, key=adjusted).key)
+
+    def _breed(self):
+        config = self.config
+        repro = self.pop.reproduction
+        species = [s for s in self.pop.species.species.values() if s.members]
+        if not species:
+            # Every member stagnated away while the restarted population is still in flight
+            return self._new_genomes(1)[0]
+
+        # Species are picked in proportion to their normalised mean fitness, as in DefaultReproduction
+        fitnesses = [g.fitness for s in species for g in s.members.values()]
+        min_fitness = min(fitnesses)
+        fitness_range = max(1.0, max(fitnesses) - min_fitness)
+        weights = [(sum(g.fitness for g in s.members.values()) / len(s.members) - min_fitness)
+                   / fitness_range + 1e-3 for s in species]
+        s = random.choices(species, weights=weights)[0]
+
+        members = sorted(s.members.values(), key=lambda g: g.fitness, reverse=True)
+        cutoff = max(int(math.ceil(config.reproduction_config.survival_threshold * len(members))), 2)
+        parents = members[:cutoff]
+        parent1, parent2 = random.choice(parents), random.choice(parents)
+
+        gid = next(repro.genome_indexer)
+        child = config.genome_type(gid)
+        child.configure_crossover(parent1, parent2, config.genome_config)
+        child.mutate(config.genome_config)
+        repro.ancestors[gid] = (parent1.key, parent2.key)
+        # No species yet: _insert places it by compatibility distance once it is evaluated
+        return child
+
+    def _new_genomes(self, n: int) -> list:
+        return list(self.pop.reproduction.create_new(self.config.genome_type,
+                                                     self.config.genome_config, n).values())
+
+    def _end_generation(self, generation: int) -> None:
+        config = self.config
+        species_set = self.pop.species
+        reporters = self.pop.reporters
+
+        best = max(self.population.values(), key=lambda g: g.fitness)
+        reporters.post_evaluate(config, self.population, species_set, best)
+
+        # Stagnation sees only species that currently have evaluated members
+        view = SimpleNamespace(species={sid: s for sid, s in species_set.species.items() if s.members})
+        for sid, s, stagnant in self.pop.reproduction.stagnation.update(view, generation):
+            if stagnant:
+                reporters.species_stagnant(sid, s)
+                for key in list(s.members):
+                    self._remove(key)
+
+        # Representatives follow the species' current best member
+        for s in species_set.species.values():
+            if s.members:
+                s.representative = max(s.members.values(), key=lambda g: g.fitness)
+
+        if not any(s.members for s in species_set.species.values()):
+            reporters.complete_extinction()
+            if not config.reset_on_extinction:
+                raise CompleteExtinctionException()
+            self.waiting = self._new_genomes(config.pop_size)
+        reporters.end_generation(config, self.population, species_set)
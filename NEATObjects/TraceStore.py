@@ -0,0 +1,228 @@
+import json
+import os
+import random
+from typing import List, Optional
+
+import numpy as np
+
+STEPS_FILENAME = 'steps.bin'
+EPISODES_FILENAME = 'episodes.bin'
+META_FILENAME = 'meta.json'
+
+DEATH_CAUSES = ['', 'wall', 'self', 'timeout']
+
+EPISODE_DTYPE = np.dtype([
+    ('run', '<i4'),
+    ('generation', '<i4'),
+    ('genome', '<i4'),
+    ('start', '<i8'),
+    ('length', '<i4'),
+    ('score', '<i4'),
+    ('death', 'i1'),
+    ('fitness', '<f8')
+])
+
+
+def step_dtype(num_inputs: int, num_outputs: int) -> np.dtype:
+    return np.dtype([
+        ('generation', '<i4'),
+        ('genome', '<i4'),
+        ('step', '<i4'),
+        ('action', 'i1'),
+        ('score', '<i4'),
+        ('inputs', '<f4', (num_inputs,)),
+        ('outputs', '<f4', (num_outputs,))
+    ])
+
+
+class _GrowableMemmap:
+    """Append-only memory-mapped array of fixed-width records that doubles its file as needed."""
+
+    def __init__(self, path: str, dtype: np.dtype, count: int = 0, capacity: int = 4096):
+        self.path = path
+        self.dtype = dtype
+        self.count = count
+        self.capacity = max(capacity, count, 1)
+        with open(path, 'ab') as f:
+            f.truncate(self.capacity * dtype.itemsize)
+        self.array = np.memmap(path, dtype=dtype, mode='r+', shape=(self.capacity,))
+
+    def append(self, records: np.ndarray) -> int:
+        start = self.count
+        end = start + len(records)
+        if end > self.capacity:
+            self._grow(end)
+        self.array[start:end] = records
+        self.count = end
+        return start
+
+    def _grow(self, needed: int) -> None:
+        self.array.flush()
+        del self.array
+        while self.capacity < needed:
+            self.capacity *= 2
+        with open(self.path, 'r+b') as f:
+            f.truncate(self.capacity * self.dtype.itemsize)
+        self.array = np.memmap(self.path, dtype=self.dtype, mode='r+', shape=(self.capacity,))
+
+    def close(self) -> None:
+        self.array.flush()
+        del self.array
+        # Trim the unused tail so readers can map the file as is
+        with open(self.path, 'r+b') as f:
+            f.truncate(self.count * self.dtype.itemsize)
+
+
+class TraceRecorder:
+    """
+    Samples training episodes and appends their per-step traces to memory-mapped files.
+
+    Each step record holds generation, genome key, step, action, apples so far, the sensor
+    vector and the raw network outputs; each episode gets one index record with its slice of
+    the step file, final score, fitness and death cause ('wall', 'self' or 'timeout').
+
+    Re-opening a store appends to it as a new run: generation numbers start again at 0, so
+    every episode record also carries the number of the recorder session that wrote it.
+    """
+
+    def __init__(self,
+                 directory: str,
+                 num_inputs: int,
+                 num_outputs: int,
+                 sample_rate: float = 0.05,
+                 seed: Optional[int] = None):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.num_inputs = num_inputs
+        self.num_outputs = num_outputs
+        self.sample_rate = sample_rate
+        self.rng = random.Random(seed)
+        self.dtype = step_dtype(num_inputs, num_outputs)
+
+        # Re-opening a store continues where it left off, as the next run
+        counts = {'steps': 0, 'episodes': 0}
+        self.run = 0
+        meta_path = os.path.join(directory, META_FILENAME)
+        if os.path.isfile(meta_path):
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            if (meta['num_inputs'], meta['num_outputs']) != (num_inputs, num_outputs):
+                raise ValueError(f"Trace store in {directory} has a different record layout.")
+            if 'runs' not in meta:
+                raise ValueError(f"Trace store in {directory} predates run numbers; use a new directory.")
+            counts = meta['counts']
+            self.run = meta['runs']
+        self.steps = _GrowableMemmap(os.path.join(directory, STEPS_FILENAME), self.dtype, counts['steps'])
+        self.episodes = _GrowableMemmap(os.path.join(directory, EPISODES_FILENAME), EPISODE_DTYPE,
+                                        counts['episodes'], capacity=1024)
+
+    def should_record(self) -> bool:
+        return self.rng.random() < self.sample_rate
+
+    def record_episode(self,
+                       generation: int,
+                       genome_key: int,
+                       trace: List[tuple],
+                       death_cause: str,
+                       score: int,
+                       fitness: float) -> None:
+        """`trace` is a list of (inputs, outputs, action, score) tuples, one per step."""
+        records = np.zeros(len(trace), dtype=self.dtype)
+        records['generation'] = generation
+        records['genome'] = genome_key
+        records['step'] = np.arange(len(trace))
+        if trace:
+            inputs, outputs, actions, scores = zip(*trace)
+            records['inputs'] = inputs
+            records['outputs'] = outputs
+            records['action'] = actions
+            records['score'] = scores
+        start = self.steps.append(records)
+
+        episode = np.zeros(1, dtype=EPISODE_DTYPE)
+        episode[0] = (self.run, generation, genome_key, start, len(trace), score,
+                      DEATH_CAUSES.index(death_cause or ''), fitness)
+        self.episodes.append(episode)
+
+    def flush(self) -> None:
+        self.steps.array.flush()
+        self.episodes.array.flush()
+        self._write_meta()
+
+    def close(self) -> None:
+        self.steps.close()
+        self.episodes.close()
+        self._write_meta()
+
+    def _write_meta(self) -> None:
+        meta = {
+            'num_inputs': self.num_inputs,
+            'num_outputs': self.num_outputs,
+            'death_causes': DEATH_CAUSES,
+            'runs': self.run + 1,
+            'counts': {'steps': self.steps.count, 'episodes': self.episodes.count}
+        }
+        with open(os.path.join(self.directory, META_FILENAME), 'w') as f:
+            json.dump(meta, f, indent=2)
+
+
+class TraceReader:
+    """Read-only view of a trace store; slices are memory-mapped, nothing is loaded up front."""
+
+    def __init__(self, directory: str):
+        with open(os.path.join(directory, META_FILENAME), 'r') as f:
+            self.meta = json.load(f)
+        counts = self.meta['counts']
+        self.dtype = step_dtype(self.meta['num_inputs'], self.meta['num_outputs'])
+        self.steps = _open_readonly(os.path.join(directory, STEPS_FILENAME), self.dtype, counts['steps'])
+        self.episodes = _open_readonly(os.path.join(directory, EPISODES_FILENAME), EPISODE_DTYPE,
+                                       counts['episodes'])
+
+    def runs(self) -> np.ndarray:
+        return np.unique(self.episodes['run'])
+
+    def generations(self, run: Optional[int] = None) -> np.ndarray:
+        return np.unique(self.find_episodes(run=run)['generation'])
+
+    def find_episodes(self,
+                      generation: Optional[int] = None,
+                      genome: Optional[int] = None,
+                      run: Optional[int] = None) -> np.ndarray:
+        """Index records matching every given field; generation numbers repeat across runs."""
+        mask = np.ones(len(self.episodes), dtype=bool)
+        if run is not None:
+            mask &= self.episodes['run'] == run
+        if generation is not None:
+            mask &= self.episodes['generation'] == generation
+        if genome is not None:
+            mask &= self.episodes['genome'] == genome
+        return self.episodes[mask]
+
+    def episode_steps(self, episode) -> np.ndarray:
+        start = int(episode['start'])
+        return self.steps[start:start + int(episode['length'])]
+
+    def generation_steps(self, generation: int, run: Optional[int] = None) -> np.ndarray:
+        """
+        Steps of every episode of `generation` (of one `run`, or of all runs). Usually that is
+        one contiguous stretch of the step file, returned as a memory-mapped view; otherwise
+        the episodes' slices are copied together in file order.
+        """
+        eps = np.sort(self.find_episodes(generation=generation, run=run), order='start')
+        if len(eps) == 0:
+            return self.steps[0:0]
+        starts = eps['start'].astype(np.int64)
+        ends = starts + eps['length']
+        if np.array_equal(starts[1:], ends[:-1]):
+            return self.steps[int(starts[0]):int(ends[-1])]
+        return np.concatenate([self.steps[int(a):int(b)] for a, b in zip(starts, ends)])
+
+    def death_cause(self, episode) -> str:
+        return self.meta['death_causes'][int(episode['death'])]
+
+
+def _open_readonly(path: str, dtype: np.dtype, count: int) -> np.ndarray:
+    # Empty files cannot be memory-mapped
+    if count == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', shape=(count,))
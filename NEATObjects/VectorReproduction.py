@@ -0,0 +1,200 @@
+import random
+from typing import List, Optional, Sequence
+
+import numpy as np
+from neat.attributes import BoolAttribute, FloatAttribute, StringAttribute
+from neat.genome import DefaultGenome
+from neat.reproduction import DefaultReproduction
+
+
+def _float_init(attr: FloatAttribute, config, n: int, rng: np.random.Generator) -> np.ndarray:
+    mean = getattr(config, attr.init_mean_name)
+    stdev = getattr(config, attr.init_stdev_name)
+    init_type = getattr(config, attr.init_type_name).lower()
+    min_value = getattr(config, attr.min_value_name)
+    max_value = getattr(config, attr.max_value_name)
+    if 'gauss' in init_type or 'normal' in init_type:
+        return np.clip(rng.normal(mean, stdev, n), min_value, max_value)
+    if 'uniform' in init_type:
+        return rng.uniform(max(min_value, mean - 2 * stdev), min(max_value, mean + 2 * stdev), n)
+    raise RuntimeError(f"Unknown init_type {init_type!r} for {attr.init_type_name}")
+
+
+def _mutate_attribute(attr, genes: list, config, rng: np.random.Generator) -> int:
+    """Apply `attr`'s mutation to every gene in `genes` at once; returns how many values changed."""
+    n = len(genes)
+    old = [getattr(g, attr.name) for g in genes]
+    r = rng.random(n)
+
+    if isinstance(attr, FloatAttribute):
+        values = np.array(old, dtype=np.float64)
+        mutate_rate = getattr(config, attr.mutate_rate_name)
+        replace_rate = getattr(config, attr.replace_rate_name)
+        mutate = r < mutate_rate
+        replace = ~mutate & (r < mutate_rate + replace_rate)
+        if mutate.any():
+            power = getattr(config, attr.mutate_power_name)
+            values[mutate] = np.clip(values[mutate] + rng.normal(0.0, power, int(mutate.sum())),
+                                     getattr(config, attr.min_value_name),
+                                     getattr(config, attr.max_value_name))
+        if replace.any():
+            values[replace] = _float_init(attr, config, int(replace.sum()), rng)
+        changed = np.flatnonzero(mutate | replace)
+        new = values.tolist()
+    elif isinstance(attr, BoolAttribute):
+        # The rate depends on the current value, as in BoolAttribute.mutate_value
+        base = getattr(config, attr.mutate_rate_name)
+        to_false = base + getattr(config, attr.rate_to_false_add_name)
+        to_true = base + getattr(config, attr.rate_to_true_add_name)
+        rates = np.where(np.array(old, dtype=bool), to_false, to_true)
+        changed = np.flatnonzero((rates > 0) & (r < rates))
+        new = (rng.random(n) < 0.5).tolist()
+    elif isinstance(attr, StringAttribute):
+        changed = np.flatnonzero(r < getattr(config, attr.mutate_rate_name))
+        options = getattr(config, attr.options_name)
+        new = [options[i] for i in rng.integers(len(options), size=n)]
+    else:
+        # Attribute types without a batched version mutate gene by gene
+        for g in genes:
+            setattr(g, attr.name, attr.mutate_value(getattr(g, attr.name), config))
+        return n
+
+    for i in changed.tolist():
+        setattr(genes[i], attr.name, new[i])
+    return len(changed)
+
+
+def mutate_attributes(genomes: Sequence, config, rng: Optional[np.random.Generator] = None) -> None:
+    """
+    Attribute mutation (weights, enabled flags, biases, responses, activations, aggregations)
+    of all `genomes` together: each attribute's values across every gene are mutated or
+    replaced with one NumPy draw, with the same per-gene probabilities and distributions
+    as the gene-by-gene loop in DefaultGenome.mutate.
+    """
+    if rng is None:
+        # Seeded from the global stream NEAT uses, so seeded runs stay reproducible
+        rng = np.random.default_rng(random.getrandbits(64))
+    for genes in ([cg for g in genomes for cg in g.connections.values()],
+                  [ng for g in genomes for ng in g.nodes.values()]):
+        if not genes:
+            continue
+        for attr in type(genes[0])._gene_attributes:
+            _mutate_attribute(attr, genes, config, rng)
+
+
+def _copy_gene(gene):
+    # Same result as BaseGene.copy (genes hold only their key and attributes), minus the setattr loop
+    clone = object.__new__(type(gene))
+    clone.__dict__ = dict(gene.__dict__)
+    return clone
+
+
+def cross_attributes(pairs: Sequence[tuple], rng: Optional[np.random.Generator] = None) -> None:
+    """
+    Finish crossover of homologous genes in bulk: `pairs` holds (child_gene, other_parent_gene)
+    where the child gene is a copy of the fitter parent's; each attribute is then taken from
+    the other parent with probability 1/2, as in BaseGene.crossover.
+    """
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
+    by_type = {}
+    for child, other in pairs:
+        by_type.setdefault(type(child), []).append((child, other))
+    for gene_type, group in by_type.items():
+        for attr in gene_type._gene_attributes:
+            for i in np.flatnonzero(rng.random(len(group)) <= 0.5).tolist():
+                child, other = group[i]
+                setattr(child, attr.name, getattr(other, attr.name))
+
+
+class VectorGenome(DefaultGenome):
+    """
+    DefaultGenome whose crossover and attribute mutation can be batched over a generation.
+
+    Inside VectorizedReproduction.reproduce, configure_crossover() only copies the fitter
+    parent's genes and mutate() only queues the genome; the reproduction then mixes the
+    homologous genes, applies structural mutations genome by genome and mutates all
+    attributes in one go. Outside of it both behave like DefaultGenome's.
+    """
+
+    def configure_crossover(self, genome1, genome2, config):
+        pending: Optional[List] = getattr(config, 'pending_crossover', None)
+        if pending is None:
+            super().configure_crossover(genome1, genome2, config)
+            return
+        if genome1.fitness > genome2.fitness:
+            parent1, parent2 = genome1, genome2
+        else:
+            parent1, parent2 = genome2, genome1
+        for genes, child_genes, other_genes in ((parent1.connections, self.connections, parent2.connections),
+                                                (parent1.nodes, self.nodes, parent2.nodes)):
+            for key, gene in genes.items():
+                child_genes[key] = clone = _copy_gene(gene)
+                other = other_genes.get(key)
+                if other is not None:
+                    pending.append((clone, other))
+
+    def mutate(self, config):
+        pending: Optional[List] = getattr(config, 'pending_offspring', None)
+        if pending is not None:
+            pending.append(self)
+            return
+        self._mutate_structure(config)
+        mutate_attributes([self], config)
+
+    def _mutate_structure(self, config) -> None:
+        # Structural part of DefaultGenome.mutate, drawing from `random` in the same order
+        if config.single_structural_mutation:
+            div = max(1, (config.node_add_prob + config.node_delete_prob +
+                          config.conn_add_prob + config.conn_delete_prob))
+            r = random.random()
+            if r < (config.node_add_prob / div):
+                self.mutate_add_node(config)
+            elif r < ((config.node_add_prob + config.node_delete_prob) / div):
+                self.mutate_delete_node(config)
+            elif r < ((config.node_add_prob + config.node_delete_prob +
+                       config.conn_add_prob) / div):
+                self.mutate_add_connection(config)
+            elif r < ((config.node_add_prob + config.node_delete_prob +
+                       config.conn_add_prob + config.conn_delete_prob) / div):
+                self.mutate_delete_connection()
+        else:
+            if random.random() < config.node_add_prob:
+                self.mutate_add_node(config)
+            if random.random() < config.node_delete_prob:
+                self.mutate_delete_node(config)
+            if random.random() < config.conn_add_prob:
+                self.mutate_add_connection(config)
+            if random.random() < config.conn_delete_prob:
+                self.mutate_delete_connection()
+
+
+class VectorizedReproduction(DefaultReproduction):
+    """
+    DefaultReproduction (stagnation, spawn counts, elitism and parent selection unchanged)
+    that builds each generation's offspring in three passes: crossover of all homologous
+    genes at once, structural mutations genome by genome, then attribute mutation of all
+    offspring at once. Needs VectorGenome as the genome type; with any other genome type
+    it behaves exactly like DefaultReproduction.
+    """
+
+    def reproduce(self, config, species, pop_size, generation):
+        genome_config = config.genome_config
+        genome_config.pending_crossover = []
+        genome_config.pending_offspring = []
+        try:
+            population = super().reproduce(config, species, pop_size, generation)
+            pairs = genome_config.pending_crossover
+            offspring = genome_config.pending_offspring
+        finally:
+            # Not part of the config proper; keep them out of checkpoints
+            del genome_config.pending_crossover
+            del genome_config.pending_offspring
+        if offspring:
+            rng = np.random.default_rng(random.getrandbits(64))
+            cross_attributes(pairs, rng)
+            # Structure after crossover: add-node splits a connection and reuses its weight
+            for child in offspring:
+                child._mutate_structure(genome_config)
+            mutate_attributes(offspring, genome_config, rng)
+        return population
@@ -0,0 +1,166 @@
+import random
+import warnings
+from typing import Dict, Optional
+
+import neat
+
+from InitialArchitectureObjects.InitalArchitecture import InitialArchitecture
+
+
+def parse_input_map(text: str) -> Dict[int, int]:
+    """Parse 'src:dst, ...' pairs of 0-based input positions (source sensor -> current sensor)."""
+    mapping = {}
+    for pair in text.replace('\n', ',').split(','):
+        if not pair.strip():
+            continue
+        src, sep, dst = pair.partition(':')
+        if not sep:
+            raise ValueError(f"Bad input map entry {pair.strip()!r}; expected 'source:target'.")
+        mapping[int(src)] = int(dst)
+    return mapping
+
+
+def _check_input_map(input_map: Dict[int, int], source_inputs: Optional[int], num_inputs: int) -> None:
+    targets = list(input_map.values())
+    if len(set(targets)) != len(targets):
+        raise ValueError("Input map sends two source inputs to the same sensor.")
+    for src, dst in input_map.items():
+        if src < 0 or (source_inputs is not None and src >= source_inputs):
+            raise ValueError(f"Input map source {src} is not an input of the warm-start network.")
+        if not 0 <= dst < num_inputs:
+            raise ValueError(f"Input map target {dst} is outside the {num_inputs} inputs of this game.")
+
+
+def architecture_genome(arch: InitialArchitecture, config: neat.Config, key: int = 0,
+                        input_map: Optional[Dict[int, int]] = None):
+    """
+    Build a genome from an architecture's explicit connection list and weights.
+
+    Inputs are matched by position, so the architecture must have exactly the game's input
+    count, unless `input_map` ({architecture input position: game input position}) says which
+    sensor each architecture input feeds; unmapped architecture inputs are dropped. The output
+    count must match, since outputs are the four move directions.
+    """
+    genome_cfg = config.genome_config
+    if arch.output_size != genome_cfg.num_outputs:
+        raise ValueError(f"Architecture has {arch.output_size} outputs, the config {genome_cfg.num_outputs}.")
+    if input_map is None:
+        if arch.input_size != genome_cfg.num_inputs:
+            raise ValueError(
+                f"Architecture has {arch.input_size} inputs but the game provides {genome_cfg.num_inputs}; "
+                f"its connections would land on unrelated sensors. Set [ARCHITECTURE] "
+                f"warm_start_input_map to say which sensor each architecture input feeds.")
+        input_map = {pos: pos for pos in range(arch.input_size)}
+    _check_input_map(input_map, arch.input_size, genome_cfg.num_inputs)
+    genome = config.genome_type(key)
+    for out_key in genome_cfg.output_keys:
+        genome.nodes[out_key] = genome.create_node(genome_cfg, out_key)
+
+    hidden_keys = {}
+
+    def to_key(node_id: int) -> Optional[int]:
+        role, pos = arch.node_role(node_id)
+        if role == 'input':
+            return -(input_map[pos] + 1) if pos in input_map else None
+        if role == 'output':
+            return genome_cfg.output_keys[pos] if pos < genome_cfg.num_outputs else None
+        if node_id not in hidden_keys:
+            new_key = genome_cfg.get_new_node_key(genome.nodes)
+            genome.nodes[new_key] = genome.create_node(genome_cfg, new_key)
+            hidden_keys[node_id] = new_key
+        return hidden_keys[node_id]
+
+    for src, dst, weight in arch.connections:
+        if arch.node_role(dst)[0] == 'input':
+            continue
+        a, b = to_key(src), to_key(dst)
+        if a is None or b is None:
+            continue
+        genome.add_connection(genome_cfg, a, b, weight, True)
+    return genome
+
+
+def remap_genome(source, config: neat.Config, key: int = 0, source_outputs: Optional[int] = None,
+                 input_map: Optional[Dict[int, int]] = None):
+    """Copy a genome (e.g. a saved best genome) onto the current config's input/output keys.
+
+    Inputs keep their positions unless `input_map` ({source input position: current input
+    position}) moves them; unmapped inputs are dropped. Without a map, a genome wired to inputs
+    the current game lacks was trained on another sensor layout, and is refused. Layouts of
+    equal size cannot be told apart. Missing outputs are created fresh. `source_outputs` is
+    the output count the genome was trained with (defaults to the current one).
+    """
+    genome_cfg = config.genome_config
+    inputs = set(genome_cfg.input_keys)
+    used = {-src - 1 for src, _ in source.connections if src < 0}
+    if input_map is None:
+        foreign = sorted(pos for pos in used if -pos - 1 not in inputs)
+        if foreign:
+            raise ValueError(
+                f"Warm-start genome uses input positions up to {foreign[-1]}, but the game provides "
+                f"{genome_cfg.num_inputs}; set [ARCHITECTURE] warm_start_input_map to remap them.")
+        input_map = {pos: pos for pos in used}
+    _check_input_map(input_map, None, genome_cfg.num_inputs)
+    dropped = sorted(used - set(input_map))
+    if dropped:
+        warnings.warn(f"Warm start drops the genome's unmapped input positions {dropped}.")
+    outputs = set(genome_cfg.output_keys)
+    if source_outputs is None:
+        source_outputs = genome_cfg.num_outputs
+    genome = config.genome_type(key)
+
+    for out_key in genome_cfg.output_keys:
+        node = source.nodes.get(out_key) if out_key < source_outputs else None
+        genome.nodes[out_key] = node.copy() if node is not None else genome.create_node(genome_cfg, out_key)
+
+    # Hidden nodes get fresh keys from the run's node indexer so later add-node mutations can't clash
+    remapped = {}
+    for old_key, node in sorted(source.nodes.items()):
+        if old_key < source_outputs:
+            continue
+        new_key = genome_cfg.get_new_node_key(genome.nodes)
+        new_node = node.copy()
+        new_node.key = new_key
+        genome.nodes[new_key] = new_node
+        remapped[old_key] = new_key
+
+    def to_key(node_key: int) -> Optional[int]:
+        if node_key < 0:
+            pos = -node_key - 1
+            return -(input_map[pos] + 1) if pos in input_map else None
+        if node_key in remapped:
+            return remapped[node_key]
+        return node_key if node_key in outputs else None
+
+    for (src, dst), conn in source.connections.items():
+        a, b = to_key(src), to_key(dst)
+        if a is None or b is None:
+            continue
+        genome.add_connection(genome_cfg, a, b, conn.weight, conn.enabled)
+    return genome
+
+
+def seed_population(pop: neat.Population, template, jitter: float = 0.1) -> None:
+    """Replace every genome in `pop` with a jittered copy of `template` and re-speciate."""
+    config = pop.config
+    genome_cfg = config.genome_config
+    for i, key in enumerate(list(pop.population)):
+        genome = config.genome_type(key)
+        genome.nodes = {k: n.copy() for k, n in template.nodes.items()}
+        genome.connections = {k: c.copy() for k, c in template.connections.items()}
+        # Keep one exact copy, perturb weights and biases of the rest
+        if i > 0 and jitter > 0:
+            for conn in genome.connections.values():
+                conn.weight = _clamp(conn.weight + random.gauss(0.0, jitter),
+                                     genome_cfg.weight_min_value, genome_cfg.weight_max_value)
+            for node in genome.nodes.values():
+                node.bias = _clamp(node.bias + random.gauss(0.0, jitter),
+                                   genome_cfg.bias_min_value, genome_cfg.bias_max_value)
+        pop.population[key] = genome
+
+    pop.species = config.species_set_type(config.species_set_config, pop.reporters)
+    pop.species.speciate(config, pop.population, pop.generation)
+
+
+def _clamp(value: float, low: float, high: float) -> float:
+    return max(min(value, high), low)
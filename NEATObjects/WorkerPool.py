@@ -0,0 +1,325 @@
+import multiprocessing as mp
+import os
+import threading
+import time
+import traceback
+from collections import deque
+from multiprocessing.connection import wait
+from typing import Callable, List, Optional
+
+
+class WorkerError(RuntimeError):
+    """An exception raised by a task inside a worker, with the worker-side traceback."""
+
+
+def _rss_mb() -> float:
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except (OSError, ValueError, IndexError):
+        # Peak rather than current RSS, but the best portable substitute (KiB on Linux)
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _worker_main(conn, initializer, initargs, max_tasks: Optional[int], max_rss_mb: Optional[float]) -> None:
+    if initializer is not None:
+        initializer(*initargs)
+    done = 0
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            return
+        if message is None:
+            return
+        task_id, func, args = message
+        try:
+            outcome = (True, func(*args))
+        except Exception:
+            outcome = (False, traceback.format_exc())
+        done += 1
+        rss = _rss_mb()
+        recycle = bool(max_tasks and done >= max_tasks) or bool(max_rss_mb and rss > max_rss_mb)
+        conn.send((task_id, outcome, recycle, rss))
+        if recycle:
+            return
+
+
+class _Worker:
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.task = None
+        self.started = 0.0
+        self.retiring = False
+
+
+class _Task:
+    def __init__(self, task_id: int, func, args, callback, error_callback):
+        self.id = task_id
+        self.func = func
+        self.args = args
+        self.callback = callback
+        self.error_callback = error_callback
+        self.attempts = 0
+
+
+class EvaluationPool:
+    """
+    Process pool for genome evaluation that survives misbehaving tasks and workers.
+
+    Mirrors the parts of multiprocessing.Pool the trainer uses (map, apply_async, close, join),
+    and additionally
+      - kills a task's worker once it has run for `task_timeout` seconds and answers the task
+        with `fallback(args, 'timeout')`,
+      - respawns workers that die; their task is retried `max_retries` times, then answered
+        with `fallback(args, 'crash')`,
+      - replaces a worker after `max_tasks_per_worker` tasks or once its RSS exceeds `max_rss_mb`.
+    Every such event is passed to `on_event(kind, details)`. Exceptions raised by the task
+    itself still reach error_callback (as WorkerError), exactly as with Pool.
+    """
+
+    def __init__(self,
+                 processes: int,
+                 initializer: Optional[Callable] = None,
+                 initargs: tuple = (),
+                 task_timeout: Optional[float] = None,
+                 fallback: Optional[Callable] = None,
+                 max_tasks_per_worker: Optional[int] = None,
+                 max_rss_mb: Optional[float] = None,
+                 max_retries: int = 1,
+                 on_event: Optional[Callable[[str, dict], None]] = None):
+        self.processes = processes
+        self.initializer = initializer
+        self.initargs = initargs
+        self.task_timeout = task_timeout or None
+        self.fallback = fallback
+        self.max_tasks_per_worker = max_tasks_per_worker or None
+        self.max_rss_mb = max_rss_mb or None
+        self.max_retries = max_retries
+        self.on_event = on_event
+
+        self._lock = threading.Lock()
+        self._pending: deque = deque()
+        self._next_id = 0
+        self._closing = False
+        self._terminating = False
+        self._wake_reader, self._wake_writer = mp.Pipe(duplex=False)
+
+        self._workers: List[_Worker] = [self._spawn() for _ in range(processes)]
+        self._manager = threading.Thread(target=self._manage, name='evaluation-pool', daemon=True)
+        self._manager.start()
+
+    # ---- public interface -------------------------------------------------------------
+
+    def apply_async(self, func, args=(), callback=None, error_callback=None) -> None:
+        with self._lock:
+            if self._closing:
+                raise ValueError("Pool is closed.")
+            self._pending.append(_Task(self._next_id, func, args, callback, error_callback))
+            self._next_id += 1
+        self._wake_writer.send_bytes(b'')
+
+    def map(self, func, iterable, chunksize: int = 1) -> list:
+        """Apply `func` to every item; blocks until all are answered. `chunksize` is ignored."""
+        items = list(iterable)
+        results = [None] * len(items)
+        errors = []
+        remaining = [len(items)]
+        done = threading.Condition()
+
+        def finish(i, value, failed=False):
+            with done:
+                if failed:
+                    errors.append(value)
+                else:
+                    results[i] = value
+                remaining[0] -= 1
+                done.notify()
+
+        for i, item in enumerate(items):
+            self.apply_async(func, (item,),
+                             callback=lambda r, i=i: finish(i, r),
+                             error_callback=lambda e, i=i: finish(i, e, failed=True))
+        with done:
+            done.wait_for(lambda: remaining[0] == 0)
+        if errors:
+            raise errors[0]
+        return results
+
+    def close(self) -> None:
+        """Finish the queued tasks, then stop the workers."""
+        with self._lock:
+            self._closing = True
+        self._wake_writer.send_bytes(b'')
+
+    def join(self) -> None:
+        self._manager.join()
+
+    def terminate(self) -> None:
+        with self._lock:
+            self._closing = True
+            self._terminating = True
+            self._pending.clear()
+        for worker in self._workers:
+            worker.process.terminate()
+        self._wake_writer.send_bytes(b'')
+        self._manager.join()
+
+    # ---- manager thread ---------------------------------------------------------------
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = mp.Pipe()
+        process = mp.Process(target=_worker_main, daemon=True,
+                             args=(child_conn, self.initializer, self.initargs,
+                                   self.max_tasks_per_worker, self.max_rss_mb))
+        process.start()
+        child_conn.close()
+        return _Worker(process, parent_conn)
+
+    def _event(self, kind: str, **details) -> None:
+        if self.on_event is not None:
+            self.on_event(kind, details)
+
+    def _manage(self) -> None:
+        while True:
+            self._dispatch()
+            busy = [w for w in self._workers if w.task is not None]
+            with self._lock:
+                if self._closing and not busy and not self._pending:
+                    break
+
+            timeout = None
+            if self.task_timeout is not None and busy:
+                now = time.monotonic()
+                timeout = max(0.0, min(w.started + self.task_timeout - now for w in busy))
+            waitables = [self._wake_reader] + [w.conn for w in busy] + [w.process.sentinel for w in self._workers]
+            ready = wait(waitables, timeout)
+
+            if self._wake_reader in ready:
+                while self._wake_reader.poll():
+                    self._wake_reader.recv_bytes()
+            for worker in list(self._workers):
+                if worker.task is not None and worker.conn in ready:
+                    self._receive(worker)
+            for worker in list(self._workers):
+                if worker.process.sentinel in ready or not worker.process.is_alive():
+                    self._reap(worker)
+            self._check_timeouts()
+
+        for worker in self._workers:
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+        for worker in self._workers:
+            worker.process.join(timeout=5)
+            if worker.process.is_alive():
+                worker.process.terminate()
+
+    def _dispatch(self) -> None:
+        for worker in self._workers:
+            if worker.task is not None or worker.retiring:
+                continue
+            with self._lock:
+                if not self._pending:
+                    return
+                task = self._pending.popleft()
+            task.attempts += 1
+            worker.task = task
+            worker.started = time.monotonic()
+            try:
+                worker.conn.send((task.id, task.func, task.args))
+            except OSError:
+                # Died while idle; _reap will retry the task on a fresh worker
+                pass
+
+    def _receive(self, worker: _Worker) -> None:
+        try:
+            task_id, (ok, value), recycle, rss = worker.conn.recv()
+        except (EOFError, OSError):
+            return  # the worker died; handled by _reap
+        task, worker.task = worker.task, None
+        if recycle:
+            worker.retiring = True
+            reason = 'tasks' if self.max_rss_mb is None or rss <= self.max_rss_mb else 'rss'
+            self._event('recycle', pid=worker.process.pid, reason=reason, rss_mb=round(rss, 1))
+        if ok:
+            if task.callback is not None:
+                task.callback(value)
+        elif task.error_callback is not None:
+            task.error_callback(WorkerError(value))
+
+    def _reap(self, worker: _Worker) -> None:
+        worker.process.join(timeout=1)
+        # A recycling worker sends its last result and exits; it can be gone before that
+        # result is read, so collect it first (this also marks the worker as retiring)
+        if worker.task is not None and not self._terminating:
+            try:
+                pending = worker.conn.poll()
+            except (EOFError, OSError):
+                pending = False
+            if pending:
+                self._receive(worker)
+        if self._terminating:
+            worker.conn.close()
+            self._workers.remove(worker)
+            return
+        task = worker.task
+        if not worker.retiring:
+            self._event('crash', pid=worker.process.pid, exitcode=worker.process.exitcode,
+                        task=self._describe(task))
+        self._replace(worker)
+        if task is None:
+            return
+        if task.attempts <= self.max_retries:
+            with self._lock:
+                self._pending.appendleft(task)
+        else:
+            self._answer_with_fallback(task, 'crash')
+
+    def _check_timeouts(self) -> None:
+        if self.task_timeout is None:
+            return
+        now = time.monotonic()
+        for worker in list(self._workers):
+            if worker.task is None or now - worker.started < self.task_timeout:
+                continue
+            task = worker.task
+            self._event('timeout', pid=worker.process.pid, seconds=round(now - worker.started, 2),
+                        task=self._describe(task))
+            worker.process.kill()
+            worker.process.join()
+            self._replace(worker)
+            self._answer_with_fallback(task, 'timeout')
+
+    def _replace(self, worker: _Worker) -> None:
+        worker.conn.close()
+        index = self._workers.index(worker)
+        with self._lock:
+            closing = self._closing and not self._pending
+        if closing and worker.task is None and all(w.task is None for w in self._workers if w is not worker):
+            # Nothing left to run; shutting down anyway
+            self._workers.pop(index)
+            return
+        self._workers[index] = self._spawn()
+
+    def _answer_with_fallback(self, task: _Task, reason: str) -> None:
+        if self.fallback is None:
+            if task.error_callback is not None:
+                task.error_callback(WorkerError(f'Task {reason} and no fallback is configured.'))
+            return
+        if task.callback is not None:
+            task.callback(self.fallback(task.args, reason))
+
+    @staticmethod
+    def _describe(task: Optional[_Task]):
+        if task is None:
+            return None
+        # Evaluation tasks start with the genome; its key identifies the culprit
+        first = task.args[0] if task.args else None
+        if isinstance(first, tuple) and first and hasattr(first[0], 'key'):
+            return first[0].key
+        return task.id
@@ -0,0 +1,83 @@
+import argparse
+import os
+import pickle
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+import neat
+
+from GameObjects.Snake import SENSOR_MODES, SnakeGame
+from NEATObjects.GoldenTrace import ENGINES, fuzz
+from NEATObjects.NEAT import match_inputs
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Fuzz alternative simulation engines against the reference SnakeGame + FeedForwardNetwork.'
+    )
+    parser.add_argument(
+        '--config', '-c',
+        default=os.path.join(SCRIPT_DIR, 'Configs', 'my_custom_config.ini'),
+        help='NEAT config used to generate random genomes.'
+    )
+    parser.add_argument(
+        '--engines', '-e', nargs='+',
+        default=[name for name in ENGINES if name != 'reference'],
+        choices=sorted(ENGINES),
+        help='Engines to check against the reference.'
+    )
+    parser.add_argument('--genomes', '-n', type=int, default=1000, help='Number of random genomes.')
+    parser.add_argument('--seeds', type=int, default=2, help='Seeded games per genome and game mode.')
+    parser.add_argument('--modes', type=int, nargs='+', default=[1, 2], help='Game modes to play.')
+    parser.add_argument('--grid', type=int, nargs=2, default=[10, 10], metavar=('W', 'H'), help='Grid size.')
+    parser.add_argument('--sensor-mode', default='rays', choices=SENSOR_MODES,
+                        help="Network inputs; 'board' sizes the genomes' inputs for the grid.")
+    parser.add_argument('--max-steps', type=int, default=200, help='Step limit per game.')
+    parser.add_argument('--max-mutations', type=int, default=30, help='Mutations applied to each random genome.')
+    parser.add_argument('--output-tol', type=float, default=1e-9, help='Relative tolerance on network outputs.')
+    parser.add_argument('--fuzz-seed', type=int, default=0, help='Seed for genome generation.')
+    parser.add_argument('--fail-fast', action='store_true', help='Stop at the first divergence.')
+    parser.add_argument('--save-failures', default=None,
+                        help='Directory to pickle the genomes that diverged (for replaying the case).')
+    args = parser.parse_args()
+
+    config = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                         neat.DefaultSpeciesSet, neat.DefaultStagnation, args.config)
+    match_inputs(config, SnakeGame(*args.grid, sensor_mode=args.sensor_mode))
+    start = time.time()
+    divergences = fuzz(
+        config,
+        [ENGINES[name] for name in args.engines],
+        num_genomes=args.genomes,
+        game_modes=args.modes,
+        seeds=range(args.seeds),
+        grid=tuple(args.grid),
+        max_steps=args.max_steps,
+        max_mutations=args.max_mutations,
+        output_tol=args.output_tol,
+        fuzz_seed=args.fuzz_seed,
+        stop_on_first=args.fail_fast,
+        sensor_mode=args.sensor_mode
+    )
+
+    for d in divergences:
+        print(d)
+        print()
+        if args.save_failures:
+            os.makedirs(args.save_failures, exist_ok=True)
+            path = os.path.join(args.save_failures,
+                                f'{d.engine}_genome{d.genome.key}_mode{d.game_mode}_seed{d.seed}.pkl')
+            with open(path, 'wb') as f:
+                pickle.dump(d.genome, f)
+
+    print(f'Checked {", ".join(args.engines)} on {args.genomes} genomes, modes {args.modes}, '
+          f'{args.seeds} seeds each in {time.time() - start:.1f} sec: {len(divergences)} divergence(s)')
+    sys.exit(1 if divergences else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+import argparse
+import configparser
+import json
+import os
+import pickle
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+import neat
+
+from GameObjects.Snake import SnakeGame
+from InitialArchitectureObjects.InitalArchitecture import InitialArchitecture
+from NEATObjects.NEAT import match_inputs
+from NEATObjects.Policy import export_policy, load_policy
+
+GENOME_FILENAME = 'best_genome.pkl'
+POLICY_FILENAME = 'best_policy.npz'
+
+
+def find_genomes(paths):
+    for path in paths:
+        if os.path.isfile(path):
+            yield path
+            continue
+        for root, _, files in os.walk(path):
+            if GENOME_FILENAME in files:
+                yield os.path.join(root, GENOME_FILENAME)
+
+
+def config_for(genome_path: str, default: str) -> str:
+    """The config the genome was trained with: result.json's, Configs/<experiment>.ini, or `default`."""
+    folder = os.path.dirname(os.path.abspath(genome_path))
+    result_path = os.path.join(folder, 'result.json')
+    if os.path.isfile(result_path):
+        with open(result_path, 'r') as f:
+            config = json.load(f).get('config')
+        if config and os.path.isfile(config):
+            return config
+    named = os.path.join(SCRIPT_DIR, 'Configs', os.path.basename(folder) + '.ini')
+    return named if os.path.isfile(named) else default
+
+
+def convert(genome_path: str, config_path: str, output_path: str) -> str:
+    config = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                         neat.DefaultSpeciesSet, neat.DefaultStagnation, config_path)
+    parser = configparser.ConfigParser()
+    parser.read(config_path)
+    game = SnakeGame(parser.getint('GAME', 'grid_width', fallback=30),
+                     parser.getint('GAME', 'grid_height', fallback=30),
+                     parser.getint('GAME', 'cell_size', fallback=20),
+                     parser.getint('GAME', 'game_mode', fallback=1),
+                     parser.get('GAME', 'sensor_mode', fallback='rays').strip())
+    match_inputs(config, game)
+    arch_path = parser.get('ARCHITECTURE', 'initial_architecture', fallback='').strip()
+    architecture = InitialArchitecture.from_file(arch_path) if arch_path and os.path.isfile(arch_path) else None
+
+    with open(genome_path, 'rb') as f:
+        genome = pickle.load(f)
+    return export_policy(genome, config, output_path, architecture=architecture,
+                         metadata={'sensor_mode': game.sensor_mode,
+                                   'grid': [game.grid_width, game.grid_height],
+                                   'game_mode': game.game_mode,
+                                   'source': os.path.abspath(genome_path)})
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=f'Convert pickled genomes ({GENOME_FILENAME}) into portable {POLICY_FILENAME} policies.'
+    )
+    parser.add_argument('paths', nargs='+', help='Genome files, or directories searched recursively.')
+    parser.add_argument(
+        '--config', '-c',
+        default=os.path.join(SCRIPT_DIR, 'Configs', 'my_custom_config.ini'),
+        help="Config for genomes whose own config can't be found."
+    )
+    parser.add_argument('--force', '-f', action='store_true', help='Convert even when the policy is up to date.')
+    args = parser.parse_args()
+
+    converted = skipped = failed = 0
+    for genome_path in find_genomes(args.paths):
+        output_path = os.path.join(os.path.dirname(genome_path), POLICY_FILENAME)
+        if (not args.force and os.path.isfile(output_path)
+                and os.path.getmtime(output_path) >= os.path.getmtime(genome_path)):
+            skipped += 1
+            continue
+        try:
+            path = convert(genome_path, config_for(genome_path, args.config), output_path)
+            policy = load_policy(path)
+            print(f'{genome_path} -> {path} ({len(policy.node_keys)} nodes)')
+            converted += 1
+        except Exception as e:
+            print(f'{genome_path}: {type(e).__name__}: {e}')
+            failed += 1
+
+    print(f'Converted {converted}, up to date {skipped}, failed {failed}')
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
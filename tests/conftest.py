@@ -0,0 +1,93 @@
+import configparser
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# No window and no sound device in tests
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Small population on a small board, so a generation takes well under a second
+BASE_CONFIG = {
+    'NEAT': {
+        'pop_size': '20',
+        'fitness_criterion': 'max',
+        'fitness_threshold': '100000.0',
+        'reset_on_extinction': 'False',
+    },
+    'DefaultGenome': {
+        'activation_default': 'sigmoid',
+        'activation_mutate_rate': '0.05',
+        'activation_options': 'sigmoid',
+        'aggregation_default': 'sum',
+        'aggregation_mutate_rate': '0.05',
+        'aggregation_options': 'sum',
+        'compatibility_disjoint_coefficient': '1.0',
+        'compatibility_weight_coefficient': '1.0',
+        'conn_add_prob': '0.5',
+        'conn_delete_prob': '0.3',
+        'enabled_default': 'True',
+        'enabled_mutate_rate': '0.01',
+        'feed_forward': 'True',
+        'initial_connection': 'full',
+        'node_add_prob': '0.2',
+        'node_delete_prob': '0.1',
+        'num_inputs': '32',
+        'num_outputs': '4',
+        'num_hidden': '0',
+        'bias_init_mean': '0.0',
+        'bias_init_stdev': '1.0',
+        'bias_max_value': '30.0',
+        'bias_min_value': '-30.0',
+        'bias_mutate_power': '0.5',
+        'bias_mutate_rate': '0.7',
+        'bias_replace_rate': '0.1',
+        'response_init_mean': '1.0',
+        'response_init_stdev': '0.0',
+        'response_max_value': '30.0',
+        'response_min_value': '-30.0',
+        'response_mutate_power': '0.0',
+        'response_mutate_rate': '0.0',
+        'response_replace_rate': '0.0',
+        'weight_init_mean': '0.0',
+        'weight_init_stdev': '1.0',
+        'weight_max_value': '30',
+        'weight_min_value': '-30',
+        'weight_mutate_power': '0.5',
+        'weight_mutate_rate': '0.8',
+        'weight_replace_rate': '0.1',
+    },
+    'DefaultSpeciesSet': {'compatibility_threshold': '3.0'},
+    'DefaultStagnation': {'species_fitness_func': 'max', 'max_stagnation': '15', 'species_elitism': '2'},
+    'DefaultReproduction': {'elitism': '2', 'survival_threshold': '0.3'},
+    'GAME': {'grid_width': '8', 'grid_height': '8', 'cell_size': '10', 'game_mode': '1'},
+    'EVALUATOR': {'name': 'apple_priority'},
+    'ARCHITECTURE': {},
+}
+
+
+@pytest.fixture
+def make_config(tmp_path):
+    """
+    Write a small experiment config to tmp_path; `sections` ({'TRAINING': {'racing': 'true'}})
+    are merged over BASE_CONFIG. Returns the file's path.
+    """
+    def make(name: str = 'small', sections: dict = None) -> str:
+        parser = configparser.ConfigParser()
+        parser.read_dict(BASE_CONFIG)
+        parser.read_dict(sections or {})
+        path = os.path.join(tmp_path, name + '.ini')
+        with open(path, 'w') as f:
+            parser.write(f)
+        return path
+    return make
+
+
+def pytest_configure(config):
+    # neat warns about every parameter left at its default; the repo configs do the same
+    config.addinivalue_line('filterwarnings', "ignore:Using default:DeprecationWarning")
@@ -0,0 +1,74 @@
+import pytest
+
+from ExperimentObjects.Experiment import Experiment
+from NEATObjects.ActivationCache import ActivationCache
+
+
+def test_cache_is_refused_for_recurrent_networks(make_config, tmp_path):
+    path = make_config(sections={'DefaultGenome': {'feed_forward': 'False'},
+                                 'TRAINING': {'activation_cache_size': '64'}})
+    with pytest.warns(UserWarning, match='Activation cache disabled'):
+        exp = Experiment(path, output_dir=str(tmp_path))
+    assert exp.trainer.activation_cache_size == 0
+
+
+class CountingNet:
+    def __init__(self):
+        self.calls = 0
+
+    def activate(self, inputs):
+        self.calls += 1
+        return [sum(inputs), inputs[0]]
+
+
+def test_hits_and_misses_are_counted():
+    net = CountingNet()
+    cache = ActivationCache(net, max_size=8, decimals=2)
+    assert cache.activate([1.0, 2.0]) == [3.0, 1.0]
+    assert cache.activate([1.0, 2.0]) == [3.0, 1.0]
+    # Rounds to the same key as [1.0, 2.0]
+    cache.activate([1.001, 2.0])
+    cache.activate([2.0, 2.0])
+    assert (cache.hits, cache.misses, net.calls) == (2, 2, 2)
+
+
+def test_least_recently_used_entry_is_evicted_at_capacity():
+    cache = ActivationCache(CountingNet(), max_size=2, decimals=None)
+    cache.activate([1.0])
+    cache.activate([2.0])
+    cache.activate([1.0])          # [2.0] is now the least recently used
+    cache.activate([3.0])
+    assert cache.evictions == 1
+    assert list(cache.entries) == [(1.0,), (3.0,)]
+
+
+def test_returned_outputs_can_be_modified_safely():
+    cache = ActivationCache(CountingNet(), max_size=4)
+    cache.activate([1.0, 1.0])[0] = -99.0
+    assert cache.activate([1.0, 1.0]) == [2.0, 1.0]
+
+
+def _train(make_config, tmp_path, name, **training):
+    exp = Experiment(make_config(sections={'TRAINING': training}), output_dir=str(tmp_path / name), seed=9)
+    exp.trainer.learn(2)
+    exp.trainer.close()
+    return exp.trainer, [g.fitness for g in exp._statistics().most_fit_genomes]
+
+
+def test_cached_training_matches_uncached(make_config, tmp_path):
+    plain, expected = _train(make_config, tmp_path, 'plain')
+    cached, actual = _train(make_config, tmp_path, 'cached', activation_cache_size='256')
+
+    assert actual == expected
+    assert plain.cache_log == []
+    # One report per generation, with one lookup per simulated step
+    assert len(cached.cache_log) == 2
+    lookups = [entry['hits'] + entry['misses'] for entry in cached.cache_log]
+    assert sum(lookups) == cached.steps_evaluated == plain.steps_evaluated
+    assert cached.cache_stats.hits == sum(entry['hits'] for entry in cached.cache_log)
+
+
+def test_worker_cache_counts_reach_the_generation_report(make_config, tmp_path):
+    trainer, _ = _train(make_config, tmp_path, 'workers', num_workers='2', activation_cache_size='256')
+    assert len(trainer.cache_log) == 2
+    assert trainer.cache_stats.misses == sum(entry['misses'] for entry in trainer.cache_log) > 0
@@ -0,0 +1,14 @@
+import ExperimentObjects.Experiment as experiment_module
+from ExperimentObjects.Experiment import Experiment
+
+
+def test_replay_gif_uses_the_play_board_after_curriculum_resizing(make_config, tmp_path, monkeypatch):
+    jobs = []
+    monkeypatch.setattr(experiment_module, 'ArtifactJob', lambda exp_dir, **kwargs: jobs.append(kwargs))
+    exp = Experiment(make_config(sections={'GAME': {'grid_width': '12', 'grid_height': '10'}}),
+                     output_dir=str(tmp_path), seed=1)
+    # A curriculum stage trains on a smaller board than the one the replay is recorded on
+    exp.trainer.game_train.resize(6, 5)
+
+    exp.start_artifacts()
+    assert jobs[0]['game_spec'][:4] == (12, 10, 10, 1)
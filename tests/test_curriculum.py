@@ -0,0 +1,40 @@
+from ExperimentObjects.Experiment import Experiment
+
+STAGES = [(6, 6, 100), (9, 7, 200)]
+
+
+def _curriculum(fitness_threshold):
+    return {'grid_sizes': '6x6, 9x7', 'max_steps': '100, 200', 'fitness_threshold': str(fitness_threshold)}
+
+
+def test_stage_advances_when_its_threshold_is_met(make_config, tmp_path):
+    exp = Experiment(make_config(sections={'CURRICULUM': _curriculum(-1e9)}), output_dir=str(tmp_path), seed=5)
+    trainer = exp.trainer
+    assert (trainer.game_train.grid_width, trainer.game_train.grid_height, trainer.max_steps) == (6, 6, 100)
+
+    trainer.learn(1)
+    assert exp.curriculum.stage == 1
+    assert (trainer.game_train.grid_width, trainer.game_train.grid_height, trainer.max_steps) == (9, 7, 200)
+    # The play game keeps the configured board
+    assert (trainer.game_play.grid_width, trainer.game_play.grid_height) == (8, 8)
+
+    log = exp.curriculum.finish()
+    assert [(s['stage'], s['grid_width'], s['generations']) for s in log] == [(0, 6, 1)]
+
+
+def test_stage_holds_below_its_threshold(make_config, tmp_path):
+    exp = Experiment(make_config(sections={'CURRICULUM': _curriculum(1e9)}), output_dir=str(tmp_path), seed=5)
+    exp.trainer.learn(2)
+    assert exp.curriculum.stage == 0 and exp.trainer.game_train.grid_width == 6
+
+
+def test_islands_follow_the_curriculum(make_config, tmp_path):
+    exp = Experiment(make_config(sections={'CURRICULUM': _curriculum(-1e9), 'ISLANDS': {'num_islands': '2'}}),
+                     output_dir=str(tmp_path), seed=5)
+    assert exp.islands.curriculum == {'stages': STAGES, 'fitness_threshold': -1e9, 'score_threshold': None}
+    # The unused main population gets no curriculum of its own
+    assert exp.curriculum is None
+
+    exp.islands.run(3)
+    for result in exp.islands.island_results:
+        assert [(s['stage'], s['generations']) for s in result['curriculum']] == [(0, 1), (1, 2)]
@@ -0,0 +1,65 @@
+import random
+
+import neat
+import pytest
+
+from GameObjects.Snake import SnakeGame
+from NEATObjects.GoldenTrace import END, ENGINES, Engine, check_genome, fuzz, random_genome, rollout
+from NEATObjects.NEAT import match_inputs
+
+CANDIDATES = [engine for name, engine in ENGINES.items() if name != 'reference']
+
+
+@pytest.fixture
+def config(make_config):
+    return neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                       neat.DefaultSpeciesSet, neat.DefaultStagnation, make_config())
+
+
+@pytest.mark.parametrize('sensor_mode', ['rays', 'board'])
+def test_engines_match_the_reference(config, sensor_mode):
+    match_inputs(config, SnakeGame(8, 8, sensor_mode=sensor_mode))
+    divergences = fuzz(config, CANDIDATES, num_genomes=12, seeds=range(2), grid=(8, 8), max_steps=120,
+                       fuzz_seed=7, sensor_mode=sensor_mode)
+    assert [str(d) for d in divergences] == []
+
+
+def test_fast_forwarded_loops_end_like_the_full_episode(config):
+    random.seed(3)
+    rng = random.Random(3)
+    forwarded = 0
+    for key in range(30):
+        genome = random_genome(config, key, rng)
+        trace = list(rollout(ENGINES['loop-fast-forward'], genome, config, (8, 8), 2, 0, 200))
+        forwarded += trace[-1]['fast_forwarded'] > 0
+        assert check_genome(genome, config, ENGINES['loop-fast-forward'], game_modes=(2,), grid=(8, 8),
+                            max_steps=200) is None
+    # On the wrapping board random networks often circle; the skipped path must actually have been exercised
+    assert forwarded > 0
+
+
+def test_rollout_ends_with_the_training_outcome(config):
+    random.seed(1)
+    genome = random_genome(config, 0, random.Random(1))
+    trace = list(rollout(ENGINES['reference'], genome, config, (8, 8), 1, 0, 50))
+    assert trace[0]['step'] == -1
+    assert trace[-1]['step'] == END
+    assert trace[-1]['steps'] == len(trace) - 2
+    assert trace[-1]['score'] == trace[-2]['score']
+
+
+def test_divergence_is_reported_at_the_first_wrong_output(config):
+    class Skewed:
+        def __init__(self, net):
+            self.net = net
+
+        def activate(self, inputs):
+            return [v + 1e-3 for v in self.net.activate(inputs)]
+
+    skewed = Engine('skewed', make_net=lambda genome, cfg: Skewed(neat.nn.FeedForwardNetwork.create(genome, cfg)))
+    random.seed(0)
+    genome = random_genome(config, 0, random.Random(0))
+    divergence = check_genome(genome, config, skewed, game_modes=(1,), grid=(8, 8), max_steps=50)
+    assert divergence is not None
+    assert (divergence.step, divergence.field) == (0, 'outputs')
+    assert "Engine 'skewed' diverges from reference at step 0 on 'outputs'" in str(divergence)
@@ -0,0 +1,51 @@
+import os
+import time
+
+import pytest
+
+from ExperimentObjects.Experiment import EVALUATORS, Experiment
+from NEATObjects import Islands
+from NEATObjects.Islands import IslandError, IslandModel
+
+GAME_SPEC = (8, 8, 10, 1, 'rays')
+
+
+def _model(config_path, **kwargs):
+    kwargs.setdefault('num_islands', 2)
+    return IslandModel(config_path, GAME_SPEC, EVALUATORS['apple_priority'](), island_pop_size=10,
+                       migration_interval=2, num_migrants=2, poll_interval=0.2, **kwargs)
+
+
+def test_seeded_island_runs_repeat(make_config):
+    path = make_config()
+    runs = []
+    for _ in range(2):
+        best, stats = _model(path, seed=21).run(5)
+        runs.append((best.fitness, [g.fitness for g in stats.most_fit_genomes]))
+    assert runs[0] == runs[1]
+
+
+def test_failing_island_raises_with_its_traceback(make_config):
+    model = _model(make_config(), trainer_kwargs={'no_such_option': 1})
+    with pytest.raises(IslandError, match='no_such_option'):
+        model.run(2)
+
+
+def test_killed_island_does_not_hang_training(make_config, monkeypatch):
+    def evolve(index, *args):
+        if index == 1:
+            os._exit(3)
+        time.sleep(60)
+
+    monkeypatch.setattr(Islands, '_evolve_island', evolve)
+    start = time.time()
+    with pytest.raises(IslandError, match='exited with code 3'):
+        _model(make_config()).run(2)
+    assert time.time() - start < 10
+
+
+def test_experiment_with_islands_builds_no_main_population(make_config, tmp_path):
+    exp = Experiment(make_config(sections={'ISLANDS': {'num_islands': '2'}}), output_dir=str(tmp_path), seed=1)
+    assert exp.trainer.pop.population == {}
+    assert exp.islands.island_pop_size == 10
+    assert exp.islands.game_spec == GAME_SPEC
@@ -0,0 +1,85 @@
+import json
+import socket
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from ExperimentObjects import Monitor
+from ExperimentObjects.Experiment import Experiment
+from ExperimentObjects.Monitor import PAGE, HttpPublisher, MonitorReporter, MonitorServer
+
+
+@pytest.fixture
+def server():
+    server = MonitorServer(port=0).start()
+    yield server
+    server.stop()
+
+
+def _get(server, path):
+    with urllib.request.urlopen(f'http://127.0.0.1:{server.port}{path}', timeout=5) as response:
+        return response.read()
+
+
+def _status(server):
+    return json.loads(_get(server, '/status'))
+
+
+def _wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError('condition not met in time')
+        time.sleep(0.05)
+
+
+def test_published_status_round_trips(server):
+    server.publish('local', {'state': 'running', 'generation': 3})
+    _wait_for(lambda: 'local' in _status(server))
+
+    publish = HttpPublisher(f'http://127.0.0.1:{server.port}')
+    publish('remote/island-1', {'state': 'finished', 'generation': 7})
+    publish.flush()
+
+    status = _status(server)
+    assert status['local'] == {'state': 'running', 'generation': 3}
+    assert status['remote/island-1'] == {'state': 'finished', 'generation': 7}
+
+
+def test_publish_rejects_non_object_status(server):
+    request = urllib.request.Request(f'http://127.0.0.1:{server.port}/publish/bad', data=b'[1, 2]',
+                                     method='POST')
+    with pytest.raises(urllib.error.HTTPError) as error:
+        urllib.request.urlopen(request, timeout=5)
+    assert error.value.code == 400
+    assert 'bad' not in _status(server)
+
+
+def test_page_inserts_text_not_markup(server):
+    page = _get(server, '/').decode()
+    assert page == PAGE
+    assert 'innerHTML' not in page
+    assert 'textContent' in page
+
+
+def test_islands_report_to_the_monitor(make_config, tmp_path):
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        port = s.getsockname()[1]
+    sections = {'ISLANDS': {'num_islands': '2', 'migration_interval': '2'},
+                'MONITOR': {'port': str(port)}}
+    exp = Experiment(make_config('watched', sections=sections), output_dir=str(tmp_path), seed=3)
+    assert exp.monitor is None
+    assert not any(isinstance(r, MonitorReporter) for r in exp.trainer.pop.reporters.reporters)
+    try:
+        exp.islands.run(2)
+        status = json.loads(urllib.request.urlopen(f'http://127.0.0.1:{port}/status', timeout=5).read())
+    finally:
+        Monitor._servers.pop(('127.0.0.1', port)).stop()
+    assert sorted(status) == ['watched/island-0', 'watched/island-1']
+    for island in status.values():
+        assert island['state'] == 'finished'
+        assert island['generation'] == 1
+        assert island['best_fitness'] is not None
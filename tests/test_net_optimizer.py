@@ -0,0 +1,122 @@
+import random
+
+import neat
+import pytest
+from neat.nn import FeedForwardNetwork
+
+from NEATObjects.NetOptimizer import optimize_network, verify_equivalence
+
+
+@pytest.fixture
+def config(make_config):
+    path = make_config(sections={'DefaultGenome': {
+        'num_inputs': '3',
+        'num_outputs': '2',
+        'activation_options': 'identity sigmoid tanh relu',
+        'activation_mutate_rate': '0.3',
+        'aggregation_options': 'sum product max',
+        'aggregation_mutate_rate': '0.2',
+        'node_add_prob': '0.5',
+        'conn_add_prob': '0.7',
+        'enabled_mutate_rate': '0.1',
+    }})
+    return neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                       neat.DefaultSpeciesSet, neat.DefaultStagnation, path)
+
+
+def build(config, nodes, connections):
+    """nodes: {id: (activation, aggregation, bias, response)}; connections: [(in, out, weight, enabled)]."""
+    cfg = config.genome_config
+    genome = neat.DefaultGenome(1)
+    for node_id, (activation, aggregation, bias, response) in nodes.items():
+        node = genome.create_node(cfg, node_id)
+        node.activation, node.aggregation, node.bias, node.response = activation, aggregation, bias, response
+        genome.nodes[node_id] = node
+    for i, o, weight, enabled in connections:
+        conn = genome.create_connection(cfg, i, o)
+        conn.weight, conn.enabled = weight, enabled
+        genome.connections[(i, o)] = conn
+    return genome
+
+
+def assert_same_outputs(genome, config, samples=300):
+    reference = FeedForwardNetwork.create(genome, config)
+    optimized, report = optimize_network(genome, config)
+    rng = random.Random(0)
+    for _ in range(samples):
+        inputs = [rng.uniform(-2.0, 2.0) for _ in config.genome_config.input_keys]
+        assert optimized.activate(inputs) == pytest.approx(reference.activate(inputs), rel=1e-9, abs=1e-12)
+    return optimized, report
+
+
+def test_identity_nodes_fold_into_parallel_links(config):
+    genome = build(config, {
+        0: ('sigmoid', 'sum', 0.1, 1.0),
+        1: ('tanh', 'sum', -0.2, 1.0),
+        5: ('identity', 'sum', 0.3, 1.5),
+        6: ('identity', 'sum', -0.4, 0.5),
+    }, [
+        (-1, 5, 0.8, True), (5, 0, 1.2, True),
+        (-1, 0, -0.7, True),             # parallel to -1 -> 5 -> 0 once 5 is folded
+        (5, 6, 2.0, True), (6, 1, -1.1, True),
+        (-2, 1, 0.9, True), (-3, 1, 0.4, False),
+    ])
+    optimized, report = assert_same_outputs(genome, config)
+    assert report['nodes_folded'] == 2
+    assert sorted(node for node, *_ in optimized.node_evals) == [0, 1]
+    # -1 reaches output 0 through one merged link
+    links = dict(next(links for node, *_, links in optimized.node_evals if node == 0))
+    assert list(links) == [-1]
+
+
+def test_zero_weight_links_and_the_dead_nodes_behind_them_are_removed(config):
+    genome = build(config, {
+        0: ('sigmoid', 'sum', 0.0, 1.0),
+        1: ('relu', 'sum', 0.5, 1.0),
+        7: ('tanh', 'sum', 0.2, 1.0),
+        8: ('sigmoid', 'sum', -0.3, 1.0),
+    }, [
+        (-3, 7, 1.5, True), (7, 0, 0.0, True),     # 7 only reaches an output with weight 0
+        (7, 8, 0.6, True), (8, 0, 0.0, True),
+        (-1, 0, 1.0, True), (-2, 1, -0.5, True), (-3, 1, 0.0, True),
+    ])
+    optimized, report = assert_same_outputs(genome, config)
+    assert sorted(node for node, *_ in optimized.node_evals) == [0, 1]
+    assert report['nodes_removed'] == 2
+    assert report['connections_removed'] == 5
+
+
+def test_nodes_feeding_non_summing_consumers_are_kept(config):
+    genome = build(config, {
+        0: ('sigmoid', 'product', 0.0, 1.0),
+        1: ('sigmoid', 'max', 0.0, 1.0),
+        5: ('identity', 'sum', 0.3, 2.0),
+        6: ('identity', 'sum', 0.0, 1.0),
+    }, [
+        (-1, 5, 0.8, True), (5, 0, 1.2, True), (-2, 0, 0.5, True),
+        (-1, 6, 1.0, True), (-2, 6, 1.0, True), (6, 1, 1.0, True),   # two inputs: not a pass-through
+        (-3, 1, 0.0, True),                                          # max over 0 * x is not a no-op
+    ])
+    optimized, report = assert_same_outputs(genome, config)
+    assert report['nodes_folded'] == 0
+    assert sorted(node for node, *_ in optimized.node_evals) == [0, 1, 5, 6]
+
+
+def test_mutated_genomes_stay_equivalent(config):
+    random.seed(8)
+    folded = removed = 0
+    for key in range(60):
+        genome = neat.DefaultGenome(key)
+        genome.configure_new(config.genome_config)
+        for _ in range(25):
+            genome.mutate(config.genome_config)
+            # Zero some weights so that link and dead-node removal have work to do
+            for cg in genome.connections.values():
+                if random.random() < 0.1:
+                    cg.weight = 0.0
+        verify_equivalence(genome, config, samples=50)
+        _, report = optimize_network(genome, config)
+        folded += report['nodes_folded']
+        removed += report['connections_removed']
+    # Every rewrite was exercised, not just the trivial path
+    assert folded > 0 and removed > 0
@@ -0,0 +1,99 @@
+import json
+import os
+import random
+import subprocess
+import sys
+
+import neat
+import numpy as np
+import pytest
+from neat.nn import FeedForwardNetwork
+
+from ExperimentObjects.Experiment import Experiment
+from NEATObjects import Policy
+from NEATObjects.Policy import export_policy, load_policy, policy_arrays
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def config(make_config):
+    path = make_config(sections={'DefaultGenome': {
+        'num_inputs': '5',
+        'num_outputs': '3',
+        'activation_options': 'sigmoid tanh relu identity gauss clamped abs',
+        'activation_mutate_rate': '0.3',
+        'aggregation_options': 'sum product max min mean',
+        'aggregation_mutate_rate': '0.2',
+        'node_add_prob': '0.5',
+    }})
+    return neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                       neat.DefaultSpeciesSet, neat.DefaultStagnation, path)
+
+
+def _genomes(config, n=30, mutations=20):
+    random.seed(5)
+    for key in range(n):
+        genome = neat.DefaultGenome(key)
+        genome.configure_new(config.genome_config)
+        for _ in range(mutations):
+            genome.mutate(config.genome_config)
+        genome.fitness = float(key)
+        yield genome
+
+
+def test_exported_policy_matches_feed_forward_network_exactly(config, tmp_path):
+    rng = random.Random(0)
+    for genome in _genomes(config):
+        policy = load_policy(export_policy(genome, config, str(tmp_path / f'g{genome.key}')))
+        reference = FeedForwardNetwork.create(genome, config)
+        for _ in range(20):
+            inputs = [rng.uniform(-3.0, 3.0) for _ in range(5)]
+            assert policy.activate(inputs) == reference.activate(inputs)
+        assert policy.meta['genome_key'] == genome.key
+
+
+def test_loading_and_running_does_not_import_neat(config, tmp_path):
+    genome = next(_genomes(config, n=1))
+    path = export_policy(genome, config, str(tmp_path / 'policy.npz'))
+    expected = FeedForwardNetwork.create(genome, config).activate([0.5, -1.0, 0.25, 2.0, 0.0])
+
+    script = (
+        "import sys, json\n"
+        "sys.modules['neat'] = None\n"  # any import of neat now fails
+        f"sys.path.insert(0, {ROOT!r})\n"
+        "from NEATObjects.Policy import load_policy\n"
+        f"print(json.dumps(load_policy({path!r}).activate([0.5, -1.0, 0.25, 2.0, 0.0])))\n"
+    )
+    out = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)
+    assert json.loads(out.stdout) == expected
+
+
+def test_foreign_or_newer_files_are_rejected(config, tmp_path):
+    arrays = policy_arrays(next(_genomes(config, n=1)), config)
+    for meta in ({'format': 'something-else', 'version': 1}, {'format': 'neat-snake-policy', 'version': 99}):
+        arrays['meta'] = np.array(json.dumps(meta))
+        path = tmp_path / 'bad.npz'
+        np.savez(path, **arrays)
+        with pytest.raises(ValueError):
+            load_policy(str(path))
+
+
+def test_unsupported_activation_is_refused_at_export(config, tmp_path):
+    genome = next(_genomes(config, n=1))
+    genome.nodes[0].activation = 'my_custom'
+    with pytest.raises(ValueError, match='my_custom'):
+        export_policy(genome, config, str(tmp_path / 'policy.npz'))
+
+
+def test_unsupported_network_skips_the_export_not_the_run(make_config, tmp_path, monkeypatch):
+    # As if the config used an activation the policy format has no entry for
+    monkeypatch.delitem(Policy.ACTIVATIONS, 'sigmoid')
+    exp = Experiment(make_config(sections={'ARTIFACTS': {'enabled': 'false'}}), output_dir=str(tmp_path),
+                     generations=1, seed=4)
+    with pytest.warns(UserWarning, match="Policy export skipped: .*'sigmoid'"):
+        score = exp.run()
+
+    assert score == exp.score
+    assert os.path.isfile(exp.genome_path)
+    assert not os.path.exists(exp.policy_path)
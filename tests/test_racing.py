@@ -0,0 +1,128 @@
+import pytest
+from neat.nn import FeedForwardNetwork
+
+from ExperimentObjects.Experiment import Experiment
+from GameObjects.Snake import SnakeGame, UP, DOWN, LEFT, RIGHT
+from NEATObjects.Episode import TrainingEpisode
+from NEATObjects.Racing import fitness_bounds, race_episodes
+
+MAX_STEPS = 400
+
+
+class CirclingNet:
+    """Turns clockwise every `every` steps: a snake that never dies and never finds the apple."""
+
+    CLOCKWISE = {UP: RIGHT, RIGHT: DOWN, DOWN: LEFT, LEFT: UP}
+
+    def __init__(self, game, every=2):
+        self.game = game
+        self.every = every
+        self.calls = 0
+
+    def activate(self, inputs):
+        self.calls += 1
+        direction = self.game.snake.direction
+        if self.calls % self.every == 0:
+            direction = self.CLOCKWISE[direction]
+        return [1.0 if d == direction else 0.0 for d in (UP, DOWN, LEFT, RIGHT)]
+
+
+class Genome:
+    def __init__(self, key):
+        self.key = key
+
+
+def _episode(net_factory, seed, watch=False):
+    game = SnakeGame(8, 8, 10, 1)
+    game.seed(seed)
+    episode = TrainingEpisode(net_factory(game), game, MAX_STEPS)
+    if watch:
+        episode.watch_for_loops()
+    return episode
+
+
+@pytest.fixture
+def nets(make_config, tmp_path):
+    exp = Experiment(make_config(), output_dir=str(tmp_path), seed=11)
+    config = exp.trainer.config
+    genomes = list(exp.trainer.pop.population.values())
+    return [lambda game, g=g: FeedForwardNetwork.create(g, config) for g in genomes]
+
+
+def test_looping_episode_is_finished_exactly():
+    full = _episode(CirclingNet, seed=1)
+    full.advance(MAX_STEPS)
+    fast = _episode(CirclingNet, seed=1, watch=True)
+    while not fast.finished:
+        fast.advance(50)
+
+    assert fast.fast_forwarded > MAX_STEPS // 2
+    assert fast.step == full.step == MAX_STEPS
+    assert fast.fitness == pytest.approx(full.fitness, abs=1e-9)
+
+
+def test_loop_detection_never_changes_fitness(nets):
+    for seed, factory in enumerate(nets):
+        full = _episode(factory, seed)
+        full.advance(MAX_STEPS)
+        fast = _episode(factory, seed, watch=True)
+        while not fast.finished:
+            fast.advance(37)
+        assert fast.fitness == pytest.approx(full.fitness, abs=1e-9)
+        assert fast.game.score == full.game.score
+
+
+def test_bounds_hold_and_tighten(nets):
+    for seed, factory in enumerate(nets + [CirclingNet]):
+        episode = _episode(factory, seed)
+        bounds = []
+        while not episode.finished:
+            bounds.append(fitness_bounds(episode))
+            episode.advance(25)
+        for lower, upper in bounds:
+            assert lower - 1e-9 <= episode.fitness <= upper + 1e-9
+        assert bounds[-1][1] - bounds[-1][0] <= bounds[0][1] - bounds[0][0]
+
+
+def test_racing_keeps_every_parent(nets):
+    full = {}
+    for key, factory in enumerate(nets):
+        episode = _episode(factory, seed=key)
+        episode.advance(MAX_STEPS)
+        full[key] = episode.fitness
+
+    genomes = [Genome(key) for key in full]
+    episodes = {key: _episode(factory, seed=key) for key, factory in enumerate(nets)}
+    race = race_episodes(genomes, episodes, {g.key: 1 for g in genomes},
+                         survival_threshold=0.3, elitism=2, round_steps=20)
+
+    cutoff = 6  # ceil(0.3 * 20)
+    parents = sorted(full, key=full.get, reverse=True)[:cutoff]
+    raced = sorted(episodes, key=lambda k: episodes[k].fitness, reverse=True)[:cutoff]
+    assert sorted(parents) == sorted(raced)
+    for key in parents:
+        assert episodes[key].fitness == pytest.approx(full[key], abs=1e-9)
+    # The report accounts for exactly the steps that were simulated
+    assert race['simulated_steps'] == sum(ep.step - ep.fast_forwarded for ep in episodes.values())
+    assert 0.0 <= race['saved_fraction'] < 1.0
+
+
+def test_racing_skips_loops_and_drops_hopeless_genomes():
+    # Two rivals already finished far ahead; a wide circler (period 40) can't catch up
+    episodes = {}
+    for key in (0, 1):
+        episodes[key] = _episode(CirclingNet, seed=key)
+        episodes[key].fitness, episodes[key].finished = 5000.0, True
+    game = SnakeGame(30, 30, 10, 1)
+    game.seed(3)
+    episodes[2] = TrainingEpisode(CirclingNet(game, every=10), game, MAX_STEPS)
+    # Tight circlers, caught by loop detection
+    for key in (3, 4, 5):
+        episodes[key] = _episode(lambda g, k=key: CirclingNet(g, every=k - 2), seed=key)
+
+    race = race_episodes([Genome(k) for k in episodes], episodes, {k: 1 for k in episodes},
+                         survival_threshold=0.3, elitism=2, round_steps=20)
+
+    assert race['dropped'] == 1 and episodes[2].step == 20 and episodes[2].game.score == 0
+    assert race['looped'] == 3
+    assert race['saved_fraction'] > 0.9
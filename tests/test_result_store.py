@@ -0,0 +1,55 @@
+import os
+
+import pytest
+
+from ExperimentObjects.Experiment import Experiment
+
+
+@pytest.fixture
+def config_path(make_config):
+    return make_config(sections={'ARTIFACTS': {'enabled': 'false'}})
+
+
+def _fitness_by_generation(exp):
+    return [g.fitness for g in exp._statistics().most_fit_genomes]
+
+
+@pytest.mark.parametrize('stored_generations', [2, 3, 4])
+def test_resumed_run_matches_an_unbroken_run(config_path, tmp_path, stored_generations):
+    store = str(tmp_path / 'store')
+    unbroken = Experiment(config_path, output_dir=str(tmp_path / 'unbroken'), generations=7, seed=5)
+    unbroken_score = unbroken.run()
+
+    Experiment(config_path, output_dir=str(tmp_path / 'first'), generations=stored_generations,
+               seed=5, store_dir=store).run()
+    resumed = Experiment(config_path, output_dir=str(tmp_path / 'resumed'), generations=7,
+                         seed=5, store_dir=store)
+    resumed_score = resumed.run()
+
+    assert resumed.resumed_from == stored_generations
+    assert _fitness_by_generation(resumed) == _fitness_by_generation(unbroken)
+    assert resumed.best_genome.key == unbroken.best_genome.key
+    assert resumed_score == unbroken_score
+
+
+def test_exact_hit_skips_training(config_path, tmp_path):
+    store = str(tmp_path / 'store')
+    first = Experiment(config_path, output_dir=str(tmp_path / 'a'), generations=2, seed=1, store_dir=store)
+    score = first.run()
+    again = Experiment(config_path, output_dir=str(tmp_path / 'b'), generations=2, seed=1, store_dir=store)
+    assert again.run() == score
+    assert os.path.isfile(again.genome_path)
+
+
+def test_resumed_run_times_speciation_and_reproduction(make_config, tmp_path):
+    path = make_config(sections={'ARTIFACTS': {'enabled': 'false'}, 'PROFILING': {'timers': 'true'}})
+    store = str(tmp_path / 'store')
+    Experiment(path, output_dir=str(tmp_path / 'first'), generations=2, seed=5, store_dir=store).run()
+    resumed = Experiment(path, output_dir=str(tmp_path / 'resumed'), generations=4, seed=5, store_dir=store)
+    resumed.run()
+
+    assert resumed.resumed_from == 2
+    assert len(resumed.profiler.timer_log) == 2
+    for generation in resumed.profiler.timer_log:
+        assert generation['speciate']['calls'] == 1
+        assert generation['reproduce']['calls'] == 1
@@ -0,0 +1,17 @@
+import random
+
+from ExperimentObjects.Experiment import Experiment
+
+
+def test_seeded_scores_repeat_and_match_across_workers(make_config, tmp_path):
+    exp = Experiment(make_config(), output_dir=str(tmp_path), seed=3)
+    genomes = list(exp.trainer.pop.population.values())[:6]
+
+    serial = exp.trainer.score_genomes(genomes, max_steps=200, seeds=(1, 2), num_workers=1)
+    # Scoring must not disturb the global stream NEAT evolves with
+    state = random.getstate()
+    again = exp.trainer.score_genomes(genomes, max_steps=200, seeds=(1, 2), num_workers=1)
+    parallel = exp.trainer.score_genomes(genomes, max_steps=200, seeds=(1, 2), num_workers=2)
+
+    assert serial == again == parallel
+    assert random.getstate() == state
@@ -0,0 +1,50 @@
+import random
+
+import numpy as np
+import pytest
+
+from GameObjects.Snake import BoardBatch, SnakeGame
+
+
+def _assert_matches_repaint(game):
+    incremental = game.board.copy()
+    game.repaint_board()
+    assert np.array_equal(incremental, game.board)
+
+
+@pytest.mark.parametrize('game_mode', [1, 2])
+def test_incremental_board_matches_a_full_repaint(game_mode):
+    rng = random.Random(game_mode)
+    seen = set()
+    for seed in range(60):
+        game = SnakeGame(6, 5, sensor_mode='board', game_mode=game_mode)
+        game.seed(seed)
+        game.reset()
+        _assert_matches_repaint(game)
+        for _ in range(150):
+            head, score = game.snake.head, game.score
+            game.step(rng.randrange(4))
+            _assert_matches_repaint(game)
+            if game.score > score:
+                seen.add('growth')
+            if max(abs(a - b) for a, b in zip(head, game.snake.head)) > 1:
+                seen.add('wrap')
+            if game.done:
+                seen.add(game.death_cause)
+                break
+    # Walls end most mode 1 games before the snake can bite itself; that is covered by mode 2
+    assert seen >= ({'growth', 'wall'} if game_mode == 1 else {'growth', 'wrap', 'self'})
+
+
+def test_shared_boards_stay_separate():
+    batch = BoardBatch(3, 6, 6, 20)
+    rng = random.Random(0)
+    for i, game in enumerate(batch.games):
+        game.seed(i)
+        game.reset()
+    for _ in range(40):
+        for game in batch.games:
+            if not game.done:
+                game.step(rng.randrange(4))
+        for game in batch.games:
+            _assert_matches_repaint(game)
@@ -0,0 +1,82 @@
+import pytest
+from neat.population import CompleteExtinctionException
+from neat.species import Species
+
+from ExperimentObjects.Experiment import Experiment
+from NEATObjects.SteadyState import SteadyStateEvolution
+
+
+def _steady_state(make_config, tmp_path, **sections):
+    sections.setdefault('TRAINING', {}).update(num_workers='2', steady_state='true')
+    exp = Experiment(make_config(sections=sections), output_dir=str(tmp_path), seed=4)
+    evolution = SteadyStateEvolution(exp.trainer)
+    # As run() does before the first evaluation comes back
+    for s in evolution.pop.species.species.values():
+        s.members = {}
+    return evolution
+
+
+def _add(evolution, genome, fitness, sid=None):
+    genome.fitness = fitness
+    if sid is not None:
+        evolution.pop.species.genome_to_species[genome.key] = sid
+    evolution._insert(genome, 0)
+
+
+def test_eviction_shares_fitness_even_when_it_is_negative(make_config, tmp_path):
+    evolution = _steady_state(make_config, tmp_path, DefaultReproduction={'elitism': '0'})
+    genomes = list(evolution.pop.population.values())
+    crowded, alone = sorted(evolution.pop.species.species)[0], 10 ** 6
+    evolution.pop.species.species[alone] = Species(alone, 0)
+    evolution.pop.species.species[alone].representative = genomes[4]
+
+    for genome, fitness in zip(genomes[:4], (-1.0, -1.1, -1.2, -1.3)):
+        _add(evolution, genome, fitness, sid=crowded)
+    _add(evolution, genomes[4], -5.0, sid=alone)
+
+    evolution._evict()
+    # Rank 2 shared by four members beats the lone worst genome's rank 1
+    assert genomes[4].key in evolution.population
+    assert genomes[3].key not in evolution.population
+
+
+def test_offspring_are_speciated_by_distance(make_config, tmp_path):
+    evolution = _steady_state(make_config, tmp_path)
+    for i, genome in enumerate(evolution.pop.population.values()):
+        _add(evolution, genome, float(i))
+
+    child = evolution._breed()
+    assert child.key not in evolution.pop.species.genome_to_species
+
+    # A species whose representative is the child itself is where it must go
+    species_set = evolution.pop.species
+    sid = max(species_set.species) + 1
+    species_set.species[sid] = Species(sid, 0)
+    species_set.species[sid].representative = child
+    _add(evolution, child, 0.0)
+    assert species_set.genome_to_species[child.key] == sid
+
+
+def _go_extinct(evolution):
+    evolution.pop.reporters.start_generation(0)
+    for i, genome in enumerate(evolution.pop.population.values()):
+        _add(evolution, genome, float(i))
+    evolution._end_generation(0)
+
+
+def test_complete_extinction_raises_like_neat(make_config, tmp_path):
+    evolution = _steady_state(make_config, tmp_path,
+                              DefaultStagnation={'max_stagnation': '0', 'species_elitism': '0'})
+    with pytest.raises(CompleteExtinctionException):
+        _go_extinct(evolution)
+
+
+def test_complete_extinction_restarts_with_reset_on_extinction(make_config, tmp_path):
+    evolution = _steady_state(make_config, tmp_path, NEAT={'reset_on_extinction': 'True'},
+                              DefaultStagnation={'max_stagnation': '0', 'species_elitism': '0'})
+    _go_extinct(evolution)
+
+    assert not evolution.population
+    assert len(evolution.waiting) == evolution.config.pop_size
+    # Breeding with no species left falls back to a fresh genome instead of failing
+    assert evolution._breed().fitness is None
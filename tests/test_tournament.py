@@ -0,0 +1,76 @@
+import json
+import os
+
+import pytest
+
+from ExperimentObjects import Tournament as tournament_module
+from ExperimentObjects.Experiment import Experiment
+from ExperimentObjects.Tournament import Tournament
+
+SEEDS = (0, 1, 2)
+MAX_STEPS = 150
+
+
+@pytest.fixture
+def results(make_config, tmp_path):
+    """Two finished runs whose folder names match no config file."""
+    exp = Experiment(make_config('sweep_42'), output_dir=str(tmp_path / 'exp'), seed=6)
+    genomes = sorted(exp.trainer.pop.population.values(), key=lambda g: g.key)[:2]
+    root = tmp_path / 'results'
+    for name, genome in zip(('run_a', 'run_b'), genomes):
+        folder = root / name
+        folder.mkdir(parents=True)
+        exp.trainer.save_genome(genome, str(folder / 'best_genome.pkl'))
+        (folder / 'result.json').write_text(json.dumps({'config': exp.config_path, 'score': 0}))
+    return exp.trainer, dict(zip(('run_a', 'run_b'), genomes)), str(root)
+
+
+def _recorded_config(root, name):
+    with open(os.path.join(root, name, 'result.json'), 'r') as f:
+        return json.load(f)['config']
+
+
+def _tournament(root, tmp_path):
+    return Tournament(root, configs_dir=str(tmp_path / 'no_configs'), seeds=SEEDS,
+                      max_steps=MAX_STEPS, num_workers=1)
+
+
+def test_games_match_the_play_scores(results, tmp_path):
+    trainer, genomes, root = results
+    board = {row['name']: row for row in _tournament(root, tmp_path).run()}
+
+    assert set(board) == {'run_a', 'run_b'}
+    for name, genome in genomes.items():
+        scores = [trainer.play(genome, max_steps=MAX_STEPS, render=False, seed=s) for s in SEEDS]
+        assert board[name]['score_mean'] == pytest.approx(sum(scores) / len(scores), abs=1e-12)
+        assert board[name]['games'] == len(SEEDS)
+    assert os.path.isfile(os.path.join(root, 'leaderboard.json'))
+
+
+def test_rerun_plays_only_changed_genomes(results, tmp_path, monkeypatch):
+    trainer, genomes, root = results
+    _tournament(root, tmp_path).run()
+
+    played = []
+    real = tournament_module._play_seed_bank
+    monkeypatch.setattr(tournament_module, '_play_seed_bank', lambda task: played.append(task) or real(task))
+    _tournament(root, tmp_path).run()
+    assert played == []
+
+    genome = genomes['run_a']
+    next(iter(genome.connections.values())).weight += 1.0
+    trainer.save_genome(genome, os.path.join(root, 'run_a', 'best_genome.pkl'))
+    _tournament(root, tmp_path).run()
+    assert [os.path.basename(os.path.dirname(task[0])) for task in played] == ['run_a']
+
+
+def test_older_runs_fall_back_to_the_configs_dir(results, tmp_path):
+    _, _, root = results
+    os.remove(os.path.join(root, 'run_b', 'result.json'))
+    assert [row['name'] for row in _tournament(root, tmp_path).run()] == ['run_a']
+
+    configs = tmp_path / 'no_configs'
+    configs.mkdir()
+    with open(_recorded_config(root, 'run_a'), 'r') as f:
+        (configs / 'run_b.ini').write_text(f.read())
+    assert sorted(row['name'] for row in _tournament(root, tmp_path).run()) == ['run_a', 'run_b']
@@ -0,0 +1,85 @@
+import os
+
+import numpy as np
+import pytest
+
+from ExperimentObjects.Experiment import Experiment
+from NEATObjects.TraceStore import TraceReader, TraceRecorder
+
+
+def _trace(length, offset=0.0):
+    """(inputs, outputs, action, score) per step; values identify the step and episode."""
+    return [([offset + i, -1.0, 0.5], [float(i), 0.0], i % 4, i // 3) for i in range(length)]
+
+
+def _record(recorder, generation, genome, length, offset=0.0):
+    recorder.record_episode(generation, genome, _trace(length, offset), 'wall', length // 3, float(length))
+
+
+def test_recorded_episodes_read_back_exactly(tmp_path):
+    recorder = TraceRecorder(str(tmp_path), num_inputs=3, num_outputs=2)
+    _record(recorder, 0, 7, 5)
+    recorder.record_episode(0, 8, _trace(3, offset=100.0), 'timeout', 1, -2.5)
+    _record(recorder, 1, 9, 4)
+    recorder.close()
+
+    reader = TraceReader(str(tmp_path))
+    assert reader.generations().tolist() == [0, 1]
+    episode = reader.find_episodes(genome=8)[0]
+    assert (int(episode['score']), float(episode['fitness']), reader.death_cause(episode)) == (1, -2.5, 'timeout')
+
+    steps = reader.episode_steps(episode)
+    expected = _trace(3, offset=100.0)
+    assert steps['inputs'].tolist() == [inputs for inputs, _, _, _ in expected]
+    assert steps['outputs'].tolist() == [outputs for _, outputs, _, _ in expected]
+    assert steps['action'].tolist() == [0, 1, 2] and steps['step'].tolist() == [0, 1, 2]
+    assert set(reader.generation_steps(0)['genome'].tolist()) == {7, 8}
+    assert len(reader.generation_steps(0)) == 8
+    # A single run's generation is one stretch of the file: a view, not a copy
+    assert isinstance(reader.generation_steps(1), np.memmap)
+
+
+def test_reopened_store_keeps_runs_apart(tmp_path):
+    first = TraceRecorder(str(tmp_path), num_inputs=3, num_outputs=2)
+    _record(first, 0, 1, 4)
+    _record(first, 1, 2, 6)
+    first.close()
+    # A rerun or resume starts counting generations at 0 again
+    second = TraceRecorder(str(tmp_path), num_inputs=3, num_outputs=2)
+    _record(second, 0, 3, 2, offset=50.0)
+    second.close()
+
+    reader = TraceReader(str(tmp_path))
+    assert reader.runs().tolist() == [0, 1]
+    assert reader.generations(run=1).tolist() == [0]
+    assert reader.generation_steps(0, run=0)['genome'].tolist() == [1] * 4
+    assert reader.generation_steps(0, run=1)['genome'].tolist() == [3] * 2
+    # Across runs the episodes are not adjacent in the file, and nothing in between leaks in
+    assert reader.generation_steps(0)['genome'].tolist() == [1] * 4 + [3] * 2
+
+
+def test_reopening_with_another_layout_is_refused(tmp_path):
+    TraceRecorder(str(tmp_path), num_inputs=3, num_outputs=2).close()
+    with pytest.raises(ValueError, match='layout'):
+        TraceRecorder(str(tmp_path), num_inputs=4, num_outputs=2)
+
+
+def test_sample_rate_is_respected(tmp_path):
+    recorder = TraceRecorder(str(tmp_path), num_inputs=3, num_outputs=2, sample_rate=0.2, seed=1)
+    hits = sum(recorder.should_record() for _ in range(5000))
+    assert 900 < hits < 1100
+
+
+@pytest.mark.parametrize('sample_rate, expected', [('1.0', 40), ('0.0', 0)])
+def test_training_records_sampled_episodes(make_config, tmp_path, sample_rate, expected):
+    exp = Experiment(make_config(sections={'TRACES': {'sample_rate': sample_rate}}),
+                     output_dir=str(tmp_path), seed=3)
+    exp.trainer.learn(2)
+    exp.trainer.close()
+
+    reader = TraceReader(os.path.join(exp.exp_dir, 'traces'))
+    assert len(reader.episodes) == expected
+    if expected:
+        assert reader.generations().tolist() == [0, 1]
+        # Every step of every recorded episode is in the step file
+        assert int(reader.episodes['length'].sum()) == len(reader.steps) == exp.trainer.steps_evaluated
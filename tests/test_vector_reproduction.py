@@ -0,0 +1,183 @@
+import copy
+import random
+
+import neat
+import numpy as np
+import pytest
+
+from NEATObjects.VectorReproduction import VectorGenome, VectorizedReproduction
+
+ENGINES = {
+    'default': (neat.DefaultGenome, neat.DefaultReproduction),
+    'vector': (VectorGenome, VectorizedReproduction)
+}
+
+# Breeding only: no elites, every parent survives, one species
+GENOME = {
+    'num_inputs': '3',
+    'num_outputs': '2',
+    'num_hidden': '2',
+    'initial_connection': 'full_nodirect',
+    'activation_options': 'sigmoid tanh relu',
+    'aggregation_options': 'sum product max',
+    'node_add_prob': '0.0',
+    'node_delete_prob': '0.0',
+    'conn_add_prob': '0.0',
+    'conn_delete_prob': '0.0',
+}
+REPRODUCTION = {'elitism': '0', 'survival_threshold': '1.0'}
+SPECIES = {'compatibility_threshold': '1000.0'}
+NO_MUTATION = {
+    'weight_mutate_rate': '0.0', 'weight_replace_rate': '0.0',
+    'bias_mutate_rate': '0.0', 'bias_replace_rate': '0.0',
+    'enabled_mutate_rate': '0.0', 'activation_mutate_rate': '0.0', 'aggregation_mutate_rate': '0.0',
+}
+
+CHILDREN = 3000
+# Far from the init distribution N(0, 1): perturbed values stay near it, replaced ones don't
+START = 20.0
+
+
+def _breed(make_config, engine, genome_options, make_parents, seed=11):
+    """Breed CHILDREN offspring of `make_parents(config)` (genome, fitness) pairs with `engine`."""
+    path = make_config(f'breed_{engine}', sections={
+        'DefaultGenome': dict(GENOME, **genome_options),
+        'DefaultReproduction': REPRODUCTION,
+        'DefaultSpeciesSet': SPECIES
+    })
+    config = neat.Config(neat.DefaultGenome, neat.DefaultReproduction, neat.DefaultSpeciesSet,
+                         neat.DefaultStagnation, path)
+    # As NEATTrainer does: same sections, other classes
+    config.genome_type, config.reproduction_type = ENGINES[engine]
+    random.seed(seed)
+    pop = neat.Population(config)
+    parents = {}
+    for genome, fitness in make_parents(config):
+        genome.fitness = fitness
+        parents[genome.key] = genome
+    pop.reproduction.genome_indexer = iter(range(1000, 1000 + CHILDREN))
+    pop.species.speciate(config, parents, 0)
+    return list(pop.reproduction.reproduce(config, pop.species, CHILDREN, 0).values())
+
+
+def _parent(config, key, weight, bias, enabled=True, activation='sigmoid', aggregation='sum', response=1.0,
+            like=None):
+    """A genome whose genes all hold the given values; with the same structure (keys) as `like`."""
+    if like is None:
+        genome = config.genome_type(key)
+        genome.configure_new(config.genome_config)
+    else:
+        genome = copy.deepcopy(like)
+        genome.key = key
+    for cg in genome.connections.values():
+        cg.weight, cg.enabled = weight, enabled
+    for ng in genome.nodes.values():
+        ng.bias, ng.response, ng.activation, ng.aggregation = bias, response, activation, aggregation
+    return genome
+
+
+def _single_parent(config):
+    return [(_parent(config, 1, START, START), 1.0)]
+
+
+def _attribute_stats(children):
+    weights = np.array([cg.weight for g in children for cg in g.connections.values()])
+    biases = np.array([ng.bias for g in children for ng in g.nodes.values()])
+    stats = {}
+    for name, values in (('weight', weights), ('bias', biases)):
+        perturbed = (values != START) & (np.abs(values - START) < 5.0)
+        stats[f'{name}_mutated'] = perturbed.mean()
+        stats[f'{name}_replaced'] = (np.abs(values) < 8.0).mean()
+        deltas = values[perturbed] - START
+        stats[f'{name}_delta_mean'] = deltas.mean()
+        stats[f'{name}_delta_std'] = deltas.std()
+        stats[f'{name}_delta_quartiles'] = np.percentile(deltas, [25, 50, 75])
+    stats['enabled_flipped'] = np.mean([not cg.enabled for g in children for cg in g.connections.values()])
+    stats['activation_changed'] = np.mean([ng.activation != 'sigmoid' for g in children for ng in g.nodes.values()])
+    stats['aggregation_changed'] = np.mean([ng.aggregation != 'sum' for g in children for ng in g.nodes.values()])
+    return stats
+
+
+def test_attribute_mutation_matches_default_reproduction(make_config):
+    options = {'enabled_mutate_rate': '0.2', 'activation_mutate_rate': '0.3', 'aggregation_mutate_rate': '0.3'}
+    stats = {engine: _attribute_stats(_breed(make_config, engine, options, _single_parent)) for engine in ENGINES}
+
+    expected = {
+        # conftest: weights mutate 0.8 / replace 0.1, biases 0.7 / 0.1
+        'weight_mutated': 0.8, 'weight_replaced': 0.1, 'bias_mutated': 0.7, 'bias_replaced': 0.1,
+        # A flag is redrawn at the mutate rate; half of the redraws flip it
+        'enabled_flipped': 0.1,
+        # A redrawn option differs from the current one 2 times out of 3
+        'activation_changed': 0.2, 'aggregation_changed': 0.2,
+        # Perturbations are N(0, mutate_power=0.5)
+        'weight_delta_mean': 0.0, 'weight_delta_std': 0.5, 'bias_delta_mean': 0.0, 'bias_delta_std': 0.5,
+    }
+    for engine in ENGINES:
+        for name, value in expected.items():
+            assert stats[engine][name] == pytest.approx(value, abs=0.03), (engine, name)
+        for name in ('weight', 'bias'):
+            # Quartiles of N(0, 0.5): -0.337, 0, 0.337
+            assert np.allclose(stats[engine][f'{name}_delta_quartiles'], [-0.337, 0.0, 0.337], atol=0.04)
+    for name in expected:
+        assert stats['vector'][name] == pytest.approx(stats['default'][name], abs=0.03), name
+
+
+def test_crossover_takes_each_gene_from_either_parent_evenly(make_config):
+    def parents(config):
+        # Homologous genes throughout; the fitter parent and the other differ in every attribute
+        fitter = _parent(config, 1, 1.0, 1.0)
+        other = _parent(config, 2, -1.0, -1.0, enabled=False, activation='tanh', aggregation='product',
+                        response=2.0, like=fitter)
+        return [(fitter, 2.0), (other, 1.0)]
+
+    for engine in ENGINES:
+        children = _breed(make_config, engine, NO_MUTATION, parents)
+        from_other = {name: [] for name in ('weight', 'enabled', 'bias', 'response', 'activation', 'aggregation')}
+        mixed = 0
+        for child in children:
+            genes = {
+                'weight': [cg.weight == -1.0 for cg in child.connections.values()],
+                'enabled': [not cg.enabled for cg in child.connections.values()],
+                'bias': [ng.bias == -1.0 for ng in child.nodes.values()],
+                'response': [ng.response == 2.0 for ng in child.nodes.values()],
+                'activation': [ng.activation == 'tanh' for ng in child.nodes.values()],
+                'aggregation': [ng.aggregation == 'product' for ng in child.nodes.values()],
+            }
+            flat = [v for values in genes.values() for v in values]
+            # Children of one parent crossed with itself carry a single parent's values throughout
+            if all(flat) or not any(flat):
+                continue
+            mixed += 1
+            for name, values in genes.items():
+                from_other[name].extend(values)
+        # Both parents are picked at random for every child
+        assert mixed / len(children) == pytest.approx(0.5, abs=0.05), engine
+        for name, values in from_other.items():
+            assert np.mean(values) == pytest.approx(0.5, abs=0.03), (engine, name)
+
+
+@pytest.mark.parametrize('mutation', ['node_add_prob', 'node_delete_prob', 'conn_add_prob', 'conn_delete_prob'])
+def test_structural_mutation_frequencies_match(make_config, mutation):
+    options = dict(NO_MUTATION, **{mutation: '0.5'})
+    parent = {}
+    changes = {}
+    for engine in ENGINES:
+        def single(config):
+            genome = _parent(config, 1, START, START)
+            parent[engine] = (len(genome.nodes), len(genome.connections))
+            return [(genome, 1.0)]
+
+        children = _breed(make_config, engine, options, single)
+        nodes, connections = parent[engine]
+        changes[engine] = {
+            'nodes_added': np.mean([len(g.nodes) > nodes for g in children]),
+            'nodes_deleted': np.mean([len(g.nodes) < nodes for g in children]),
+            'connections_added': np.mean([len(g.connections) > connections for g in children]),
+            'connections_deleted': np.mean([len(g.connections) < connections for g in children]),
+        }
+    changed = {'node_add_prob': 'nodes_added', 'node_delete_prob': 'nodes_deleted',
+               'conn_add_prob': 'connections_added', 'conn_delete_prob': 'connections_deleted'}[mutation]
+    # Drawn for half the children; add-connection often picks an existing or cyclic link
+    assert 0.1 < changes['default'][changed] <= 0.55
+    for name, value in changes['default'].items():
+        assert changes['vector'][name] == pytest.approx(value, abs=0.04), name
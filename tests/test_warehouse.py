@@ -0,0 +1,138 @@
+import json
+import os
+import shutil
+
+import pytest
+
+from ExperimentObjects.Experiment import Experiment
+from ExperimentObjects.Warehouse import Warehouse
+
+
+def _write_run(root, name, score, evaluator='apple_priority', threshold='0.3', generations=3):
+    folder = os.path.join(root, name)
+    os.makedirs(folder, exist_ok=True)
+    config = os.path.join(folder, 'config.ini')
+    with open(config, 'w') as f:
+        f.write(f'[EVALUATOR]\nname = {evaluator}\n\n'
+                f'[DefaultReproduction]\nsurvival_threshold = {threshold}\n')
+    with open(os.path.join(folder, 'result.json'), 'w') as f:
+        json.dump({'config': config, 'score': score, 'seed': 1, 'generations': generations}, f)
+    with open(os.path.join(folder, 'statistics.json'), 'w') as f:
+        json.dump({'best_fitness': [float(g) for g in range(generations)],
+                   'mean_fitness': [g / 2 for g in range(generations)],
+                   'stdev_fitness': [0.1] * generations,
+                   'species_sizes': [[5, 5, 0]] * generations}, f)
+    return folder
+
+
+def _bump_mtime(path):
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+
+@pytest.fixture
+def warehouse(tmp_path):
+    wh = Warehouse(str(tmp_path / 'index.db'))
+    yield wh
+    wh.close()
+
+
+def _scores(warehouse):
+    return dict(warehouse.query('SELECT name, score FROM experiments'))
+
+
+def test_reindex_only_reads_changed_runs(warehouse, tmp_path):
+    root = str(tmp_path / 'results')
+    a = _write_run(root, 'a', 10)
+    _write_run(root, 'b', 20)
+    assert warehouse.index([root])['added'] == 2
+
+    counts = warehouse.index([root])
+    assert (counts['unchanged'], counts['added'], counts['updated']) == (2, 0, 0)
+
+    # Touched without changing content: caught by the hash
+    _bump_mtime(os.path.join(a, 'result.json'))
+    assert warehouse.index([root])['unchanged'] == 2
+
+    _write_run(root, 'a', 15, generations=5)
+    _write_run(root, 'c', 30)
+    counts = warehouse.index([root])
+    assert (counts['added'], counts['updated'], counts['unchanged']) == (1, 1, 1)
+    assert _scores(warehouse) == {'a': 15, 'b': 20, 'c': 30}
+    # The old generation rows were replaced, not appended to
+    assert warehouse.query("SELECT COUNT(*) FROM generations g JOIN experiments e "
+                           "ON g.experiment_id = e.id WHERE e.name = 'a'") == [(5,)]
+
+
+def test_corrupt_run_keeps_its_previous_rows(warehouse, tmp_path):
+    root = str(tmp_path / 'results')
+    a = _write_run(root, 'a', 10)
+    _write_run(root, 'b', 20)
+    warehouse.index([root])
+
+    with open(os.path.join(a, 'statistics.json'), 'w') as f:
+        f.write('{"best_fitness": [1.0, ')
+    with pytest.warns(UserWarning, match='Skipping'):
+        counts = warehouse.index([root])
+    assert counts['failed'] == 1 and counts['unchanged'] == 1
+    assert _scores(warehouse) == {'a': 10, 'b': 20}
+    assert warehouse.query('SELECT COUNT(*) FROM params') == [(4,)]
+
+
+def test_prune_removes_deleted_runs(warehouse, tmp_path):
+    root = str(tmp_path / 'results')
+    _write_run(root, 'a', 10)
+    b = _write_run(root, 'b', 20)
+    warehouse.index([root])
+
+    for name in os.listdir(b):
+        os.remove(os.path.join(b, name))
+    os.rmdir(b)
+    assert warehouse.index([root])['removed'] == 0
+    assert warehouse.index([root], prune=True)['removed'] == 1
+    assert _scores(warehouse) == {'a': 10}
+    # Cascades to the run's other rows
+    assert warehouse.query('SELECT COUNT(DISTINCT experiment_id) FROM params') == [(1,)]
+
+
+def test_compare_and_best_per(warehouse, tmp_path):
+    root = str(tmp_path / 'results')
+    runs = [('apple_priority', '0.2', 10), ('apple_priority', '0.2', 20), ('survival', '0.2', 12),
+            ('apple_priority', '0.3', 5), ('survival', '0.3', 9), ('survival', '0.3', 11)]
+    for i, (evaluator, threshold, score) in enumerate(runs):
+        _write_run(root, f'run{i}', score, evaluator, threshold)
+    warehouse.index([root])
+
+    rows = warehouse.compare(['EVALUATOR.name'])
+    assert [(r['EVALUATOR.name'], r['runs'], r['mean']) for r in rows] == [
+        ('apple_priority', 3, pytest.approx(35 / 3)), ('survival', 3, pytest.approx(32 / 3))]
+
+    rows = warehouse.compare(['EVALUATOR.name'], where={'DefaultReproduction.survival_threshold': 0.3})
+    assert [(r['EVALUATOR.name'], r['max']) for r in rows] == [('survival', 11), ('apple_priority', 5)]
+
+    best = warehouse.best_per('DefaultReproduction.survival_threshold', 'EVALUATOR.name')
+    assert [(r['DefaultReproduction.survival_threshold'], r['EVALUATOR.name']) for r in best] == [
+        ('0.2', 'apple_priority'), ('0.3', 'survival')]
+
+    with pytest.raises(ValueError):
+        warehouse.compare(['EVALUATOR.name'], metric='nonsense')
+
+
+def test_legacy_run_scores_like_the_modern_run(make_config, tmp_path):
+    config = make_config('same_game', sections={'ARTIFACTS': {'enabled': 'false'}})
+    exp = Experiment(config, output_dir=str(tmp_path / 'modern'), generations=1, seed=6)
+    score = exp.run()
+    # Old runs kept the recorded game but no result.json; their config sits in a configs folder
+    legacy = str(tmp_path / 'legacy' / 'same_game')
+    shutil.copytree(exp.exp_dir, legacy)
+    os.remove(os.path.join(legacy, 'result.json'))
+
+    wh = Warehouse(str(tmp_path / 'index.db'), config_dirs=[os.path.dirname(config)])
+    try:
+        assert wh.index([str(tmp_path / 'modern'), str(tmp_path / 'legacy')])['added'] == 2
+        rows = dict(wh.query('SELECT path, score FROM experiments'))
+    finally:
+        wh.close()
+    assert rows[os.path.abspath(legacy)] == rows[os.path.abspath(exp.exp_dir)] == score
+    # Scored with the run's evaluator, not just the apple count
+    assert score != exp.states[-1]['score']
@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from ExperimentObjects.Experiment import Experiment
+
+# File ids: inputs first, outputs 32..35, one hidden node 200
+ARCH = {
+    'num_inputs': 32,
+    'num_outputs': 4,
+    'hidden_layers': [],
+    'connections': [[0, 200, 1.5], [3, 200, -0.5], [200, 32, 2.0], [5, 33, -1.0], [7, 35, 0.25]],
+}
+
+
+def _experiment(make_config, tmp_path, arch, **architecture):
+    path = tmp_path / 'arch.json'
+    path.write_text(json.dumps(arch))
+    architecture.setdefault('warm_start_jitter', '0.1')
+    config = make_config(sections={'ARCHITECTURE': dict(initial_architecture=str(path), **architecture)})
+    return Experiment(config, output_dir=str(tmp_path / 'out'), seed=2)
+
+
+def _topology(genome):
+    hidden = sorted(k for k in genome.nodes if k >= 4)
+    names = {k: f'h{i}' for i, k in enumerate(hidden)}
+    return {(names.get(a, a), names.get(b, b)) for a, b in genome.connections}
+
+
+def test_population_starts_from_the_architecture(make_config, tmp_path):
+    exp = _experiment(make_config, tmp_path, ARCH)
+    genomes = list(exp.trainer.pop.population.values())
+
+    expected = {(-1, 'h0'), (-4, 'h0'), ('h0', 0), (-6, 1), (-8, 3)}
+    assert all(_topology(g) == expected for g in genomes)
+    # One exact copy, the rest jittered around it
+    weights = [sorted(c.weight for c in g.connections.values()) for g in genomes]
+    assert [-1.0, -0.5, 0.25, 1.5, 2.0] in weights
+    assert len({tuple(w) for w in weights}) > 1
+
+
+def test_architecture_for_another_sensor_layout_is_refused(make_config, tmp_path):
+    arch = dict(ARCH, num_inputs=100, output_ids=[32, 33, 34, 35])
+    with pytest.raises(ValueError, match='warm_start_input_map'):
+        _experiment(make_config, tmp_path, arch)
+
+
+def test_input_map_places_architecture_inputs(make_config, tmp_path):
+    arch = dict(ARCH, num_inputs=100, output_ids=[32, 33, 34, 35])
+    exp = _experiment(make_config, tmp_path, arch, warm_start_input_map='0:10, 3:11, 5:12')
+    genome = next(iter(exp.trainer.pop.population.values()))
+
+    # Input 7 has no target and is dropped with its connection
+    assert _topology(genome) == {(-11, 'h0'), (-12, 'h0'), ('h0', 0), (-13, 1)}
+
+
+def test_output_count_must_match(make_config, tmp_path):
+    arch = dict(ARCH, num_outputs=3, connections=[[0, 32, 1.0]])
+    with pytest.raises(ValueError, match='outputs'):
+        _experiment(make_config, tmp_path, arch)
+
+
+def test_saved_genome_from_another_layout_needs_a_map(make_config, tmp_path):
+    donor = Experiment(make_config(), output_dir=str(tmp_path / 'donor'), seed=1)
+    genome = next(iter(donor.trainer.pop.population.values()))
+    # Rewire one sensor to an input this 32-input game does not have
+    conn = genome.connections.pop((-1, 0))
+    conn.key = (-40, 0)
+    genome.connections[(-40, 0)] = conn
+    path = str(tmp_path / 'best_genome.pkl')
+    donor.trainer.save_genome(genome, path)
+
+    with pytest.raises(ValueError, match='warm_start_input_map'):
+        Experiment(make_config(sections={'ARCHITECTURE': {'warm_start_genome': path}}),
+                   output_dir=str(tmp_path / 'a'), seed=1)
+
+    # Input 39 takes over sensor 0; the genome's own input 0 is left out, with a warning
+    identity = ', '.join(f'{i}:{i}' for i in range(1, 32))
+    with pytest.warns(UserWarning, match=r'unmapped input positions \[0\]'):
+        exp = Experiment(make_config(sections={'ARCHITECTURE': {
+            'warm_start_genome': path, 'warm_start_input_map': f'39:0, {identity}'}}),
+            output_dir=str(tmp_path / 'b'), seed=1)
+    seeded = next(iter(exp.trainer.pop.population.values()))
+    expected = {(-1, 0) if key == (-40, 0) else key for key in genome.connections if key[0] != -1}
+    assert set(seeded.connections) == expected
@@ -0,0 +1,99 @@
+import os
+import threading
+import time
+
+from neat.reporting import BaseReporter
+
+from ExperimentObjects.Experiment import Experiment
+from NEATObjects import NEAT
+from NEATObjects.WorkerPool import EvaluationPool
+
+
+def square(x):
+    return x * x
+
+
+def die_on_three(x):
+    if x == 3:
+        os._exit(1)
+    return x
+
+
+def hang_on_two(x):
+    if x == 2:
+        time.sleep(60)
+    return x
+
+
+def _run(func, items, **kwargs):
+    events = []
+    pool = EvaluationPool(2, on_event=lambda kind, details: events.append((kind, details)), **kwargs)
+    try:
+        return pool.map(func, items), events
+    finally:
+        pool.close()
+        pool.join()
+
+
+def test_recycled_workers_deliver_every_result():
+    # One task per worker: each exits right after replying, racing the manager that reads it
+    results, events = _run(square, range(200), max_tasks_per_worker=1)
+
+    assert results == [x * x for x in range(200)]
+    kinds = [kind for kind, _ in events]
+    assert 'crash' not in kinds
+    assert kinds.count('recycle') == 200
+
+
+def test_crashed_task_is_retried_then_answered_by_fallback():
+    results, events = _run(die_on_three, range(6), max_retries=1,
+                           fallback=lambda args, reason: (args[0], reason))
+
+    assert results == [0, 1, 2, (3, 'crash'), 4, 5]
+    crashes = [details for kind, details in events if kind == 'crash']
+    assert len(crashes) == 2 and all(d['exitcode'] == 1 for d in crashes)
+
+
+def test_timed_out_task_is_answered_by_fallback():
+    start = time.time()
+    results, events = _run(hang_on_two, range(5), task_timeout=1.0,
+                           fallback=lambda args, reason: (args[0], reason))
+
+    assert results == [0, 1, (2, 'timeout'), 3, 4]
+    assert [kind for kind, _ in events] == ['timeout']
+    assert events[0][1]['task'] == 2
+    assert time.time() - start < 20
+
+
+class InfoThreads(BaseReporter):
+    def __init__(self):
+        self.messages = []
+
+    def info(self, msg):
+        self.messages.append((msg, threading.current_thread() is threading.main_thread()))
+
+
+def _hang_on_first_genome(task):
+    if task[0].key == 1:
+        time.sleep(60)
+    return NEAT._original_evaluate(task)
+
+
+def test_pool_events_are_reported_from_the_training_thread(make_config, tmp_path, monkeypatch):
+    monkeypatch.setattr(NEAT, '_original_evaluate', NEAT._evaluate_in_worker, raising=False)
+    monkeypatch.setattr(NEAT, '_evaluate_in_worker', _hang_on_first_genome)
+    exp = Experiment(make_config(sections={'TRAINING': {'num_workers': '2', 'task_timeout': '1',
+                                                        'timeout_fitness': '-7'}}),
+                     output_dir=str(tmp_path), seed=2)
+    reporter = InfoThreads()
+    exp.trainer.pop.add_reporter(reporter)
+    try:
+        exp.trainer.learn(1)
+    finally:
+        exp.trainer.close()
+
+    assert [e['kind'] for e in exp.trainer.worker_events] == ['timeout']
+    assert exp.trainer.worker_events[0]['task'] == 1
+    timeouts = [(msg, main) for msg, main in reporter.messages if 'timed out' in msg]
+    assert timeouts == [(timeouts[0][0], True)]
+    assert 'genome 1 timed out' in timeouts[0][0]
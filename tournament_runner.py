@@ -0,0 +1,49 @@
+import argparse
+import os
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+from ExperimentObjects.Tournament import Tournament
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Re-evaluate every best_genome.pkl under a results directory on a shared seed bank.'
+    )
+    parser.add_argument(
+        '--results-dir', '-r',
+        default=os.path.join(SCRIPT_DIR, 'experiment_results_parallel'),
+        help='Directory containing one folder per experiment.'
+    )
+    parser.add_argument(
+        '--configs-dir', '-c',
+        default=os.path.join(SCRIPT_DIR, 'Configs'),
+        help='Fallback .ini directory for runs whose result.json names no config (matched by folder name).'
+    )
+    parser.add_argument('--games', '-g', type=int, default=100, help='Number of seeded games per genome.')
+    parser.add_argument('--first-seed', type=int, default=0, help='First seed of the bank.')
+    parser.add_argument('--max-steps', type=int, default=1000, help='Step limit per game.')
+    parser.add_argument('--workers', '-w', type=int, default=None, help='Worker processes (default: all cores).')
+    parser.add_argument('--top', type=int, default=20, help='Rows of the leaderboard to print.')
+    args = parser.parse_args()
+
+    tournament = Tournament(
+        results_dir=args.results_dir,
+        configs_dir=args.configs_dir,
+        seeds=range(args.first_seed, args.first_seed + args.games),
+        max_steps=args.max_steps,
+        num_workers=args.workers
+    )
+    leaderboard = tournament.run()
+
+    print(f"{'#':>3}  {'experiment':<50} {'score':>10} {'sd':>9} {'p10':>9} {'p90':>9} {'steps':>8}")
+    for i, row in enumerate(leaderboard[:args.top], 1):
+        print(f"{i:>3}  {row['name']:<50} {row['score_mean']:>10.2f} {row['score_var'] ** 0.5:>9.2f} "
+              f"{row['score_p10']:>9.2f} {row['score_p90']:>9.2f} {row['steps_mean']:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
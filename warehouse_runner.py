@@ -0,0 +1,85 @@
+import argparse
+import os
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+from ExperimentObjects.Warehouse import METRICS, Warehouse
+
+DEFAULT_DB = os.path.join(SCRIPT_DIR, 'experiment_results_parallel', 'warehouse.sqlite')
+
+
+def parse_where(items):
+    where = {}
+    for item in items or []:
+        name, sep, value = item.partition('=')
+        if not sep:
+            raise SystemExit(f"--where expects SECTION.key=value, got {item!r}")
+        where[name.strip()] = value.strip()
+    return where
+
+
+def print_table(headers, rows):
+    cells = [[str(h) for h in headers]] + [
+        [f'{v:.4g}' if isinstance(v, float) else str(v) for v in row] for row in rows]
+    widths = [max(len(r[i]) for r in cells) for i in range(len(headers))]
+    for n, row in enumerate(cells):
+        print('  '.join(c.ljust(w) for c, w in zip(row, widths)))
+        if n == 0:
+            print('  '.join('-' * w for w in widths))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Index experiment results into SQLite and compare runs.')
+    parser.add_argument('--db', default=DEFAULT_DB, help='Warehouse database file.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    index = commands.add_parser('index', help='Add new and changed experiments to the warehouse.')
+    index.add_argument('roots', nargs='*', default=[os.path.join(SCRIPT_DIR, 'experiment_results_parallel')],
+                       help='Result directories, searched recursively.')
+    index.add_argument('--configs', nargs='*', default=[os.path.join(SCRIPT_DIR, 'Configs')],
+                       help="Where to find <experiment>.ini when result.json doesn't name a readable config.")
+    index.add_argument('--prune', action='store_true', help='Drop experiments whose folder no longer exists.')
+
+    compare = commands.add_parser('compare', help='Aggregate a metric grouped by config parameters.')
+    compare.add_argument('--by', nargs='+', default=[], metavar='SECTION.key',
+                         help='Parameters to group by, e.g. EVALUATOR.name DefaultReproduction.survival_threshold.')
+    compare.add_argument('--metric', default='score', choices=METRICS)
+    compare.add_argument('--where', nargs='*', metavar='SECTION.key=value', help='Only runs with these parameters.')
+    compare.add_argument('--best', action='store_true',
+                         help='With two --by parameters: only the best second parameter per value of the first.')
+
+    sql = commands.add_parser('sql', help='Run a raw SQL query against the warehouse.')
+    sql.add_argument('query')
+
+    args = parser.parse_args()
+    os.makedirs(os.path.dirname(os.path.abspath(args.db)), exist_ok=True)
+    warehouse = Warehouse(args.db, getattr(args, 'configs', ()))
+    start = time.perf_counter()
+    try:
+        if args.command == 'index':
+            counts = warehouse.index(args.roots, prune=args.prune)
+            print(', '.join(f'{k} {v}' for k, v in counts.items()), f'({time.perf_counter() - start:.2f}s)')
+        elif args.command == 'compare':
+            where = parse_where(args.where)
+            if args.best:
+                if len(args.by) != 2:
+                    raise SystemExit('--best needs exactly two --by parameters')
+                rows = warehouse.best_per(args.by[0], args.by[1], args.metric, where)
+            else:
+                rows = warehouse.compare(args.by, args.metric, where)
+            print_table(args.by + ['runs', f'mean {args.metric}', 'min', 'max'],
+                        [[r[name] for name in args.by] + [r['runs'], r['mean'], r['min'], r['max']] for r in rows])
+            print(f'{len(rows)} groups ({(time.perf_counter() - start) * 1000:.1f} ms)')
+        else:
+            cursor = warehouse.db.execute(args.query)
+            print_table([d[0] for d in cursor.description or []], cursor.fetchall())
+    finally:
+        warehouse.close()
+
+
+if __name__ == '__main__':
+    main()